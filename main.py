@@ -1,3 +1,6 @@
+import time
+_START = time.perf_counter() # Process start reference for the startup benchmark
+
 import sys
 import os
 
@@ -8,20 +11,48 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from PyQt6.QtWidgets import QApplication
 from src.ui.main_window import MainWindow
 
+
+def report_startup(window, app):
+    """
+    --startup-benchmark: prints time-to-first-window and time-to-first-route (ms since process
+    start) as one JSON line, then exits. Used by src/experiment/startup_benchmark.py.
+    """
+    import json
+    from PyQt6.QtCore import QTimer
+    timings = {}
+
+    def first_window():
+        timings['first_window_ms'] = (time.perf_counter() - _START) * 1000
+
+    def first_route():
+        from src.algorithms.Dijkstra import DijkstraSolver
+        nodes = list(window.G.nodes)
+        DijkstraSolver(window.G, nodes[0], nodes[-1], 0.0, (0.33, 0.33, 0.34)).run()
+        timings['first_route_ms'] = (time.perf_counter() - _START) * 1000
+        print("STARTUP " + json.dumps(timings), flush=True)
+        app.quit()
+
+    QTimer.singleShot(0, first_window) # Runs once the shown window has been painted
+    window.network_ready.connect(first_route)
+
+
 def main():
     app = QApplication(sys.argv)
-    
+
     # Optional: Set Stylesheet for dark mode/modern look
     app.setStyle("Fusion")
-    
+
     from src.ui.styles import DARK_THEME_QSS
     app.setStyleSheet(DARK_THEME_QSS)
-    
+
     print("Creating MainWindow...")
     window = MainWindow()
     print("Showing MainWindow...")
     window.show()
-    
+
+    if "--startup-benchmark" in sys.argv:
+        report_startup(window, app)
+
     sys.exit(app.exec())
 
 
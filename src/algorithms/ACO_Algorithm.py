@@ -1,7 +1,7 @@
-import pandas as pd
+import numpy as np
 import random
-import math
 import os
+import time
 
 
 from ..generation import generate_graf as gg
@@ -9,11 +9,13 @@ import os
 
 # Metrik hesaplamaları ve yol iyileştirme modüllerini ekliyoruz
 from ..core import Metrics as mt
+from ..core.compiled import CompiledTopology
 from . import path_utilities as pu
+from .YenKSP import KShortestPaths
 
 
 class AntColonyOptimizer:
-    def __init__(self, G, S, D, demand, weights, num_ants=20, max_iter=50, alpha=1.0, beta=2.0, evaporation=0.5):
+    def __init__(self, G, S, D, demand, weights, num_ants=20, max_iter=50, alpha=1.0, beta=2.0, evaporation=0.5, seed_k=0, time_limit=None, stop=None):
         """
         ACO Algoritması Başlatıcı (Constructor).
         Amaç: Verilen kısıtlar altında S'den D'ye en uygun maliyetli yolu bulmak.
@@ -26,139 +28,102 @@ class AntColonyOptimizer:
         - alpha: Feromonun (kokunun) seçim üzerindeki etkisi
         - beta: Heuristic'in (yol kalitesinin) seçim üzerindeki etkisi
         - evaporation: Buharlaşma katsayısı (Eski yolların unutulması için)
+        - seed_k: 0'dan büyükse en iyi k yol (Yen) başlangıçta feromonla işaretlenir
+        - time_limit: Saniye cinsinden süre sınırı; nesne oluşturulurken başlar (hazırlık da dahil),
+          dolunca o ana kadarki en iyi yol döner (None: sınırsız)
+        - stop: is_set() metodu olan olay (threading / multiprocessing Event); kurulunca bir sonraki karıncada durur
         """
+        self.deadline = time.monotonic() + time_limit if time_limit is not None else None
         self.G = G
+        # Sıcak döngüler nx sözlükleri yerine derlenmiş CSR dizileri üzerinde çalışır
+        self.topo = CompiledTopology.of(G)
         self.S = S
         self.D = D
         self.demand = demand 
         self.weights = weights
         self.num_ants = num_ants
         self.max_iter = max_iter
+        self.time_limit = time_limit
+        self.stop = stop
         self.alpha = alpha
         self.beta = beta
         self.evaporation = evaporation
         
         # --- FEROMON BAŞLATMA ---
-        self.pheromones = {}
         # Başlangıçta tüm yollara eşit miktarda (1.0) feromon atıyoruz.
         # Bu sayede ilk iterasyonda karıncalar tamamen rastgele dağılır.
-        for u, v in G.edges():
-            self.pheromones[(u, v)] = 1.0
-            self.pheromones[(v, u)] = 1.0  # Graf yönlü olmadığı için ters yönü de ekliyoruz
+        # Her yay (u->v ve v->u ayrı ayrı) için bir hücre tutulur.
+        self.pheromones = np.ones(self.topo.num_arcs)
+        if seed_k > 0:
+            self._seed_pheromones(seed_k)
             
         # Heuristic değerleri önceden hesapla
-        # Her karınca için tekrar hesaplamamak adına, baştan hesaplayıp hafızaya alıyoruz.
-        self.heuristic_cache = {}
-        self._precompute_heuristics()
+        # Her karınca için tekrar hesaplamamak adına, paylaşılan önbellekten alıyoruz.
+        self.heuristic_cache = self._precompute_heuristics()
 
-    def _precompute_heuristics(self):
+    def _seed_pheromones(self, k):
         """
-        Her bir kenar için heuristic (çekicilik) değerini önceden hesaplar.
-        Böylece döngü içinde tekrar tekrar log, bölme gibi ağır işlemler yapılmaz.
+        En iyi k yolun (Yen algoritması) yaylarına, iterasyon sonundaki
+        güncellemeyle aynı biçimde (Q / maliyet) başlangıç feromonu bırakır.
+        Karıncalar ilk turdan itibaren iyi yolların çevresinde aramaya başlar.
         """
-        for u, v in self.G.edges():
-            # Gidiş yönü için hesapla ve kaydet
-            h_val = self._calculate_single_heuristic(u, v)
-            self.heuristic_cache[(u, v)] = h_val
-            
-            # Dönüş yönü için hesapla ve kaydet
-            h_val_reverse = self._calculate_single_heuristic(v, u)
-            self.heuristic_cache[(v, u)] = h_val_reverse
+        Q = 10.0
+        for path, cost, _ in KShortestPaths(self.topo, self.S, self.D, self.demand, self.weights, k=k).run():
+            deposit = Q / max(cost, 0.0001)
+            arcs = self.topo.path_arcs(path)
+            np.add.at(self.pheromones, arcs, deposit)
+            reverse = self.topo.reverse_arc[arcs]
+            np.add.at(self.pheromones, reverse[reverse >= 0], deposit)
 
-    def _calculate_single_heuristic(self, u, v):
+    def _precompute_heuristics(self):
         """
-        Tek bir kenar (u -> v) için heuristic (çekicilik) değerini hesaplar.
-        Heuristic = 1 / (ağırlıklı toplam maliyet)
+        Her bir yay (u -> v) için heuristic (çekicilik) değerini döndürür.
+        Heuristic = 1 / (ağırlıklı adım maliyeti)
         Düşük maliyet → Yüksek heuristic → Daha çekici yol
-        """
-        edge_data = self.G.edges[u, v] #Kenar verileri (Bant genişliği, Gecikme, Güvenilirlik)
-        node_data = self.G.nodes[v]    # Hedef düğüm verisi
-        
-        # KISIT KONTROLÜ
-        # Eğer hattın kapasitesi, istenen talebi (demand) karşılamıyorsa;
-        # o yolun heuristic değerini 0 yapıyoruz. Karınca orayı "duvar" gibi görür.
-        if edge_data.get('bandwidth_mbps', 0) < self.demand:
-            return 0.0
-
-        # 1. Gecikme Metriği
-        # Toplam Gecikme = Hat Gecikmesi + Düğümdeki İşlem Süresi
-        delay_cost = edge_data.get('link_delay_ms', 10) + node_data.get('processing_delay_ms', 1)
-        
-        # 2. Güvenilirlik Metriği (-log transformation)
-        # Güvenilirlik olasılıksal (0.99 gibi) bir değerdir ve seri bağlı sistemlerde çarpılır.
-        # Ancak maliyet fonksiyonunda toplama yapabilmek için -log() dönüşümü uygulanır.
-        # Sonuç: Güvenilirlik arttıkça, cost değeri sıfıra yaklaşır (küçülür).
-        r_link = edge_data.get('link_reliability', 0.99)
-        r_node = node_data.get('node_reliability', 0.99)
 
-        # Log(0) hatasını önlemek için güvenli alt sınır
-        if r_link <= 0: r_link = 0.0001
-        if r_node <= 0: r_node = 0.0001
-        rel_cost = (-1 * math.log(r_link)) + (-1 * math.log(r_node))
-        
-        # 3. Bant Genişliği Metriği
-        # Yüksek bant genişliği tercih edilmelidir (Düşük maliyet).
-        # Bu yüzden Maliyet = 1000 / Bant Genişliği formülü kullanılır.
-        bw = edge_data.get('bandwidth_mbps', 100)
-        bw_cost = 1000 / bw if bw > 0 else 10000
+        Adım maliyeti = w_d*(hat gecikmesi + hedef düğüm işlem süresi)
+                      + w_r*(-log r_link - log r_node) + w_b*(1000 / bant genişliği)
+        Değerler topolojiye bağlı, (ağırlık, talep) anahtarlı önbellekten okunur;
+        aynı senaryonun tekrarlarında tablo yeniden hesaplanmaz.
 
-        # Ağırlıklı Toplam (Weighted Sum)
-        # Üç farklı birimi, kullanıcıdan alınan ağırlıklarla normalize ederek topluyoruz.
-        total_step_cost = (self.weights['delay'] * delay_cost) + \
-                          (self.weights['reliability'] * rel_cost) + \
-                          (self.weights['bandwidth'] * bw_cost)
-        
-        # Maliyet ile Heuristic ters orantılıdır 
-        return 1.0 / (total_step_cost + 0.0001) # (Payda 0 olmasın diye +0.0001 ekledik)
+        KISIT KONTROLÜ: Hattın kapasitesi talebi (demand) karşılamıyorsa heuristic 0'dır,
+        karınca orayı "duvar" gibi görür.
+        """
+        return self.topo.edge_costs(self.weights, self.demand).heuristic
 
     def _select_next_node(self, current_node, visited):
         """
         Bir karıncanın şu anki düğümden gideceği sonraki düğümü seçer.
         Rulet tekerleği (roulette wheel) seçim mekanizması kullanır.
+        current_node ve dönüş değeri yoğun düğüm indeksleridir;
+        visited ise düğüm sayısı uzunluğunda bir bool dizisidir.
         """
-        neighbors = list(self.G.neighbors(current_node))  # Mevcut düğümün komşuları
-        
-        candidates = []  # Seçilebilecek komşu düğümler
-        probabilities = [] # Her komşunun seçilme olasılığı
-        total_prob = 0.0 # Toplam olasılık (normalizasyon için)
-        
-        for n in neighbors:
-            # Döngüsel hareketleri engellemek için ziyaret edilenleri atla
-            if n in visited: 
-                continue
-            
-            # Önceden hesaplanmış değerden oku
-            eta = self.heuristic_cache.get((current_node, n), 0)
-            
-            if eta == 0: continue # Eğer heuristic 0 ise (kapasite yetersizse) bu adayı ele
-            
-            # Feromon değerini al (başlangıçta 1.0)
-            tau = self.pheromones.get((current_node, n), 1.0)
-            
-            # ACO FORMÜLÜ: (Feromon^alpha) * (Heuristic^beta)
-            prob = (tau ** self.alpha) * (eta ** self.beta)
-            
-            candidates.append(n)
-            probabilities.append(prob)
-            total_prob += prob
-            
-        if not candidates:  # Hiç uygun komşu yok
+        arcs = self.topo.arc_slice(current_node)
+        neighbors = self.topo.indices[arcs]  # Mevcut düğümün komşuları
+        eta = self.heuristic_cache[arcs]
+
+        # Döngüsel hareketleri engellemek için ziyaret edilenleri ve
+        # heuristic'i 0 olan (kapasitesi yetersiz) adayları ele
+        mask = (eta > 0) & ~visited[neighbors]
+        if not mask.any():  # Hiç uygun komşu yok
             return None
 
+        candidates = neighbors[mask]
+
+        # ACO FORMÜLÜ: (Feromon^alpha) * (Heuristic^beta)
+        probabilities = (self.pheromones[arcs][mask] ** self.alpha) * (eta[mask] ** self.beta)
+        cumulative = np.cumsum(probabilities)
+        total_prob = cumulative[-1]
+
         if total_prob == 0: # Eğer olasılıklar hesaplanamadıysa rastgele seç
-            return random.choice(candidates)
+            return int(random.choice(candidates))
             
         # RULET TEKERLEĞİ SEÇİMİ
         # 0 ile Toplam Olasılık arasında rastgele bir nokta seçilir.
+        # Kümülatif toplamın eşik değerini geçtiği ilk düğüm seçilir.
         threshold = random.random() * total_prob
-        current_sum = 0.0
-        for i, p in enumerate(probabilities):
-            current_sum += p
-            # Kümülatif toplam eşik değerini geçtiği an o düğüm seçilir.
-            if current_sum >= threshold:
-                return candidates[i]
-        
-        return candidates[-1]
+        i = int(np.searchsorted(cumulative, threshold))
+        return int(candidates[min(i, len(candidates) - 1)])
 
     def run(self):
         """
@@ -176,41 +141,51 @@ class AntColonyOptimizer:
         # Yakınsama Kontrolü
         # Eğer belirli bir süre boyunca yeni bir rekor gelmezse, algoritmayı erken bitiririz.
         no_improve_count = 0
+
+        topo = self.topo
+        source = topo.index_of(self.S)
+        target = topo.index_of(self.D)
         
+        # Süre sınırı / durdurma her karıncadan önce kontrol edilir; dolunca o ana kadarki en iyi yol döner
+        deadline = self.deadline
+        expired = False
+
         # Ana döngü: max_iter kadar iterasyon
         for iteration in range(self.max_iter):
             all_paths = []  # Bu iterasyondaki tüm başarılı yollar
             
             # Karıncaları çalıştır: Her biri bir yol arar
             for ant in range(self.num_ants):
-                path = [self.S] # Yol kaynağıyla başlar
-                visited = set([self.S]) # Ziyaret edilen düğümler kümesi
-                current = self.S # Karıncanın şu anki konumu
+                if (deadline is not None and time.monotonic() >= deadline) or \
+                        (self.stop is not None and self.stop.is_set()):
+                    expired = True
+                    break
+
+                path = [source] # Yol kaynağıyla başlar
+                visited = np.zeros(topo.num_nodes, dtype=bool) # Ziyaret edilen düğümler
+                visited[source] = True
+                current = source # Karıncanın şu anki konumu
                 
                 # Karınca adım adım ilerliyor (Maksimum 100 adım sınırı koyduk, sonsuz döngü olmasın)
                 steps = 0
-                while current != self.D and steps < 100:
+                while current != target and steps < 100:
                     nxt = self._select_next_node(current, visited)
                     if nxt is None: break # Gidecek yer yoksa dur
                     path.append(nxt)
-                    visited.add(nxt)
+                    visited[nxt] = True
                     current = nxt
                     steps += 1
                 
                 # Karınca Hedefe Ulaştı mı?
-                if current == self.D:
+                if current == target:
                     # Bulunan yolu sadeleştir (Gereksiz döngüleri temizle) - path_utilities modülü
-                    clean_path = pu.yolu_Sadelestir(path)
-                    
-                    # Yolun gerçek metriklerini hesapla
-                    d_cost = mt.Total_Delay(self.G, clean_path)
-                    r_cost = mt.Total_Reliability(self.G, clean_path)
-                    b_cost = mt.Total_Bandwidth(self.G, clean_path)
+                    clean_path = topo.to_ids(pu.yolu_Sadelestir(path))
                     
+                    # Yolun gerçek metriklerini tek geçişte hesapla
                     # Toplam maliyet: Ağırlıklı toplam formülü
-                    total_cost = (self.weights['delay'] * d_cost) + \
-                                 (self.weights['reliability'] * r_cost) + \
-                                 (self.weights['bandwidth'] * b_cost)
+                    pm = mt.evaluate_path(topo, clean_path, self.weights)
+                    d_cost, r_cost, b_cost = pm.delay, pm.reliability, pm.bandwidth
+                    total_cost = pm.total
                     
                     all_paths.append((clean_path, total_cost))
                     
@@ -221,6 +196,7 @@ class AntColonyOptimizer:
                         best_metrics = {'delay': d_cost, 'rel_cost': r_cost, 'bw_cost': b_cost}
                         no_improve_count = 0 # İyileşme oldu, sayacı sıfırla
             
+            if expired: break # Yarım kalan iterasyonun feromonu bırakılmaz
             if not all_paths: continue # Eğer bu turda hiçbir karınca yol bulamadıysa sonraki tura geç
 
             # Erken Durdurma: 10 iterasyon boyunca gelişme yoksa dur.
@@ -232,8 +208,7 @@ class AntColonyOptimizer:
             # 1. Buharlaşma: 
             # Tüm yollardaki koku belirli oranda azaltılır. 
             # Bu işlem, eski ve kötü yolların unutulmasını sağlar.
-            for key in self.pheromones:
-                self.pheromones[key] *= (1.0 - self.evaporation)
+            self.pheromones *= (1.0 - self.evaporation)
             
             # 2. Yeni Feromon Bırakma:
             # Sadece bu iterasyonun EN İYİ 3 çözümüne feromon eklenir.
@@ -247,10 +222,11 @@ class AntColonyOptimizer:
                 if cost <= 0: cost = 0.0001
                 deposit = Q / cost # Maliyet ne kadar azsa bırakılan koku o kadar çok olur
 
-                for i in range(len(path) - 1):
-                    u, v = path[i], path[i+1]
-                    self.pheromones[(u, v)] += deposit
-                    self.pheromones[(v, u)] += deposit
+                # Graf yönlü olmadığı için ters yöndeki yaya da aynı miktar eklenir (ters yayı olmayanlar hariç)
+                arcs = topo.path_arcs(path)
+                np.add.at(self.pheromones, arcs, deposit)
+                reverse = topo.reverse_arc[arcs]
+                np.add.at(self.pheromones, reverse[reverse >= 0], deposit)
 
         return best_global_path, best_global_cost, best_metrics
 
@@ -266,15 +242,9 @@ if __name__ == "__main__":
         print(f"HATA: Graf olusturulamadi: {e}")
         exit()
 
-    # Talep Dosyasını (DemandData) Oku
-    DEMAND_FILE = "DemandData.xlsx"
-    if not os.path.exists(DEMAND_FILE) and os.path.exists("data/DemandData.xlsx"):
-        DEMAND_FILE = "data/DemandData.xlsx"
-        
-    try:
-        df_demands = pd.read_excel(DEMAND_FILE)
-    except:
-        df_demands = pd.DataFrame()
+    # Talep Dosyasını (DemandData) satır satır oku; dosya belleğe toplu alınmaz
+    from ..experiment.demand_stream import iter_demands
+    DEMAND_FILE = os.path.join(gg.DATA_DIR, "DemandData.xlsx")
 
     # SENARYO AGIRLIKLARI [0.4, 0.4, 0.2]
     weights = {'delay': 0.4, 'reliability': 0.4, 'bandwidth': 0.2}
@@ -294,11 +264,9 @@ if __name__ == "__main__":
     min_cost_info = "" # En dusuk maliyetli senaryonun bilgisi
 
     # Excel'deki her bir satır için algoritmayı çalıştır
-    for index, row in df_demands.iterrows():
+    for index, (_, S, D, B) in enumerate(iter_demands(DEMAND_FILE)):
         total_scenarios += 1
-        S = int(row['src']) # Kaynak düğüm
-        D = int(row['dst']) # Hedef düğüm
-        B = float(row['demand_mbps']) # Minimum bant genişliği talebi
+        # S: Kaynak düğüm, D: Hedef düğüm, B: Minimum bant genişliği talebi
         
         # ACO Çalıştır
         aco = AntColonyOptimizer(G, S, D, B, weights, num_ants=20, max_iter=50)
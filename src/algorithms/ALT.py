@@ -0,0 +1,345 @@
+import heapq
+import os
+import random
+import time
+
+import numpy as np
+
+from ..generation import generate_graf as gg
+from ..core import Metrics as mt
+from ..core.compiled import CompiledTopology
+from ..core.edge_costs import weights_key
+from ..core.route_cache import bucket_demand
+from .Dijkstra import shortest_path_tree, INF
+
+
+class LandmarkIndex:
+    """
+    ALT (A*, Landmarks, Triangle inequality) ön işlemesi.
+
+    K adet yer imi (landmark) L seçilir ve her düğüm v için ağırlıklı QoS maliyetiyle
+    d(L, v) (dist_from) ve d(v, L) (dist_to) saklanır. Üçgen eşitsizliğinden
+    d(v, t) >= max_L max(d(L, t) - d(L, v), d(v, L) - d(t, L)) alt sınırı elde edilir.
+
+    Uzaklıklar (ağırlık, talep) çiftine bağlıdır; ağırlık değişince dizin geçersizdir
+    (matches ile kontrol edilir, of() gerekirse yeniden kurar). Dizin topolojinin
+    içerik özetiyle (fingerprint) birlikte diske yazılır; başka bir topolojiyle yüklenmez.
+    """
+
+    def __init__(self, landmarks, dist_from, dist_to, weights, demand, fingerprint):
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)  # Düğüm indeksleri
+        self.dist_from = np.asarray(dist_from, dtype=np.float64)  # (K, n): d(L, v)
+        self.dist_to = np.asarray(dist_to, dtype=np.float64)  # (K, n): d(v, L)
+        self.weights = weights_key(weights)
+        self.demand = float(demand)
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(cls, G, weights, demand=0.0, k=8, seed=0):
+        """
+        Yer imlerini "en uzak nokta" yöntemiyle seçer: her yeni yer imi, seçilmişlere
+        olan en kısa uzaklığı en büyük olan düğümdür (grafın kenarlarına yayılırlar).
+        """
+        topo = CompiledTopology.of(G)
+        table = topo.edge_costs(weights, demand)
+        cost = table.step_cost_list
+        rcost = table.reverse_step_cost_list
+        k = min(k, topo.num_nodes)
+
+        # İlk yer imi: rastgele bir düğüme en uzak düğüm
+        start = random.Random(seed).randrange(topo.num_nodes)
+        d0 = np.array(shortest_path_tree(topo, start, cost)[0])
+        closest = np.where(np.isinf(d0), -1.0, d0)
+
+        landmarks, dist_from, dist_to = [], [], []
+        for _ in range(k):
+            L = int(np.argmax(closest))
+            landmarks.append(L)
+            d_from = np.array(shortest_path_tree(topo, L, cost)[0])
+            d_to = np.array(shortest_path_tree(topo, L, rcost)[0])
+            dist_from.append(d_from)
+            dist_to.append(d_to)
+            closest = np.minimum(closest, np.where(np.isinf(d_from), -1.0, d_from))
+            closest[landmarks] = -1.0
+
+        return cls(landmarks, dist_from, dist_to, table.weights, demand, topo.fingerprint)
+
+    @classmethod
+    def of(cls, G, weights, demand=0.0, k=8, path=None):
+        """
+        Topoloji üzerinde saklanan dizini döndürür; bu ağırlık/talep için yoksa kurar
+        (son INDEX_CACHE_SIZE çiftin dizinleri tutulur). path verilirse önce diskteki dizin
+        denenir, yeniden kurulan dizin oraya yazılır. Aynı yayları eleyen talepler
+        (CompiledTopology.demand_class) tek dizini paylaşır.
+        """
+        topo = CompiledTopology.of(G)
+        demand = topo.demand_class(demand)
+        key = (weights_key(weights), demand)
+        index = topo.landmark_indexes.get(key)
+        if index is not None and index.matches(weights, demand, topo.fingerprint) and len(index) >= k:
+            return index
+
+        index = cls.load(path, topo) if path and os.path.exists(path) else None
+        if index is None or not index.matches(weights, demand) or len(index) < k:
+            index = cls.build(topo, weights, demand, k)
+            if path:
+                index.save(path)
+        topo.landmark_indexes.put(key, index)
+        return index
+
+    def __len__(self):
+        return len(self.landmarks)
+
+    def matches(self, weights, demand, fingerprint=None) -> bool:
+        same = self.weights == weights_key(weights) and self.demand == float(demand)
+        return same and (fingerprint is None or self.fingerprint == fingerprint)
+
+    def _bounds(self, a, b):
+        # Bilinmeyen (inf - inf) farklar sınır vermez; sonsuz sınır ulaşılamazlık demektir
+        with np.errstate(invalid="ignore"):
+            bound = np.concatenate((a, b)).max(axis=0)
+        bound[np.isnan(bound)] = 0.0
+        return np.maximum(bound, 0.0)
+
+    def lower_bounds_to(self, target) -> np.ndarray:
+        """Her düğüm v için d(v, target) alt sınırı (indeksler üzerinden)."""
+        with np.errstate(invalid="ignore"):
+            return self._bounds(self.dist_from[:, [target]] - self.dist_from,
+                                self.dist_to - self.dist_to[:, [target]])
+
+    def lower_bounds_from(self, source) -> np.ndarray:
+        """Her düğüm v için d(source, v) alt sınırı."""
+        with np.errstate(invalid="ignore"):
+            return self._bounds(self.dist_from - self.dist_from[:, [source]],
+                                self.dist_to[:, [source]] - self.dist_to)
+
+    def save(self, path):
+        np.savez(path, landmarks=self.landmarks, dist_from=self.dist_from, dist_to=self.dist_to,
+                 weights=np.array(self.weights), demand=self.demand, fingerprint=self.fingerprint)
+
+    @classmethod
+    def load(cls, path, G=None):
+        """Diskten yükler; G verilir ve topoloji özeti tutmazsa None döner."""
+        with np.load(path) as data:
+            index = cls(data['landmarks'], data['dist_from'], data['dist_to'],
+                        tuple(data['weights'].tolist()), float(data['demand']), str(data['fingerprint']))
+        if G is not None and index.fingerprint != CompiledTopology.of(G).fingerprint:
+            return None
+        return index
+
+
+def astar(topo, source, target, cost, h):
+    """
+    Yoğun indeksler üzerinde A*. h: hedefe uzaklık alt sınırları (liste).
+    Döndürdüğü değerler: (dist, pred, yerleşen düğüm sayısı); h sıfırsa düz Dijkstra'dır.
+    Alt sınırı sonsuz olan düğümlerden hedefe yol yoktur; kuyruğa hiç alınmazlar.
+    """
+    indptr, indices, _ = topo.csr_lists
+    n = topo.num_nodes
+    dist = [INF] * n
+    pred = [-1] * n
+    dist[source] = 0.0
+    heap = [(h[source], source)] if h[source] != INF else []
+    settled = 0
+
+    while heap:
+        f, u = heapq.heappop(heap)
+        d = dist[u]
+        if f > d + h[u]:
+            continue  # Eski kayıt
+        settled += 1
+        if u == target:
+            break
+        for a in range(indptr[u], indptr[u + 1]):
+            nd = d + cost[a]
+            v = indices[a]
+            if nd < dist[v] and h[v] != INF:
+                dist[v] = nd
+                pred[v] = a
+                heapq.heappush(heap, (nd + h[v], v))
+
+    return dist, pred, settled
+
+
+def bidirectional_astar(topo, source, target, cost, rcost, potential):
+    """
+    Ortalama potansiyelli çift yönlü A*: ileri arama p(v), geri arama -p(v) potansiyeli
+    kullanır (p = (h_hedef - h_kaynak) / 2). İki yönün indirgenmiş maliyetleri aynı olduğu
+    için en küçük anahtarların toplamı bulunan en iyi yolu geçince arama durur.
+
+    Döndürdüğü değerler: (en kısa uzaklık, indeks yolu veya None, yerleşen düğüm sayısı)
+    """
+    indptr, indices, arc_source = topo.csr_lists
+    n = topo.num_nodes
+    p = potential
+    df, dr = [INF] * n, [INF] * n
+    pred_f, next_r = [-1] * n, [-1] * n  # İleri: son yay, geri: hedefe doğru sonraki düğüm
+    df[source] = 0.0
+    dr[target] = 0.0
+    heap_f = [(p[source], source)]
+    heap_r = [(-p[target], target)]
+    best, meet = INF, -1
+    if source == target:
+        best, meet = 0.0, source
+    settled = 0
+
+    while heap_f and heap_r:
+        if heap_f[0][0] + heap_r[0][0] >= best:
+            break
+        if heap_f[0][0] <= heap_r[0][0]:
+            k, u = heapq.heappop(heap_f)
+            d = df[u]
+            if k > d + p[u]:
+                continue
+            settled += 1
+            for a in range(indptr[u], indptr[u + 1]):
+                v = indices[a]
+                nd = d + cost[a]
+                if nd < df[v]:
+                    df[v] = nd
+                    pred_f[v] = a
+                    heapq.heappush(heap_f, (nd + p[v], v))
+                    if nd + dr[v] < best:
+                        best, meet = nd + dr[v], v
+        else:
+            k, u = heapq.heappop(heap_r)
+            d = dr[u]
+            if k > d - p[u]:
+                continue
+            settled += 1
+            for a in range(indptr[u], indptr[u + 1]):
+                v = indices[a]
+                nd = d + rcost[a]  # Gerçek v->u yayı
+                if nd < dr[v]:
+                    dr[v] = nd
+                    next_r[v] = u
+                    heapq.heappush(heap_r, (nd - p[v], v))
+                    if nd + df[v] < best:
+                        best, meet = nd + df[v], v
+
+    if meet == -1:
+        return INF, None, settled
+
+    path = [meet]
+    a = pred_f[meet]
+    while a != -1:
+        u = arc_source[a]
+        path.append(u)
+        a = pred_f[u]
+    path.reverse()
+    u = meet
+    while u != target:
+        u = next_r[u]
+        path.append(u)
+    return best, path, settled
+
+
+class ALTSolver:
+    def __init__(self, G, S, D, demand, weights, num_landmarks=8, bidirectional=False, landmark_path=None,
+                 demand_step=0.0):
+        """
+        Yer imi (landmark) alt sınırlarıyla hızlandırılmış tek sorgu S->D çözücüsü.
+        DijkstraSolver ile aynı optimumu bulur, ama çok daha az düğüm yerleştirir.
+
+        Parametreler ACO/Dijkstra ile aynıdır, ek olarak:
+        - num_landmarks: Yer imi sayısı (K)
+        - bidirectional: True ise çift yönlü A*
+        - landmark_path: Yer imi tablolarının saklanacağı/okunacağı .npz dosyası
+        - demand_step: > 0 ise talep bu adımın katlarına yukarı yuvarlanır (bkz. CHSolver)
+        """
+        self.G = G
+        self.topo = CompiledTopology.of(G)
+        self.S = S
+        self.D = D
+        self.demand = bucket_demand(demand, demand_step)
+        self.weights = weights
+        self.num_landmarks = num_landmarks
+        self.bidirectional = bidirectional
+        self.landmark_path = landmark_path
+        self.settled = 0  # run() sonrası: yerleşen düğüm sayısı
+
+    def run(self):
+        """Dönüş biçimi DijkstraSolver.run ile aynıdır; metriklere 'settled' eklenir."""
+        topo = self.topo
+        source = topo.index_of(self.S)
+        target = topo.index_of(self.D)
+        index = LandmarkIndex.of(topo, self.weights, self.demand, self.num_landmarks, self.landmark_path)
+        table = topo.edge_costs(self.weights, self.demand)
+
+        h_t = index.lower_bounds_to(target)
+        if self.bidirectional:
+            # Alt sınırı sonsuz olan düğümlerden hedefe/kaynaktan yol yok; potansiyelde 0 alınır
+            h_s = index.lower_bounds_from(source)
+            with np.errstate(invalid="ignore"):
+                potential = (h_t - h_s) / 2.0
+            potential[~np.isfinite(potential)] = 0.0
+            dist, idx_path, self.settled = bidirectional_astar(
+                topo, source, target, table.step_cost_list, table.reverse_step_cost_list, potential.tolist())
+        else:
+            d, pred, self.settled = astar(topo, source, target, table.step_cost_list, h_t.tolist())
+            dist = d[target]
+            idx_path = None
+            if dist != INF:
+                idx_path = [target]
+                _, _, arc_source = topo.csr_lists
+                a = pred[target]
+                while a != -1:
+                    idx_path.append(arc_source[a])
+                    a = pred[arc_source[a]]
+                idx_path.reverse()
+
+        if idx_path is None:
+            return None, INF, {'delay': 0, 'rel_cost': 0, 'bw_cost': 0, 'settled': self.settled}
+
+        path = topo.to_ids(idx_path)
+        pm = mt.evaluate_path(topo, path, self.weights)
+        return path, pm.total, {'delay': pm.delay, 'rel_cost': pm.reliability, 'bw_cost': pm.bandwidth,
+                                'settled': self.settled}
+
+
+#  ANA CALISTIRMA BLOGU
+if __name__ == "__main__":
+    from ..generation.synthetic_graf import sentetik_graf_uret
+    from .Dijkstra import DijkstraSolver
+
+    print("\n--- ALT (YER IMLI A*) KARSILASTIRMASI ---\n")
+
+    weights = {'delay': 0.33, 'reliability': 0.33, 'bandwidth': 0.34}
+
+    # Sentetik büyük topoloji (10.000 düğüm, rastgele geometrik graf)
+    rng = random.Random(7)
+    big = sentetik_graf_uret('geometric', 10_000, seed=7)
+
+    for name, G in (("Proje grafi (250)", gg.graf_uret()), ("Sentetik (10k)", big)):
+        topo = CompiledTopology.of(G)
+        start = time.perf_counter()
+        LandmarkIndex.of(topo, weights, 0.0, k=8)
+        prep = (time.perf_counter() - start) * 1000
+        print(f"{name}: {topo.num_nodes} dugum, on isleme (K=8) {prep:.0f} ms")
+
+        nodes = topo.nodes()
+        pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(30)]
+        zero = [0.0] * topo.num_nodes
+        cost = topo.edge_costs(weights, 0.0).step_cost_list
+
+        rows = []
+        start = time.perf_counter()
+        settled = [astar(topo, topo.index_of(S), topo.index_of(D), cost, zero)[2] for S, D in pairs]
+        rows.append(("Dijkstra", np.mean(settled), (time.perf_counter() - start) / len(pairs) * 1000, 0.0))
+
+        ref = {pair: DijkstraSolver(topo, *pair, 0.0, weights).run()[1] for pair in pairs}
+        for label, bidir in (("ALT A*", False), ("ALT cift yonlu", True)):
+            settled, worst = [], 0.0
+            start = time.perf_counter()
+            for S, D in pairs:
+                solver = ALTSolver(topo, S, D, 0.0, weights, bidirectional=bidir)
+                _, c, _ = solver.run()
+                settled.append(solver.settled)
+                worst = max(worst, abs(c - ref[(S, D)]))
+            rows.append((label, np.mean(settled), (time.perf_counter() - start) / len(pairs) * 1000, worst))
+
+        base = rows[0][1]
+        print(f"  {'Yontem':<16} {'Yerlesen(ort)':<15} {'Hizlanma':<10} {'Sure(ms)':<10} {'Maks fark':<10}")
+        for label, s, ms, worst in rows:
+            print(f"  {label:<16} {s:<15.0f} {base / s:<10.1f} {ms:<10.2f} {worst:<10.2g}")
+        print()
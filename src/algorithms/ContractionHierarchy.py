@@ -0,0 +1,359 @@
+import heapq
+import random
+import sys
+import time
+
+
+from ..core import Metrics as mt
+from ..core.compiled import CompiledTopology
+from ..core.edge_costs import weights_key
+from ..core.route_cache import bucket_demand
+from .Dijkstra import shortest_path_tree, path_from_tree, INF
+
+# Tanık (witness) aramasında en fazla taranacak yay; aşılırsa kısayol eklenir (doğruluk bozulmaz).
+# Düğüm yerine yay sayıldığı için yoğun graflarda da arama maliyeti sınırlı kalır.
+WITNESS_SCAN_LIMIT = 500
+# Öncelik tahmini için daha kısa arama (sadece sıralamayı etkiler)
+PRIORITY_SCAN_LIMIT = 100
+# Sıradaki düğümün (giriş x çıkış) komşu çifti bunu aşarsa kalan graf "çekirdek" olarak bırakılır
+CORE_PAIR_LIMIT = 2500
+
+
+class ContractionHierarchy:
+    """
+    Sabit bir (ağırlık, talep) çifti için kontraksiyon hiyerarşisi (CH) dizini.
+
+    Ön işleme: düğümler önem sırasına göre (kenar farkı, kontrakte edilmiş komşu sayısı ve
+    derinlik; her kontraksiyondan sonra komşular güncellenir) tek tek "kontrakte" edilir.
+    u->v->w üzerinden geçen en kısa yol başka bir tanık yolla korunamıyorsa u->w kısayolu
+    (ortası v) eklenir.
+
+    Kalan graf yoğunlaşıp kontraksiyon pahalı hale gelince (CORE_PAIR_LIMIT) durulur ve kalan
+    düğümler kontrakte edilmeyen bir çekirdek olarak bırakılır (core-CH); çekirdek içinde sorgu
+    sıradan iki yönlü Dijkstra'dır. Küçük ve yoğun graflarda çekirdek bütün graf olabilir.
+
+    Sorgu: kaynaktan ileri, hedeften geri yalnızca "yukarı" (sırası yüksek düğümlere giden)
+    yaylar üzerinde iki yönlü Dijkstra. Arama alanı graf boyutuna göre çok küçük olduğu için
+    sorgu süresi düğüm sayısıyla yavaş büyür. Bulunan yoldaki kısayollar orta düğümleriyle
+    özyinelemeli olarak açılır ve orijinal düğüm kimliklerine çevrilir.
+
+    Adım maliyetleri hedef düğümün maliyetini içerdiği için yaylar yönlüdür (u->v ve v->u ayrı).
+    """
+
+    def __init__(self, topo, weights, demand=0.0):
+        self.topo = topo
+        self.weights = weights_key(weights)
+        self.demand = float(demand)
+        self.num_shortcuts = 0
+        self.core_size = 0
+        self.build_seconds = 0.0
+        self._build()
+
+    @classmethod
+    def of(cls, G, weights, demand=0.0):
+        """
+        Topoloji üzerinde saklanan dizini döndürür; bu ağırlık/talep için yoksa kurar.
+        Son INDEX_CACHE_SIZE (ağırlık, talep sınıfı) çiftinin dizinleri topolojide tutulur;
+        aynı yayları eleyen talepler (CompiledTopology.demand_class) tek dizini paylaşır.
+        """
+        topo = CompiledTopology.of(G)
+        demand = topo.demand_class(demand)
+        key = (weights_key(weights), demand)
+        index = topo.hierarchies.get(key)
+        if index is None:
+            index = cls(topo, weights, demand)
+            topo.hierarchies.put(key, index)
+        return index
+
+    def matches(self, weights, demand) -> bool:
+        return self.weights == weights_key(weights) and self.demand == float(demand)
+
+    # --- Ön işleme ---
+
+    def _build(self):
+        start = time.perf_counter()
+        topo = self.topo
+        n = topo.num_nodes
+        table = topo.edge_costs(self.weights, self.demand)
+        self._step_cost = table.step_cost_list
+        indptr, indices, arc_source = topo.csr_lists
+
+        # Çalışma grafı (yalnızca henüz kontrakte edilmemiş düğümler):
+        # out_adj[u][w] = maliyet, in_adj[w][u] = maliyet (kısayollar dahil)
+        out_adj = [dict() for _ in range(n)]
+        in_adj = [dict() for _ in range(n)]
+        for a, c in enumerate(table.step_cost_list):
+            if c == INF:
+                continue  # Talebi karşılamayan hat
+            u, w = arc_source[a], indices[a]
+            if c < out_adj[u].get(w, INF):
+                out_adj[u][w] = c
+                in_adj[w][u] = c
+        self._out_adj, self._in_adj = out_adj, in_adj
+        self._mid = {}  # (u, w) -> orta düğüm (yalnızca kısayollar)
+
+        # Yukarı arama grafları: kontrakte edilen düğümün kalan komşularının hepsi ondan üst sıradadır
+        fwd = [None] * n  # fwd[u]: [(w, maliyet)] u -> w, rank[w] > rank[u]
+        bwd = [None] * n  # bwd[w]: [(u, maliyet)] u -> w, rank[u] > rank[w] (hedeften geriye)
+        deleted_neighbors = [0] * n
+        level = [0] * n
+        priority = [self._priority(v, deleted_neighbors, level) for v in range(n)]
+        heap = [(p, v) for v, p in enumerate(priority)]
+        heapq.heapify(heap)
+        rank = [0] * n
+        order = 0
+        while heap:
+            p, v = heapq.heappop(heap)
+            if fwd[v] is not None or p != priority[v]:
+                continue  # Kontrakte edilmiş veya eski öncelikli girdi
+            if p == INF:
+                # Kalan bütün düğümler çok yoğun: çekirdek
+                heapq.heappush(heap, (p, v))
+                break
+
+            for u, w, c in self._shortcuts(v):
+                if c < out_adj[u].get(w, INF):
+                    out_adj[u][w] = c
+                    in_adj[w][u] = c
+                    self._mid[(u, w)] = v
+            fwd[v] = list(out_adj[v].items())
+            bwd[v] = list(in_adj[v].items())
+            rank[v] = order
+            order += 1
+
+            # v'yi çalışma grafından çıkar
+            for w in out_adj[v]:
+                del in_adj[w][v]
+            for u in in_adj[v]:
+                del out_adj[u][v]
+            neighbors = set(out_adj[v]) | set(in_adj[v])
+            out_adj[v] = in_adj[v] = None
+            # Komşuların önceliği değişti; yeni değerle tekrar kuyruğa (eski girdiler atlanır)
+            for x in neighbors:
+                deleted_neighbors[x] += 1
+                level[x] = max(level[x], level[v] + 1)
+                priority[x] = self._priority(x, deleted_neighbors, level)
+                heapq.heappush(heap, (priority[x], x))
+
+        # Çekirdek: kalan düğümler en üst sıralarda, aralarındaki bütün yaylar iki yönde de aranır
+        for _, v in heap:
+            if fwd[v] is None:
+                fwd[v] = list(out_adj[v].items())
+                bwd[v] = list(in_adj[v].items())
+                rank[v] = order
+                order += 1
+                self.core_size += 1
+
+        del self._out_adj, self._in_adj
+        self.rank = rank
+        self._fwd = fwd
+        self._bwd = bwd
+        self.num_shortcuts = len(self._mid)
+        self.num_arcs = sum(len(a) for a in fwd) + sum(len(a) for a in bwd)
+        self.build_seconds = time.perf_counter() - start
+
+    def _shortcuts(self, v, scan_limit=WITNESS_SCAN_LIMIT):
+        """v kontrakte edilirse gereken kısayollar: [(u, w, maliyet), ...]."""
+        out_adj = self._out_adj
+        outs = list(out_adj[v].items())
+        if not outs:
+            return []
+        result = []
+        for u, c_in in self._in_adj[v].items():
+            # Doğrudan u->w yayı yeterince kısaysa arama gerekmez (yoğun graflarda çoğu hedef böyle elenir)
+            u_out = out_adj[u]
+            targets = {}
+            for w, c_out in outs:
+                if w != u and u_out.get(w, INF) > c_in + c_out:
+                    targets[w] = c_in + c_out
+            if not targets:
+                continue
+            limit = max(targets.values())
+
+            # Tanık araması: u'dan v'yi kullanmadan sınırlı Dijkstra
+            dist = {u: 0.0}
+            heap = [(0.0, u)]
+            scanned = 0
+            remaining = len(targets)
+            while heap and scanned < scan_limit and remaining:
+                d, x = heapq.heappop(heap)
+                if d > dist[x]:
+                    continue
+                if d > limit:
+                    break
+                if x in targets:
+                    remaining -= 1
+                arcs = out_adj[x]
+                scanned += len(arcs)
+                for y, c in arcs.items():
+                    nd = d + c
+                    if nd <= limit and y != v and nd < dist.get(y, INF):
+                        dist[y] = nd
+                        heapq.heappush(heap, (nd, y))
+
+            for w, via in targets.items():
+                if dist.get(w, INF) > via:
+                    result.append((u, w, via))
+        return result
+
+    def _priority(self, v, deleted_neighbors, level):
+        """
+        Kenar farkı (eklenecek kısayol - kaldırılacak yay) + kontrakte edilmiş komşu sayısı
+        + hiyerarşi derinliği (düğümlerin grafa düzgün dağılarak kontrakte edilmesi için).
+        """
+        n_in, n_out = len(self._in_adj[v]), len(self._out_adj[v])
+        if n_in * n_out > CORE_PAIR_LIMIT:
+            return INF  # Çekirdek adayı; kısayol simülasyonu yapılmaz
+        removed = n_in + n_out
+        return len(self._shortcuts(v, PRIORITY_SCAN_LIMIT)) - removed + deleted_neighbors[v] + level[v]
+
+    # --- Sorgu ---
+
+    def query(self, source, target):
+        """
+        İndeksler üzerinden en kısa yol. Döndürdüğü değerler:
+        (adım maliyeti toplamı, indeks yolu veya None, yerleşen düğüm sayısı)
+        """
+        if source == target:
+            return 0.0, [source], 0
+        if self.core_size == len(self.rank):
+            # Hiyerarşi yok (bütün graf çekirdek): derlenmiş tek yönlü Dijkstra daha hızlıdır
+            dist, pred = shortest_path_tree(self.topo, source, self._step_cost, target)
+            if dist[target] == INF:
+                return INF, None, 0
+            return dist[target], path_from_tree(self.topo, pred, target), 0
+        # İleri yukarı arama tamamen, geri arama ileri mesafelerle buluşarak ve en iyiyi geçince durur
+        df, pf, settled = self._upward(source, self._fwd, self._bwd)
+        db, pb, settled_b = self._upward(target, self._bwd, self._fwd, df)
+        settled += settled_b
+        best, meet = INF, -1
+        for u, d in db.items():
+            if u in df and df[u] + d < best:
+                best, meet = df[u] + d, u
+
+        if meet == -1:
+            return INF, None, settled
+
+        # Hiyerarşi yolu: kaynak -> buluşma -> hedef
+        up = [meet]
+        while pf[up[-1]] != -1:
+            up.append(pf[up[-1]])
+        up.reverse()
+        x = meet
+        while pb[x] != -1:
+            x = pb[x]
+            up.append(x)
+        return best, self._unpack(up), settled
+
+    @staticmethod
+    def _upward(start, graph, down, other=None):
+        """
+        Yalnızca yukarı yaylarla Dijkstra; (mesafe, önceki düğüm, yerleşen) döndürür.
+        other verilirse (karşı yönün mesafeleri) anahtar bulunan en iyi buluşmayı geçince durur.
+        """
+        dist, pred = {start: 0.0}, {start: -1}
+        heap = [(0.0, start)]
+        best = INF
+        settled = 0
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            if d >= best:
+                break
+            settled += 1
+            if other is not None and u in other and d + other[u] < best:
+                best = d + other[u]
+            # Stall-on-demand: u'ya daha üst bir düğümden daha kısa ulaşılıyorsa genişletme
+            stalled = False
+            for x, c in down[u]:
+                if x in dist and dist[x] + c < d:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+            for w, c in graph[u]:
+                nd = d + c
+                if nd < dist.get(w, INF):
+                    dist[w] = nd
+                    pred[w] = u
+                    heapq.heappush(heap, (nd, w))
+        return dist, pred, settled
+
+    def _unpack(self, path):
+        """Kısayolları orta düğümleriyle açar (özyineleme yerine yığın)."""
+        mid = self._mid
+        result = [path[0]]
+        stack = [(path[i], path[i + 1]) for i in range(len(path) - 2, -1, -1)]
+        while stack:
+            u, w = stack.pop()
+            m = mid.get((u, w))
+            if m is None:
+                result.append(w)
+            else:
+                stack.append((m, w))
+                stack.append((u, m))
+        return result
+
+
+class CHSolver:
+    def __init__(self, G, S, D, demand, weights, demand_step=0.0):
+        """
+        Kontraksiyon hiyerarşisi ile kesin en iyi yol çözücüsü.
+        Parametreler ve dönüş biçimi DijkstraSolver ile aynıdır; dizin (ağırlık, talep sınıfı)
+        başına bir kez kurulur ve topoloji üzerinde saklanır.
+        - demand_step: > 0 ise talep bu adımın katlarına yukarı yuvarlanır (RouteCache kovası
+          gibi). Çok sayıda farklı talep az sayıda dizini paylaşır; yol talebi yine karşılar
+          ama asıl talep için kesin optimum olmayabilir.
+        """
+        self.G = G
+        self.topo = CompiledTopology.of(G)
+        self.S = S
+        self.D = D
+        self.demand = bucket_demand(demand, demand_step)
+        self.weights = weights
+        self.settled = 0
+
+    def run(self):
+        topo = self.topo
+        ch = ContractionHierarchy.of(topo, self.weights, self.demand)
+        _, idx_path, self.settled = ch.query(topo.index_of(self.S), topo.index_of(self.D))
+        if idx_path is None:
+            return None, INF, {'delay': 0, 'rel_cost': 0, 'bw_cost': 0}
+
+        path = topo.to_ids(idx_path)
+        pm = mt.evaluate_path(topo, path, self.weights)
+        return path, pm.total, {'delay': pm.delay, 'rel_cost': pm.reliability, 'bw_cost': pm.bandwidth}
+
+
+#  ANA CALISTIRMA BLOGU
+if __name__ == "__main__":
+    from ..generation.synthetic_graf import sentetik_graf_uret
+    # Kullanım: python -m src.algorithms.ContractionHierarchy [düğüm sayıları...]
+    sizes = [int(x) for x in sys.argv[1:]] or [10_000, 50_000]
+    weights = {'delay': 0.33, 'reliability': 0.33, 'bandwidth': 0.34}
+
+    print("\n--- KONTRAKSIYON HIYERARSISI (CH) vs DIJKSTRA ---\n")
+    header = f"{'Dugum':<9} {'Kenar':<9} {'Kurulum(s)':<11} {'Kisayol':<9} {'Dijkstra(ms)':<13} {'CH(ms)':<9} {'Hizlanma':<9} {'Dogru':<6}"
+    print(header)
+    print("-" * 85)
+
+    for n in sizes:
+        # Ortalama derecesi ~8 olan rastgele geometrik graf
+        rng = random.Random(n)
+        G = sentetik_graf_uret('geometric', n, seed=n)
+        topo = CompiledTopology.of(G)
+        ch = ContractionHierarchy.of(topo, weights)
+        cost = topo.edge_costs(weights).step_cost_list
+
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(20)]
+        start = time.perf_counter()
+        ref = [shortest_path_tree(topo, s, cost, t)[0][t] for s, t in pairs]
+        dj_ms = (time.perf_counter() - start) / len(pairs) * 1000
+
+        start = time.perf_counter()
+        got = [ch.query(s, t)[0] for s, t in pairs]
+        ch_ms = (time.perf_counter() - start) / len(pairs) * 1000
+
+        ok = all((a == b == INF) or abs(a - b) < 1e-6 for a, b in zip(ref, got))
+        print(f"{n:<9} {G.number_of_edges():<9} {ch.build_seconds:<11.1f} {ch.num_shortcuts:<9} {dj_ms:<13.2f} {ch_ms:<9.3f} {dj_ms / ch_ms:<9.0f} {str(ok):<6}")
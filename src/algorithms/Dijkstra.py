@@ -0,0 +1,138 @@
+import heapq
+import os
+import time
+import numpy as np
+
+from ..core import Metrics as mt
+from ..core.compiled import CompiledTopology
+
+INF = float('inf')
+
+
+def shortest_path_tree(topo, source, arc_cost, target=None):
+    """
+    Yoğun indeksler üzerinde ikili yığın (heap) tabanlı Dijkstra.
+
+    Parametreler:
+    - topo: CompiledTopology
+    - source: Kaynak düğüm indeksi
+    - arc_cost: Yay maliyetleri (NumPy dizisi veya liste); inf olan yaylar kullanılmaz
+    - target: Verilirse bu düğüm kesinleştiği an arama durur
+
+    Döndürdüğü değerler:
+    - dist: Her düğüme en kısa mesafe (liste, ulaşılamayanlar inf)
+    - pred: Her düğüme gelen en kısa yolun son yayı (liste, yoksa -1)
+    """
+    indptr, indices, _ = topo.csr_lists
+    cost = arc_cost.tolist() if isinstance(arc_cost, np.ndarray) else arc_cost
+
+    n = topo.num_nodes
+    dist = [INF] * n
+    pred = [-1] * n
+    done = [False] * n
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        if u == target:
+            break
+        for a in range(indptr[u], indptr[u + 1]):
+            nd = d + cost[a]
+            v = indices[a]
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = a
+                heapq.heappush(heap, (nd, v))
+
+    return dist, pred
+
+
+def path_from_tree(topo, pred, target):
+    """pred (son yay) listesinden kaynaktan hedefe indeks yolunu çıkarır; yol yoksa None."""
+    _, _, arc_source = topo.csr_lists
+    path = [target]
+    a = pred[target]
+    while a != -1:
+        u = arc_source[a]
+        path.append(u)
+        a = pred[u]
+    path.reverse()
+    return path
+
+
+class DijkstraSolver:
+    def __init__(self, G, S, D, demand, weights):
+        """
+        Ağırlıklı toplam maliyet için kesin (deterministik) çözücü.
+
+        Metrics'teki maliyet kenar/düğüm bazında toplamsaldır
+        (gecikme + -log güvenilirlik + 1000/bw). Bu yüzden bant genişliği talebini
+        karşılamayan hatlar çıkarıldıktan sonra ağırlıklı optimum, yay maliyetleri
+        üzerinde sıradan bir en kısa yoldur.
+
+        Parametreler ACO ile aynıdır:
+        - G: Ağ topolojisi (NetworkX graf veya CompiledTopology)
+        - S, D: Kaynak ve Hedef düğümler
+        - demand: İstenen bant genişliği (Bunu sağlamayan hatlar kullanılmaz)
+        - weights: Gecikme, Güvenilirlik ve Bant Genişliği ağırlıkları
+        """
+        self.G = G
+        self.topo = CompiledTopology.of(G)
+        self.S = S
+        self.D = D
+        self.demand = demand
+        self.weights = weights
+
+    def run(self):
+        """
+        En iyi yolu ve maliyetini bulur. Dönüş biçimi AntColonyOptimizer.run ile aynıdır:
+        (best_path, best_cost, best_metrics). Yol yoksa (None, inf, {...}) döner;
+        S veya D topolojide yoksa KeyError.
+        """
+        topo = self.topo
+        source = topo.index_of(self.S)
+        target = topo.index_of(self.D)
+
+        # Yay maliyetleri (ağırlık, talep) önbelleğinden; talebi karşılamayanlar inf
+        table = topo.edge_costs(self.weights, self.demand)
+        dist, pred = shortest_path_tree(topo, source, table.step_cost_list, target)
+
+        if dist[target] == INF:
+            return None, INF, {'delay': 0, 'rel_cost': 0, 'bw_cost': 0}
+
+        path = topo.to_ids(path_from_tree(topo, pred, target))
+        pm = mt.evaluate_path(topo, path, self.weights)
+        return path, pm.total, {'delay': pm.delay, 'rel_cost': pm.reliability, 'bw_cost': pm.bandwidth}
+
+
+#  ANA CALISTIRMA BLOGU
+if __name__ == "__main__":
+    from ..experiment.demand_stream import iter_demands
+    from ..generation import generate_graf as gg
+
+    print("\n--- DIJKSTRA (KESIN COZUM) SONUCLARI ---\n")
+
+    G = gg.graf_uret()
+    # Talep Dosyasını (DemandData) satır satır oku; dosya belleğe toplu alınmaz
+    DEMAND_FILE = os.path.join(gg.DATA_DIR, "DemandData.xlsx")
+
+    weights = {'delay': 0.4, 'reliability': 0.4, 'bandwidth': 0.2}
+    print(f"Kullanilan Agirliklar: {weights}\n")
+
+    header = f"{'No':<4} {'Src':<6} {'Dst':<6} {'Talep':<8} {'Gec(ms)':<10} {'Guv(Cost)':<10} {'BW(Cost)':<10} {'TOPLAM':<10} {'Sure(ms)':<10}"
+    print(header)
+    print("-" * 85)
+
+    for index, (_, S, D, B) in enumerate(iter_demands(DEMAND_FILE)):
+        start = time.perf_counter()
+        path, cost, metrics = DijkstraSolver(G, S, D, B, weights).run()
+        elapsed = (time.perf_counter() - start) * 1000
+
+        if path:
+            print(f"{index+1:<4} {S:<6} {D:<6} {B:<8} {metrics['delay']:<10.2f} {metrics['rel_cost']:<10.2f} {metrics['bw_cost']:<10.2f} {cost:<10.2f} {elapsed:<10.2f}")
+        else:
+            print(f"{index+1:<4} {S:<6} {D:<6} {B:<8} {'YOL YOK':<43} {elapsed:<10.2f}")
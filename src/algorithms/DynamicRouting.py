@@ -0,0 +1,303 @@
+import heapq
+import random
+import time
+
+import numpy as np
+
+from ..core.compiled import CompiledTopology, reliability_cost, bandwidth_cost
+from ..core.edge_costs import weights_key
+from .Dijkstra import shortest_path_tree, INF
+
+
+class DynamicRoutingTable:
+    """
+    NetworkTopology'deki yerinde değişikliklerle (hat kopması, hat/düğüm özelliği
+    değişimi) kendini onaran en kısa yol ağaçları.
+
+    RoutingTable gibi seçilen her kaynak için bir en kısa yol ağacı tutar ve aynı
+    lookup(S, D) arayüzünü sunar; fark, topoloji değişince baştan kurulmamasıdır:
+
+    - Maliyeti ARTAN yaylar (kopma, kötüleşme): yay ağaçta kullanılıyorsa yalnızca onun
+      altındaki alt ağaç (etkilenen düğümler) geçersiz sayılır. Bu düğümler etkilenmemiş
+      komşularından gelen en iyi yayla yeniden tohumlanır ve Dijkstra yalnızca bu bölgede
+      ilerler. Ağaçta kullanılmayan bir yay ağacı hiç değiştirmez.
+    - Maliyeti AZALAN yaylar: yeni yay bir düğüme daha kısa yol veriyorsa o düğümden
+      başlayarak sadece iyileşen düğümler güncellenir.
+
+    Derlenmiş CSR yapısı değişmez; kopan hat sonsuz maliyetli yay olarak kalır.
+    Dinleyici olarak bildirilmeyen değişikliklerde (ör. add_link ile yeni hat) sürüm
+    damgası uyuşmaz ve tablo bir sonraki sorguda baştan kurulur.
+    """
+
+    def __init__(self, topology, weights, demand=0.0, sources=None):
+        """
+        Parametreler:
+        - topology: core.model.NetworkTopology (değişiklikler buradan dinlenir)
+        - weights: Gecikme, Güvenilirlik ve Bant Genişliği ağırlıkları
+        - demand: Talep sınıfı (Bunu sağlamayan hatlar kullanılmaz)
+        - sources: Ağacı tutulacak kaynak düğüm kimlikleri (None: bütün düğümler)
+        """
+        self.topology = topology
+        self.weights = weights_key(weights)
+        self.demand = float(demand)
+        self._source_ids = None if sources is None else list(sources)
+        self.last_repair_ms = 0.0
+        self.repaired_trees = 0  # Son değişiklikte gerçekten değişen ağaç sayısı
+        self._build()
+        topology.add_listener(self.on_topology_change)
+
+    def close(self):
+        """Topolojiyi dinlemeyi bırakır."""
+        self.topology.remove_listener(self.on_topology_change)
+
+    # --- Kurulum ---
+
+    def _build(self):
+        topo = CompiledTopology.from_topology(self.topology)
+        self.topo = topo
+        self.version = self.topology.version
+
+        # Değişebilen yay/düğüm özellikleri (Python listeleri; onarım döngüleri için)
+        self.link_delay = topo.link_delay.tolist()
+        self.link_rel_cost = topo.link_rel_cost.tolist()
+        self.bw_cost = topo.bw_cost.tolist()
+        self.bandwidth = topo.bandwidth.tolist()
+        self.alive = [True] * topo.num_arcs
+        self.proc_delay = topo.proc_delay.tolist()
+        self.node_rel_cost = topo.node_rel_cost.tolist()
+
+        self.indptr, self.indices, self.arc_source = topo.csr_lists
+        self.reverse_arc = topo.reverse_arc.tolist()
+        self._arc_source_np = topo.arc_source.astype(np.int64)
+
+        self.cost = [self._arc_cost(a) for a in range(topo.num_arcs)]
+
+        ids = topo.node_ids.tolist() if self._source_ids is None else self._source_ids
+        self.sources = ids
+        self._row_of = {s: r for r, s in enumerate(ids)}
+        self.trees = []
+        for s in topo.to_indices(ids).tolist():
+            dist, pred = shortest_path_tree(topo, s, self.cost)
+            self.trees.append((dist, pred))
+
+    def _arc_cost(self, a):
+        """Yayın ağırlıklı adım maliyeti (EdgeCostTable ile aynı tanım)."""
+        if not self.alive[a] or self.bandwidth[a] < self.demand:
+            return INF
+        w_delay, w_rel, w_band = self.weights
+        head = self.indices[a]
+        return (w_delay * (self.link_delay[a] + self.proc_delay[head])
+                + w_rel * (self.link_rel_cost[a] + self.node_rel_cost[head])
+                + w_band * self.bw_cost[a])
+
+    def _node_cost(self, v):
+        w_delay, w_rel, _ = self.weights
+        return w_delay * self.proc_delay[v] + w_rel * self.node_rel_cost[v]
+
+    # --- Sorgu ---
+
+    def lookup(self, S, D):
+        """S->D için (yol, maliyet) döndürür; yol yoksa (None, inf). S kaynak değilse KeyError."""
+        if self.version != self.topology.version:
+            self._build()  # Bildirilmemiş bir değişiklik olmuş
+        dist, pred = self.trees[self._row_of[S]]
+        target = self.topo.index_of(D)
+        if dist[target] == INF:
+            return None, INF
+        if S == D:
+            return [S], 0.0
+
+        path = [target]
+        a = pred[target]
+        while a != -1:
+            u = self.arc_source[a]
+            path.append(u)
+            a = pred[u]
+        path.reverse()
+        return self.topo.to_ids(path), dist[target] - self._node_cost(target)
+
+    def path(self, S, D):
+        return self.lookup(S, D)[0]
+
+    # --- Onarım ---
+
+    def on_topology_change(self, change):
+        """NetworkTopology dinleyicisi: değişen yayların maliyetini günceller ve ağaçları onarır."""
+        if change.old_version != self.version:
+            self._build()  # Arada kaçırılmış bir değişiklik var; güvenli yol baştan kurmak
+            return
+
+        start = time.perf_counter()
+        topo = self.topo
+        arcs = []
+        if change.kind in ("link_removed", "link_updated"):
+            u, v = topo.index_of(change.u), topo.index_of(change.v)
+            arcs = [int(a) for a in (topo.arcs(u, v), topo.arcs(v, u)) if a != -1]
+            if not arcs:
+                self._build()  # Derlemede olmayan bir hat; CSR yeniden kurulmalı
+                return
+            if change.kind == "link_removed":
+                for a in arcs:
+                    self.alive[a] = False
+            else:
+                link = self.topology.get_link(change.u, change.v)
+                for a in arcs:
+                    self.link_delay[a] = link.delay
+                    self.link_rel_cost[a] = float(reliability_cost(link.reliability))
+                    self.bw_cost[a] = float(bandwidth_cost(link.bandwidth))
+                    self.bandwidth[a] = link.bandwidth
+        elif change.kind == "node_updated":
+            x = topo.index_of(change.u)
+            node = self.topology.get_node(change.u)
+            self.proc_delay[x] = node.processing_delay
+            self.node_rel_cost[x] = float(reliability_cost(node.reliability))
+            # Düğüm maliyeti ona giren yayların adım maliyetine dahil
+            arcs = [r for r in self.reverse_arc[self.indptr[x]:self.indptr[x + 1]] if r != -1]
+
+        increased, decreased = [], []
+        for a in arcs:
+            new = self._arc_cost(a)
+            if new > self.cost[a]:
+                increased.append(a)
+            elif new < self.cost[a]:
+                decreased.append(a)
+            self.cost[a] = new
+
+        self.repaired_trees = 0
+        if increased or decreased:
+            for tree in self.trees:
+                self.repaired_trees += self._repair(tree, increased, decreased)
+
+        self.version = change.new_version
+        self.last_repair_ms = (time.perf_counter() - start) * 1000
+
+    def _descendants(self, pred, roots):
+        """pred ağacında roots düğümlerinin alt ağaçlarındaki bütün düğümler (bool maske)."""
+        pred = np.asarray(pred, dtype=np.int64)
+        parent = np.where(pred >= 0, self._arc_source_np[pred], -1)
+        has_parent = parent >= 0
+        mask = np.zeros(len(pred), dtype=bool)
+        mask[roots] = True
+        frontier = mask.copy()
+        while frontier.any():
+            frontier = frontier[parent] & has_parent & ~mask
+            mask |= frontier
+        return mask
+
+    def _repair(self, tree, increased, decreased):
+        """Tek bir ağacı yerinde onarır; ağaç değiştiyse 1 döner."""
+        dist, pred = tree
+        cost = self.cost
+        indptr, indices, reverse_arc = self.indptr, self.indices, self.reverse_arc
+        heap = []
+
+        # 1. Artışlar: sadece ağaçta kullanılan yayların alt ağaçları etkilenir
+        roots = [indices[a] for a in increased if pred[indices[a]] == a]
+        if roots:
+            mask = self._descendants(pred, roots)
+            affected = np.flatnonzero(mask).tolist()
+            in_region = mask.tolist()
+            for x in affected:
+                dist[x] = INF
+                pred[x] = -1
+            # Etkilenmemiş komşulardan en iyi giriş yayı ile yeniden tohumla
+            for x in affected:
+                best, best_arc = INF, -1
+                for a in range(indptr[x], indptr[x + 1]):
+                    w = indices[a]
+                    if in_region[w]:
+                        continue
+                    r = reverse_arc[a]  # w -> x
+                    if r == -1:
+                        continue
+                    nd = dist[w] + cost[r]
+                    if nd < best:
+                        best, best_arc = nd, r
+                if best_arc != -1:
+                    dist[x] = best
+                    pred[x] = best_arc
+                    heapq.heappush(heap, (best, x))
+
+        # 2. Azalışlar: yeni yay bir düğüme daha kısa yol veriyorsa oradan başla
+        for a in decreased:
+            u, v = self.arc_source[a], indices[a]
+            nd = dist[u] + cost[a]
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = a
+                heapq.heappush(heap, (nd, v))
+
+        if not roots and not heap:
+            return 0
+
+        # 3. Sadece iyileşen düğümler üzerinden Dijkstra yayılımı
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            for a in range(indptr[u], indptr[u + 1]):
+                nd = d + cost[a]
+                v = indices[a]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    pred[v] = a
+                    heapq.heappush(heap, (nd, v))
+        return 1
+
+
+#  ANA CALISTIRMA BLOGU
+if __name__ == "__main__":
+    from ..core.model import NetworkTopology
+    from ..generation.synthetic_graf import sentetik_graf_uret
+
+    print("\n--- DINAMIK YONLENDIRME (HAT KOPMASI SONRASI ONARIM) ---\n")
+
+    # 10.000 düğümlü sentetik topoloji (rastgele geometrik graf, ortalama derece ~8)
+    N = 10_000
+    rng = random.Random(42)
+    G = sentetik_graf_uret('geometric', N, seed=42)
+    topology = NetworkTopology.from_nx_graph(G)
+    print(f"Dugum: {N}, Kenar: {G.number_of_edges()}")
+
+    weights = {'delay': 0.33, 'reliability': 0.33, 'bandwidth': 0.34}
+    sources = rng.sample(range(N), 10)
+
+    start = time.perf_counter()
+    table = DynamicRoutingTable(topology, weights, demand=0.0, sources=sources)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Ilk kurulum ({len(sources)} kaynak agaci): {build_ms:.0f} ms\n")
+
+    print(f"{'Olay':<30} {'Onarim(ms)':<12} {'Degisen agac':<14} {'Tam kurulum(ms)':<16} {'Dogru':<6}")
+    print("-" * 80)
+
+    for step in range(5):
+        # Bir kaynağın en kısa yol ağacında kullanılan rastgele bir hattı kopar
+        s = sources[step]
+        D = rng.randrange(N)
+        path, _ = table.lookup(s, D)
+        if not path or len(path) < 2:
+            continue
+        k = rng.randrange(len(path) - 1)
+        u, v = path[k], path[k + 1]
+
+        topology.remove_link(u, v)
+        repair_ms = table.last_repair_ms
+
+        start = time.perf_counter()
+        fresh = DynamicRoutingTable(topology, weights, demand=0.0, sources=sources)
+        full_ms = (time.perf_counter() - start) * 1000
+        fresh.close()
+
+        ok = all(
+            np.allclose(np.nan_to_num(a[0], posinf=-1), np.nan_to_num(b[0], posinf=-1))
+            for a, b in zip(table.trees, fresh.trees)
+        )
+        print(f"{f'Hat koptu {u}-{v}':<30} {repair_ms:<12.2f} {table.repaired_trees:<14} {full_ms:<16.0f} {str(ok):<6}")
+
+    # Gecikme artışı (kötüleşme) ve geri iyileşme
+    link = topology.get_links()[0]
+    old_delay = link.delay
+    topology.update_link(link.source, link.target, delay=old_delay * 10)
+    print(f"{'Gecikme x10':<30} {table.last_repair_ms:<12.2f} {table.repaired_trees:<14}")
+    topology.update_link(link.source, link.target, delay=old_delay)
+    print(f"{'Gecikme geri alindi':<30} {table.last_repair_ms:<12.2f} {table.repaired_trees:<14}")
@@ -1,20 +1,36 @@
 from . import path_utilities as rp
 from ..generation import generate_graf as gp
 from ..core import Metrics as mr
+from ..core.compiled import CompiledTopology
+from ..core.costed_path import CostedPath
+from .Pareto import ParetoFront
+from .YenKSP import KShortestPaths
+import os
 import random
-import pandas as pd
+import time
+import numpy as np
 
-def population(G,source,target,size):
+def population(G,source,target,size,seed_paths=None,deadline=None):
     #popülasyon oluşturma işlemi
+    #seed_paths verilirse(ör. K-en kısa yollar) popülasyon önce onlarla doluyor,kalanı rastgele yollarla tamamlanıyor.Çeşitlilik kaybolmasın diye.
+    #deadline(time.monotonic) geçtiyse(veya bir sonraki yol en uzun yol üretim süresi içinde sığmayacaksa) ve elde en az bir yol varsa eksik popülasyonla dönüyor.Büyük graflarda rastgele yol üretmek süre sınırının tamamını yiyebiliyor.
     pop_list=[]
+    for seed in seed_paths or []:
+        if len(pop_list)<size and list(seed) not in pop_list and len(seed)>=2:
+            pop_list.append(list(seed))
     tester=0
+    longest_step=0.0
     while tester<(size*10):#Alacağımız kadarın 10 katı kadar deneme verdim.Her bir yol girmesi için 10 şans verdim.
+        step_start=time.monotonic()
         list1=rp.generate_random_path(G,source,target)#Elifin oluşturduğu rastgele yol oluşturma fonksiyonuyla rastgele yollar aldım
         if list1!=None and list1 not in pop_list and len(list1)>=2:#Eğer bu yol var olup olmadığını,popülasyonda var olup olmadığını ve en az 2 node olup olmadığına bakıyor
             pop_list.append(list1)
 
         if len(pop_list)==size:#Önceden popülasyon dolarsa döngüyü kırıyor.
             break
+        longest_step=max(longest_step,time.monotonic()-step_start)
+        if deadline is not None and pop_list and time.monotonic()+longest_step>=deadline:
+            break
         tester+=1
     return pop_list
 
@@ -24,28 +40,35 @@ def fitness_calculation(G,pop_list,w_delay=0.5, w_rel=0.1,w_band=0.4,max_delay=1
     pop_fit=[]
     #w_delay+w_rel+w_band=1.Bu denklem şart.
 
-    for pop in pop_list:#Burada tek tek popülasyonda olanların maliyetini hesaplıyor,yaptığım metrics sınıfında.
-        TotalDelay=mr.Total_Delay(G,pop)
-        TotalReliability=mr.Total_Reliability(G,pop)
-        TotalBandwidth=mr.Total_Bandwidth(G,pop)
-        min_mbps=float('inf')
-
-        for temp in range(len(pop)-1):
-            u=pop[temp]
-            v=pop[temp+1]
-            mbps=G.edges[u,v]['bandwidth_mbps']
-            if mbps<min_mbps:
-                min_mbps=mbps
+    if len(pop_list)==0:
+        return pop_fit
+
+    #Maliyeti önceden bilinen (CostedPath) yollar tekrar hesaplanmıyor.Kalanların hepsi tek seferde,vektörel olarak hesaplanıyor(Metrics içindeki Batch_Path_Costs).
+    delay=np.empty(len(pop_list))
+    total=np.empty(len(pop_list))
+    min_bw=np.empty(len(pop_list))
+    uncosted=[]
+    for i,pop in enumerate(pop_list):
+        if isinstance(pop,CostedPath):
+            delay[i]=pop.delay
+            total[i]=pop.cost(w_delay,w_rel,w_band)
+            min_bw[i]=pop.min_bandwidth
+        else:
+            uncosted.append(i)
 
+    if uncosted:
+        flat,offsets=mr.Flatten_Paths([pop_list[i] for i in uncosted])
+        costs=mr.Batch_Path_Costs(G,flat,offsets,w_delay,w_rel,w_band,demand_mbps)#Ağırlıklı yay maliyetleri topolojinin önbelleğinden okunuyor.
+        delay[uncosted]=costs.delay
+        total[uncosted]=costs.total
+        min_bw[uncosted]=costs.min_bandwidth
 
-        if TotalDelay > max_delay:#Eğer toplam delay bizim belirlediğimiz max_delaydan yüksekse değerini çöp yapıyoruz.Maksat o yolu seçmesini engellemek.
-            fitness = 999999
-        elif demand_mbps>min_mbps:
-            fitness = 999999
-        else:
-            fitness=((TotalDelay*w_delay)+(TotalReliability*w_rel)+(TotalBandwidth*w_band))
+    #Eğer toplam delay bizim belirlediğimiz max_delaydan yüksekse veya darboğaz bant genişliği talebi karşılamıyorsa değerini çöp yapıyoruz.Maksat o yolu seçmesini engellemek.
+    infeasible=(delay>max_delay)|(demand_mbps>min_bw)
+    fitness=np.where(infeasible,999999,total).tolist()
 
-        pop_fit.append((pop,fitness))#Burada hem yolu hem de onun maliyetini ekliyoruz tupple olarak.
+    for pop,fit in zip(pop_list,fitness):
+        pop_fit.append((pop,fit))#Burada hem yolu hem de onun maliyetini ekliyoruz tupple olarak.
 
     return pop_fit
 
@@ -130,6 +153,8 @@ def multi_mutation(G,child,mutation_rate=0.1):
 
         if temp==None:#Boş gelirse mutasyon yaptırmadım.Eğer tam yol geldiyse Elifin yolu sadeleştir fonksiyonuyla yolu sadeleştirip değeri dönderdim.
             return child
+        elif isinstance(child,CostedPath):#Maliyetli yolsa sadece değişen bölümün maliyeti yeniden hesaplanıyor.
+            return child.rebase(rp.yolu_Sadelestir(temp))
         else:
             return rp.yolu_Sadelestir(temp)
     else:
@@ -181,14 +206,25 @@ def mutation_version3(G,child):#Misal path:1-2-3-4-5-6-7-8-9 mutasyonlu path: 1-
     else:
         return None
 
-def genetic_algorithm(G,source,target,demand_mbps,pop_size=50,generations=3000,mutation_rate=0.1,w_delay=0.33,w_rel=0.33,w_band=0.34,max_delay=100):
+def genetic_algorithm(G,source,target,demand_mbps,pop_size=50,generations=3000,mutation_rate=0.1,w_delay=0.33,w_rel=0.33,w_band=0.34,max_delay=100,seed_k=0,time_limit=None,stop=None):
     #Main kısmı
-    population_group=population(G,source,target,pop_size)#Popülasyon oluşturdum.
+    #seed_k>0 ise popülasyonun o kadarı Yen algoritmasının en iyi k yoluyla tohumlanıyor.Çok daha az nesilde aynı maliyete iniyor.
+    deadline=time.monotonic()+time_limit if time_limit is not None else None#time_limit(saniye) verilirse süre dolunca eldeki en iyi yol döndürülüyor.Popülasyon oluşturma da süreye dahil.
+    G=CompiledTopology.of(G)#Graf bir kere diziye derleniyor,bütün operatörler bunun üzerinden çalışıyor.
+    seeds=KShortestPaths(G,source,target,demand_mbps,(w_delay,w_rel,w_band),k=seed_k).paths() if seed_k>0 else None
+    population_group=[CostedPath(p,G) for p in population(G,source,target,pop_size,seeds,deadline)]#Popülasyon oluşturdum.Yollar maliyetleriyle birlikte tutuluyor.
     global_best_value=99999#En iyi değeri şimdilik 999999 verdim.İleride en iyi değer değişmezse geçiçi olarak mutasyon oranını arttıracağım.
     mutation_value_count=0#Buda bir üstteki kodun sayacı.
     current_mutation_rate=mutation_rate#Mutation rate kaybolmasın diye geçici bir mutation rate yaptım.Maksat eski oranı kullanmak için.Bunla iş yapacağız.
 
+    def expired(reserve=0.0):#Süre dolduysa(reserve saniye kala) veya stop(threading/multiprocessing Event) kurulduysa(deney iptal edilmiş) True.Her çocuktan önce bakılıyor.
+        return (deadline is not None and time.monotonic()+reserve>=deadline) or (stop is not None and stop.is_set())
+
+    longest_step=0.0#Şimdiye kadarki en uzun çocuk üretim süresi.Mutasyon bazen uzun sürüyor(rastgele yol üretimi),bir sonraki çocuk süreye sığmayacaksa hiç başlanmıyor.
+
     for i in range(generations):#Kaç nesil gitsin maksadıyla oluşturuldu.
+        if expired():
+            break
         fitness_group = fitness_calculation(G, population_group, w_delay, w_rel, w_band,max_delay,demand_mbps)#fitness değerleri hesaplandı.
         best_generetion=[]#çocuklar için oluşturuldu.
         fitness_group.sort(key=lambda x: x[1])#Sıraladım başta.Çünkü bir aşağıda yıldızlarla işaretledğim yerde en iyi iki kişiyi kaybetmemek için onları gruba ekledim.
@@ -207,21 +243,32 @@ def genetic_algorithm(G,source,target,demand_mbps,pop_size=50,generations=3000,m
             current_mutation_rate = mutation_rate
 
         if rp.yol_gecerli_mi(G,fitness_group[0][0],source,target):#*****Yol geçerli olup olmadığına da baktım.Değerde bozulma ihtimaline karşın kopyaladım.Referrans almadım.
-            best_generetion.append(fitness_group[0][0][:])#Referans almadım,kopyaladım.
+            best_generetion.append(fitness_group[0][0].copy())#Referans almadım,kopyaladım.
 
         if rp.yol_gecerli_mi(G,fitness_group[1][0],source,target):#*****Yol geçerli olup olmadığına da baktım.Değerde bozulma ihtimaline karşın kopyaladım.Referrans almadım.
-            best_generetion.append(fitness_group[1][0][:])#Referans almadım,kopyaladım.
+            best_generetion.append(fitness_group[1][0].copy())#Referans almadım,kopyaladım.
 
         child_count=0#Çocuk while döngüsünde kaç kere eklenmediyse diye sayaç oluşturdum.
         generation_count=0#Eğer best_generation dolmazsa çok zorlamaması açısından sayaç koydum.Her nesil için 1000 kere hak var.
 
+        cut_short=False
+        step_start=time.monotonic()
         while len(best_generetion)<pop_size and generation_count<1000:
+            now=time.monotonic()
+            longest_step=max(longest_step,now-step_start)
+            step_start=now
+            if expired(longest_step):
+                cut_short=True
+                break
 
             father, mother = selection(fitness_group)#Anne baba seçiliyor.
             child = crossover(father, mother)#Crossoveryapılıyor.
 
             if child is None: continue#Çocuk yoksa devam.
 
+            if isinstance(father,CostedPath):#Çocuk babayla ortak baş/kuyruğu paylaştığı için sadece farklı kısmı maliyetlendiriliyor.
+                child=father.rebase(child)
+
             child = multi_mutation(G, child, current_mutation_rate)#Mutasyon yapılıyor,yapılacaksa tabi.
 
             if rp.yol_gecerli_mi(G,child, source,target):#Elifin yazdığı yol geçerli mi fonksiyonunda yolun olup olmadığına bakılıyor.True yada false döndürüyor.
@@ -232,33 +279,147 @@ def genetic_algorithm(G,source,target,demand_mbps,pop_size=50,generations=3000,m
                     child_count+=1
             generation_count+=1
 
+        if cut_short:#Nesil yarıda kaldıysa eksik nesil alınmıyor,en iyi yol bir önceki tam nesilden seçiliyor.
+            break
         population_group=best_generetion#En sonda oluşan çocuklar bir diğer nesili oluşturmak için çocuk yapacak.Yani bunlar anne,baba seçimi olacak.
 
 
     fitness_group = fitness_calculation(G, population_group, w_delay, w_rel, w_band,max_delay,demand_mbps)#En sonda oluşan best yolların fitness ını(maliyetini) hesapladım.
     fitness_group.sort(key=lambda x:x[1])#Sıraladım.En düşük maliyet en başta.
-    return fitness_group[0][0]#En iyisi döndürdüm.
+    return list(fitness_group[0][0])#En iyisi döndürdüm.
+
+
 
 
+#NSGA-II (çok amaçlı) modu.Tek bir ağırlık vektörü yerine bütün Pareto cephesini tek çalıştırmada döndürür.
+#population,crossover ve multi_mutation operatörleri aynen kullanılıyor,sadece seçim mantığı değişiyor.
+
+def objective_calculation(G,pop_list,max_delay=100,demand_mbps=0.2):
+    #Her yol için (gecikme,güvenilirlik maliyeti,bant genişliği maliyeti) matrisini ve kısıt ihlal miktarını döndürür.
+    #Tek amaçlıdaki gibi 999999 verilmiyor,çünkü bütün kötü yollar eşit olunca hangisinin kısıta daha yakın olduğu kayboluyor.
+    objectives=np.empty((len(pop_list),3))
+    min_bw=np.empty(len(pop_list))
+    uncosted=[]
+    for i,pop in enumerate(pop_list):
+        if isinstance(pop,CostedPath):
+            objectives[i]=(pop.delay,pop.reliability,pop.bandwidth)
+            min_bw[i]=pop.min_bandwidth
+        else:
+            uncosted.append(i)
+
+    if uncosted:
+        flat,offsets=mr.Flatten_Paths([pop_list[i] for i in uncosted])
+        costs=mr.Batch_Path_Costs(G,flat,offsets)
+        objectives[uncosted]=np.column_stack((costs.delay,costs.reliability,costs.bandwidth))
+        min_bw[uncosted]=costs.min_bandwidth
+
+    delay=objectives[:,0]
+    #İhlal: gecikme sınırını ve bant genişliği talebini ne kadar aştığı(oransal).0 ise yol uygun.
+    violation=np.maximum(delay-max_delay,0)/max(max_delay,1e-9)+np.maximum(demand_mbps-min_bw,0)/max(demand_mbps,1e-9)
+    return objectives,violation
+
+def non_dominated_sort(objectives,violation=None):
+    #Baskın olmayan sıralama.Bütün ikili baskınlık kontrolleri tek seferde matrisle yapılıyor.
+    #dominates[i,j]: i yolu j yolunu baskılıyor mu (her amaçta <= ve en az birinde <).
+    le=(objectives[:,None,:]<=objectives[None,:,:]).all(axis=2)
+    lt=(objectives[:,None,:]<objectives[None,:,:]).any(axis=2)
+    dominates=le&lt
+    if violation is not None:
+        #Kısıtlı baskınlık: uygun yol uygun olmayanı,az ihlal eden çok ihlal edeni her zaman baskılar.
+        feasible=violation<=0
+        both=feasible[:,None]&feasible[None,:]
+        dominates=np.where(both,dominates,violation[:,None]<violation[None,:])
+
+    rank=np.full(len(objectives),-1)
+    dominated_count=dominates.sum(axis=0)#Her yolu kaç yol baskılıyor.
+    current=np.flatnonzero(dominated_count==0)
+    level=0
+    while len(current):
+        rank[current]=level
+        dominated_count=dominated_count-dominates[current].sum(axis=0)
+        dominated_count[rank>=0]=-1#Sıralananlar tekrar seçilmesin.
+        current=np.flatnonzero(dominated_count==0)
+        level+=1
+    return rank
+
+def crowding_distance(objectives,rank):
+    #Her cephe içinde kalabalık mesafesi.Uçtaki yollar sonsuz,diğerleri komşularının normalize farkı kadar.
+    distance=np.zeros(len(objectives))
+    for level in np.unique(rank):
+        members=np.flatnonzero(rank==level)
+        if len(members)<=2:
+            distance[members]=np.inf
+            continue
+        for m in range(objectives.shape[1]):
+            order=members[np.argsort(objectives[members,m])]
+            values=objectives[order,m]
+            span=values[-1]-values[0]
+            distance[order[0]]=distance[order[-1]]=np.inf
+            if span>0:
+                distance[order[1:-1]]+=(values[2:]-values[:-2])/span
+    return distance
+
+def tournament(pop_list,rank,distance):
+    #İkili turnuva: düşük rank kazanır,eşitse kalabalık mesafesi büyük olan kazanır.
+    i,j=random.randrange(len(pop_list)),random.randrange(len(pop_list))
+    if rank[i]!=rank[j]:
+        return pop_list[i] if rank[i]<rank[j] else pop_list[j]
+    return pop_list[i] if distance[i]>=distance[j] else pop_list[j]
+
+def nsga2_genetic_algorithm(G,source,target,demand_mbps,pop_size=50,generations=200,mutation_rate=0.5,max_delay=100):
+    #Çok amaçlı ana kısım.Sonunda bütün yaklaşık Pareto cephesini ParetoFront olarak döndürüyor.
+    #Mutasyon oranı tek amaçlıdan yüksek,çünkü elitist seçim cepheyi çabuk daraltıyor;0.1 ile cephenin uçları bulunamıyordu.
+    #Herhangi bir ağırlık için en iyi yol cephe.best(ağırlıklar) ile yeniden çalıştırmadan seçilebilir.
+    G=CompiledTopology.of(G)
+    population_group=[CostedPath(p,G) for p in population(G,source,target,pop_size)]
+    if not population_group:
+        return ParetoFront(np.empty((0,3)),[])
+
+    for i in range(generations):
+        objectives,violation=objective_calculation(G,population_group,max_delay,demand_mbps)
+        rank=non_dominated_sort(objectives,violation)
+        distance=crowding_distance(objectives,rank)
+
+        children=[]
+        generation_count=0#Her nesil için 1000 kere hak var,genetic_algorithm ile aynı.
+        while len(children)<pop_size and generation_count<1000:
+            generation_count+=1
+            father=tournament(population_group,rank,distance)
+            mother=tournament(population_group,rank,distance)
+            child=crossover(father,mother)
+            if child is None: continue
+            if isinstance(father,CostedPath):
+                child=father.rebase(child)
+            child=multi_mutation(G,child,mutation_rate)
+            if rp.yol_gecerli_mi(G,child,source,target) and child not in children:
+                children.append(child)
+
+        #Ebeveyn+çocuk birleşimi,aynı yollar bir kere alınıyor.
+        combined=list(population_group)
+        for child in children:
+            if child not in combined:
+                combined.append(child)
+
+        objectives,violation=objective_calculation(G,combined,max_delay,demand_mbps)
+        rank=non_dominated_sort(objectives,violation)
+        distance=crowding_distance(objectives,rank)
+        order=np.lexsort((-distance,rank))#Önce rank,sonra kalabalık mesafesi büyük olan.
+        population_group=[combined[k] for k in order[:pop_size]]
+
+    objectives,violation=objective_calculation(G,population_group,max_delay,demand_mbps)
+    rank=non_dominated_sort(objectives,violation)
+    best=np.flatnonzero((rank==0)&(violation<=0))#Sadece kısıtı sağlayan ilk cephe.
+    return ParetoFront(objectives[best],[list(population_group[k]) for k in best])
 
 
 def read_demands(filename):#Dosya okuma işlemleri
+    #Talepler tek tek okunuyor(CSV/Excel/JSONL),dosyanın tamamı belleğe alınmıyor.
+    from ..experiment.demand_stream import iter_demands
     try:
-        df = pd.read_csv(filename, sep=";")
-        rows = []
-        for index, row in df.iterrows():
-            source = int(row["src"])
-            target = int(row["dst"])
-            str_band = str(row["demand_mbps"])
-
-            band = float(str_band.replace(",", "."))
-            one_row = (source, target, band)
-            rows.append(one_row)
-
-        return rows
+        for demand in iter_demands(filename):
+            yield demand.src, demand.dst, demand.demand_mbps
     except Exception as e:
         print(f"Dosya okuma hatası : {e}")
-        return []
 
 
 def main():
@@ -267,7 +428,7 @@ def main():
     print("==========================================\n")
 
     # 1. Dosya İsimleri
-    demand_file = "data/DemandData.xlsx"
+    demand_file = os.path.join(gp.DATA_DIR, "DemandData.xlsx")
 
     # 2. Grafı Yükle
     print("📡 1. Adım: Ağ Topolojisi (Graf) Yükleniyor...")
@@ -281,12 +442,12 @@ def main():
     # 3. Talepleri Oku
     print(f"📋 2. Adım: Talep Dosyası Okunuyor ({demand_file})...")
     demands = read_demands(demand_file)
-    print(f"   ✅ Toplam {len(demands)} adet talep işlenecek.\n")
 
     # 4. Her Talep İçin Algoritmayı Çalıştır
     print("🚀 3. Adım: Simülasyon Başlıyor...\n")
 
     successful_routes = 0
+    total_routes = 0
 
     # Ağırlık Ayarları (GA fonksiyonundaki varsayılanlarla AYNI olmalı)
     # Eğer GA fonksiyonuna dışarıdan ağırlık yollamıyorsan varsayılanları buraya yaz:
@@ -295,6 +456,7 @@ def main():
     w_band = 0.34
 
     for i, (src, dst, bw_demand) in enumerate(demands):
+        total_routes += 1
         print(f"🔹 Talep {i + 1}: Kaynak {src} -> Hedef {dst} | İstenen Hız: {bw_demand} Mbps")
 
         # Algoritmayı Çağır
@@ -317,12 +479,10 @@ def main():
                 print(f"   ✅ YOL BULUNDU: {best_path}")
 
                 # --- FITNESS HESAPLAMA EKLENTİSİ ---
-                d_val = mr.Total_Delay(G, best_path)
-                r_val = mr.Total_Reliability(G, best_path)
-                b_val = mr.Total_Bandwidth(G, best_path)
-
                 # Fitness Formülü: (Gecikme*w) + (Güvenilirlik*w) + (Bant*w)
-                fitness_score = (d_val * w_delay) + (r_val * w_rel) + (b_val * w_band)
+                pm = mr.evaluate_path(G, best_path, (w_delay, w_rel, w_band))
+                d_val = pm.delay
+                fitness_score = pm.total
 
                 print(f"   📊 Gecikme: {d_val:.2f} ms")
                 print(f"   🧬 Fitness Skoru: {fitness_score:.4f}")
@@ -338,7 +498,7 @@ def main():
         print("-" * 40)
 
     print(f"\n🏁 Simülasyon Tamamlandı.")
-    print(f"📊 Başarı Oranı: {successful_routes}/{len(demands)}")
+    print(f"📊 Başarı Oranı: {successful_routes}/{total_routes}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
+import os
 import time
-import pandas as pd
-import generate_graf
-import Metrics
-import QLearning
-import GeneticAlgorithm
-import ACO_Algorithm  
+from ..generation import generate_graf
+from ..core import Metrics
+from ..experiment.demand_stream import iter_demands
+from . import QLearning
+from . import GeneticAlgorithm
+from . import ACO_Algorithm
 
 def main():
     print("\n" + "="*100)
@@ -15,16 +16,14 @@ def main():
     G = generate_graf.graf_uret()
     
     
-    try:
-        df = pd.read_excel("data/DemandData.xlsx")
-    except:
-        try:
-            df = pd.read_csv("data/DemandData.csv", sep=";")
-        except:
-            print("❌ HATA: DemandData dosyası bulunamadı!")
-            return
+    # Talepler satır satır okunuyor; dosya belleğe toplu alınmaz
+    candidates = [os.path.join(generate_graf.DATA_DIR, name) for name in ("DemandData.xlsx", "DemandData.csv")]
+    demand_file = next((path for path in candidates if os.path.exists(path)), None)
+    if demand_file is None:
+        print("❌ HATA: DemandData dosyası bulunamadı!")
+        return
 
-    print(f"📂 Toplam {len(df)} talep (senaryo) yüklendi.\n")
+    print(f"📂 Talepler (senaryolar) okunuyor: {os.path.basename(demand_file)}\n")
     
     
     header = f"{'No':<4} {'Src->Dst':<10} | {'Q-L Cost':<10} {'Time':<6} | {'Gen Cost':<10} {'Time':<6} | {'ACO Cost':<10} {'Time':<6} | {'KAZANAN':<10}"
@@ -35,27 +34,20 @@ def main():
     w_delay, w_rel, w_bw = 0.33, 0.33, 0.34
     weights_list = [w_delay, w_rel, w_bw] 
 
-    for index, row in df.iterrows():
-        try:
-            src = int(row.iloc[0])
-            dst = int(row.iloc[1])
-            demand = float(str(row.iloc[2]).replace(',', '.'))
-        except:
-            continue
-
+    # Geçersiz satırlar iter_demands tarafından atlanır
+    for index, (_, src, dst, demand) in enumerate(iter_demands(demand_file)):
         # ---------------------------------------------------
         # 1. Q-Learning
         # ---------------------------------------------------
         start = time.time()
         q_cost = 999999
         try:
-            q_agent = QLearning.QLearningAgent(src, dst)
+            q_agent = QLearning.QLearningAgent(src, dst, G=G)
             q_agent.train() 
             q_path = q_agent.get_best_path()
             if q_path:
-                d = Metrics.Total_Delay(G, q_path)
-                r = Metrics.Total_Reliability(G, q_path)
-                bw = Metrics.Total_Bandwidth(G, q_path)
+                pm = Metrics.evaluate_path(G, q_path, weights_list)
+                d, r, bw = pm.delay, pm.reliability, pm.bandwidth
                 penalty = 500 if bw < demand else 0
                 q_cost = (w_delay * d) + (w_rel * r) + (w_bw * (1000/(bw+0.1))) + penalty
         except: pass
@@ -74,9 +66,8 @@ def main():
                 w_delay=w_delay, w_rel=w_rel, w_band=w_bw, max_delay=1000
             )
             if ga_path:
-                d = Metrics.Total_Delay(G, ga_path)
-                r = Metrics.Total_Reliability(G, ga_path)
-                bw = Metrics.Total_Bandwidth(G, ga_path)
+                pm = Metrics.evaluate_path(G, ga_path, weights_list)
+                d, r, bw = pm.delay, pm.reliability, pm.bandwidth
                 penalty = 500 if bw < demand else 0
                 ga_cost = (w_delay * d) + (w_rel * r) + (w_bw * (1000/(bw+0.1))) + penalty
         except: pass
@@ -93,9 +84,8 @@ def main():
             aco_path, _, _ = aco_solver.run()
             
             if aco_path:
-                d = Metrics.Total_Delay(G, aco_path)
-                r = Metrics.Total_Reliability(G, aco_path)
-                bw = Metrics.Total_Bandwidth(G, aco_path)
+                pm = Metrics.evaluate_path(G, aco_path, weights_list)
+                d, r, bw = pm.delay, pm.reliability, pm.bandwidth
                 penalty = 500 if bw < demand else 0
                 aco_cost = (w_delay * d) + (w_rel * r) + (w_bw * (1000/(bw+0.1))) + penalty
         except Exception as e:
@@ -0,0 +1,168 @@
+import os
+import time
+import numpy as np
+
+from ..generation import generate_graf as gg
+from ..core import Metrics as mt
+from ..core.compiled import CompiledTopology
+from .Dijkstra import shortest_path_tree, path_from_tree, INF
+
+# Yakınsama toleransı (aynı Lagrange maliyeti kabul eşiği)
+EPS = 1e-9
+
+
+class LARACSolver:
+    def __init__(self, G, S, D, demand, weights, max_delay, max_iter=50):
+        """
+        Gecikme sınırlı en düşük maliyetli yol (Constrained Shortest Path) çözücüsü.
+        LARAC: Lagrangian Relaxation Based Aggregated Cost.
+
+        Amaç: min ağırlıklı QoS maliyeti  s.t.  toplam gecikme <= max_delay
+        ve yoldaki her hat bant genişliği talebini (demand) karşılamalı.
+
+        Gecikme kısıtı Lagrange çarpanı (lambda) ile amaç fonksiyonuna katılır
+        ve her iterasyonda (maliyet + lambda * gecikme) yay maliyetleriyle bir Dijkstra çalışır.
+        GA'daki 999999 cezasının aksine kısıt kesin olarak sağlanır; hiçbir yol
+        sınırı sağlayamıyorsa bu kanıtlanmış olarak raporlanır.
+
+        Parametreler:
+        - G: Ağ topolojisi (NetworkX graf veya CompiledTopology)
+        - S, D: Kaynak ve Hedef düğümler
+        - demand: İstenen bant genişliği
+        - weights: Gecikme, Güvenilirlik ve Bant Genişliği ağırlıkları
+        - max_delay: Uçtan uca gecikme üst sınırı (ms)
+        - max_iter: En fazla lambda güncellemesi
+        """
+        self.G = G
+        self.topo = CompiledTopology.of(G)
+        self.S = S
+        self.D = D
+        self.demand = demand
+        self.weights = weights
+        self.max_delay = max_delay
+        self.max_iter = max_iter
+
+        # run() sonrası doldurulur
+        self.status = None          # "OPTIMAL", "FEASIBLE", "INFEASIBLE", "NO_PATH"
+        self.lower_bound = -INF     # Optimum maliyet için Lagrange alt sınırı
+        self.gap = INF              # Bulunan maliyet - alt sınır
+        self.iterations = 0
+
+    def _solve(self, arc_cost, source, target):
+        """Verilen yay maliyetleriyle en kısa yolu bulur; (yay indeksleri, yol) döner."""
+        dist, pred = shortest_path_tree(self.topo, source, arc_cost, target)
+        if dist[target] == INF:
+            return None, None
+        path = path_from_tree(self.topo, pred, target)
+        arcs = self.topo.arcs(path[:-1], path[1:])
+        return arcs, path
+
+    def run(self):
+        """
+        Döndürdüğü değerler (DijkstraSolver.run ile aynı biçim):
+        - best_path: Gecikme sınırını sağlayan en iyi yol (yoksa None)
+        - best_cost: Yolun ağırlıklı toplam maliyeti (yoksa inf)
+        - best_metrics: delay, rel_cost, bw_cost ile birlikte status, lower_bound, gap
+        """
+        topo = self.topo
+        source = topo.index_of(self.S)
+        target = topo.index_of(self.D)
+
+        table = topo.edge_costs(self.weights, self.demand)
+        cost = table.step_cost                # inf: talebi karşılamayan hat
+        delay = np.where(np.isinf(cost), INF, topo.arc_step_delay)
+
+        # Son düğüm yol metriklerine dahil edilmez; sınır ve maliyet adım toplamlarına göre kaydırılır
+        cost_shift = table.node_cost[target]
+        delay_bound = self.max_delay + topo.proc_delay[target]
+
+        def totals(arcs):
+            return cost[arcs].sum(), delay[arcs].sum()
+
+        # 1. Sadece maliyete göre en kısa yol: sınırı sağlıyorsa optimumdur
+        arcs_c, path_c = self._solve(cost, source, target)
+        if path_c is None:
+            self.status = "NO_PATH"
+            return self._result(None)
+        c_c, d_c = totals(arcs_c)
+        if d_c <= delay_bound:
+            self.status = "OPTIMAL"
+            self.lower_bound = c_c - cost_shift
+            return self._result(path_c)
+
+        # 2. Sadece gecikmeye göre en kısa yol: sınırı sağlamıyorsa problem kesin olarak çözümsüzdür
+        arcs_d, path_d = self._solve(delay, source, target)
+        c_d, d_d = totals(arcs_d)
+        if d_d > delay_bound:
+            self.status = "INFEASIBLE"
+            return self._result(None)
+
+        # 3. Lagrange çarpanı güncellemeleri
+        lower = -INF
+        for self.iterations in range(1, self.max_iter + 1):
+            lam = (c_c - c_d) / (d_d - d_c)
+            arcs_r, path_r = self._solve(cost + lam * delay, source, target)
+            c_r, d_r = totals(arcs_r)
+
+            # L(lambda) = min_p [c(p) + lambda * (d(p) - sınır)], optimum için alt sınırdır
+            lower = max(lower, c_r + lam * (d_r - delay_bound))
+
+            if abs((c_r + lam * d_r) - (c_c + lam * d_c)) <= EPS * max(1.0, abs(c_c + lam * d_c)):
+                break  # Yeni bir yol bulunamadı: lambda optimal
+            if d_r <= delay_bound:
+                c_d, d_d, path_d = c_r, d_r, path_r
+            else:
+                c_c, d_c, path_c = c_r, d_r, path_r
+
+        self.lower_bound = lower - cost_shift
+        self.status = "OPTIMAL" if c_d - lower <= EPS * max(1.0, abs(c_d)) else "FEASIBLE"
+        return self._result(path_d)
+
+    def _result(self, idx_path):
+        if idx_path is None:
+            self.gap = INF
+            return None, INF, {'delay': 0, 'rel_cost': 0, 'bw_cost': 0,
+                               'status': self.status, 'lower_bound': self.lower_bound, 'gap': self.gap}
+
+        path = self.topo.to_ids(idx_path)
+        pm = mt.evaluate_path(self.topo, path, self.weights)
+        self.gap = max(pm.total - self.lower_bound, 0.0)
+        return path, pm.total, {'delay': pm.delay, 'rel_cost': pm.reliability, 'bw_cost': pm.bandwidth,
+                                'status': self.status, 'lower_bound': self.lower_bound, 'gap': self.gap}
+
+
+#  ANA CALISTIRMA BLOGU
+if __name__ == "__main__":
+    from ..experiment.demand_stream import iter_demands
+
+    print("\n--- LARAC (GECIKME SINIRLI) SONUCLARI ---\n")
+
+    G = gg.graf_uret()
+    # Talep Dosyasını (DemandData) satır satır oku; dosya belleğe toplu alınmaz
+    DEMAND_FILE = os.path.join(gg.DATA_DIR, "DemandData.xlsx")
+
+    weights = {'delay': 0.33, 'reliability': 0.33, 'bandwidth': 0.34}
+    MAX_DELAY = 9
+    print(f"Kullanilan Agirliklar: {weights} | Gecikme siniri: {MAX_DELAY} ms\n")
+
+    header = f"{'No':<4} {'Src':<6} {'Dst':<6} {'Talep':<8} {'Durum':<11} {'Gec(ms)':<9} {'TOPLAM':<9} {'AltSinir':<9} {'Fark':<8} {'Sure(ms)':<9}"
+    print(header)
+    print("-" * 90)
+
+    total_time = 0.0
+    count = 0
+    for index, (_, S, D, B) in enumerate(iter_demands(DEMAND_FILE)):
+        count += 1
+        start = time.perf_counter()
+        solver = LARACSolver(G, S, D, B, weights, MAX_DELAY)
+        path, cost, metrics = solver.run()
+        elapsed = (time.perf_counter() - start) * 1000
+        total_time += elapsed
+
+        if path:
+            print(f"{index+1:<4} {S:<6} {D:<6} {B:<8} {solver.status:<11} {metrics['delay']:<9.2f} {cost:<9.3f} {solver.lower_bound:<9.3f} {solver.gap:<8.3f} {elapsed:<9.2f}")
+        else:
+            print(f"{index+1:<4} {S:<6} {D:<6} {B:<8} {solver.status:<11} {'-':<9} {'-':<9} {'-':<9} {'-':<8} {elapsed:<9.2f}")
+
+    print("-" * 90)
+    print(f"Toplam sure: {total_time:.1f} ms ({count} talep)")
@@ -0,0 +1,216 @@
+import csv
+import heapq
+import os
+import time
+import numpy as np
+
+from ..generation import generate_graf as gg
+from ..core import Metrics as mt
+from ..core.compiled import CompiledTopology
+from ..core.edge_costs import weights_key
+
+
+class ParetoFront:
+    """
+    S→D yollarının Pareto cephesi (hiçbiri diğerini tüm amaçlarda geçemez).
+
+    - objectives: (k, 3) dizisi; sütunlar gecikme, güvenilirlik maliyeti, bant genişliği
+      maliyeti (Metrics ile aynı tanımlar)
+    - paths: k adet yol (düğüm kimlik listeleri), objectives ile aynı sırada
+
+    Herhangi bir ağırlık vektörü için optimum, cephe üzerinde O(k) bir argmin ile seçilir;
+    ağırlık değiştiğinde yeniden çözüm gerekmez.
+    """
+
+    def __init__(self, objectives, paths):
+        self.objectives = np.asarray(objectives, dtype=np.float64).reshape(-1, 3)
+        self.paths = paths
+
+    def __len__(self):
+        return len(self.paths)
+
+    def costs(self, weights) -> np.ndarray:
+        """Her cephe noktasının ağırlıklı toplam maliyeti."""
+        return self.objectives @ np.asarray(weights_key(weights))
+
+    def best(self, weights):
+        """
+        Verilen ağırlıklar için en iyi yolu seçer.
+        Döndürdüğü değerler: (yol, maliyet, metrikler) — boş cephede (None, inf, {...}).
+        """
+        if len(self) == 0:
+            return None, float('inf'), {'delay': 0, 'rel_cost': 0, 'bw_cost': 0}
+        totals = self.costs(weights)
+        i = int(np.argmin(totals))
+        d, r, b = self.objectives[i]
+        return self.paths[i], float(totals[i]), {'delay': d, 'rel_cost': r, 'bw_cost': b}
+
+    def export_csv(self, filename):
+        """Cepheyi CSV olarak yazar: gecikme, güvenilirlik, bant genişliği maliyeti ve yol."""
+        with open(filename, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["delay_ms", "reliability_cost", "bandwidth_cost", "hops", "path"])
+            for (d, r, b), path in zip(self.objectives, self.paths):
+                writer.writerow([f"{d:.4f}", f"{r:.4f}", f"{b:.4f}", len(path) - 1, "-".join(map(str, path))])
+
+
+class ParetoLabelSetting:
+    def __init__(self, G, S, D, demand=0.0, max_labels=None):
+        """
+        Çok amaçlı (gecikme, güvenilirlik, bant genişliği) kesin Pareto çözücüsü.
+        Etiket kurma (label-setting) yöntemi ve baskınlık (dominance) budaması kullanır.
+
+        Her etiket (label) bir düğüme varan kısmi bir yolun 3 amaçlı maliyet vektörüdür.
+        Etiketler amaç toplamına göre yığından çıkarılır; bu sırada çıkan bir etiket
+        sonradan gelen bir etiket tarafından baskılanamaz, yani kalıcıdır.
+        Bir etiket, aynı düğümdeki bir etiket veya hedefteki bir çözüm tarafından
+        baskılanıyorsa atılır (tüm adım maliyetleri negatif olmadığı için güvenlidir).
+
+        Parametreler:
+        - G: Ağ topolojisi (NetworkX graf veya CompiledTopology)
+        - S, D: Kaynak ve Hedef düğümler
+        - demand: İstenen bant genişliği (Bunu sağlamayan hatlar kullanılmaz)
+        - max_labels: Güvenlik sınırı; aşılırsa arama durur ve cephe eksik kalabilir
+        """
+        self.G = G
+        self.topo = CompiledTopology.of(G)
+        self.S = S
+        self.D = D
+        self.demand = demand
+        self.max_labels = max_labels
+        self.complete = None  # run() sonrası: cephe tam mı (max_labels'a takılmadı mı)
+        self.num_labels = 0
+
+    def run(self) -> ParetoFront:
+        topo = self.topo
+        source = topo.index_of(self.S)
+        target = topo.index_of(self.D)
+        indptr, indices, _ = topo.csr_lists
+
+        # Yay başına 3 amaçlı adım maliyeti (hedef düğümün maliyeti dahil)
+        head = topo.indices
+        steps = np.column_stack((
+            topo.arc_step_delay,
+            topo.link_rel_cost + topo.node_rel_cost[head],
+            topo.bw_cost,
+        ))
+        usable = (topo.bandwidth >= self.demand).tolist()
+        steps = steps.tolist()
+
+        # Hedef düğümün kendi maliyeti yola dahil edilmez
+        t_delay = float(topo.proc_delay[target])
+        t_rel = float(topo.node_rel_cost[target])
+
+        # Etiket kayıtları: maliyet vektörü, düğüm, önceki etiket
+        lab_cost = [(0.0, 0.0, 0.0)]
+        lab_node = [source]
+        lab_pred = [-1]
+        alive = [True]
+        node_labels = [[] for _ in range(topo.num_nodes)]  # Düğümdeki baskılanmamış etiketler
+        node_labels[source].append(0)
+
+        front = []  # Hedefe ulaşan kalıcı etiketlerin (maliyet, etiket) listesi
+        heap = [(0.0, 0)]
+        self.complete = True
+
+        def dominated(c, label_ids):
+            d, r, b = c
+            for k in label_ids:
+                kd, kr, kb = lab_cost[k]
+                if kd <= d and kr <= r and kb <= b:
+                    return True
+            return False
+
+        while heap:
+            _, lab = heapq.heappop(heap)
+            if not alive[lab]:
+                continue
+            u = lab_node[lab]
+            cu = lab_cost[lab]
+
+            if u == target:
+                front.append(((cu[0] - t_delay, cu[1] - t_rel, cu[2]), lab))
+                continue
+
+            for a in range(indptr[u], indptr[u + 1]):
+                if not usable[a]:
+                    continue
+                v = indices[a]
+                sd, sr, sb = steps[a]
+                c = (cu[0] + sd, cu[1] + sr, cu[2] + sb)
+
+                # Hedefteki bir çözüm bu kısmi yolu zaten baskılıyorsa uzatmaya gerek yok
+                fc = (c[0] - t_delay, c[1] - t_rel, c[2]) if v == target else c
+                if any(fd <= fc[0] and fr <= fc[1] and fb <= fc[2] for (fd, fr, fb), _ in front):
+                    continue
+                if dominated(c, node_labels[v]):
+                    continue
+
+                # Yeni etiketin baskıladığı (henüz kalıcı olmayan) etiketleri at
+                kept = []
+                for k in node_labels[v]:
+                    kd, kr, kb = lab_cost[k]
+                    if c[0] <= kd and c[1] <= kr and c[2] <= kb:
+                        alive[k] = False
+                    else:
+                        kept.append(k)
+                new = len(lab_cost)
+                kept.append(new)
+                node_labels[v] = kept
+
+                lab_cost.append(c)
+                lab_node.append(v)
+                lab_pred.append(lab)
+                alive.append(True)
+                heapq.heappush(heap, (c[0] + c[1] + c[2], new))
+
+            if self.max_labels is not None and len(lab_cost) > self.max_labels:
+                self.complete = False
+                break
+
+        self.num_labels = len(lab_cost)
+
+        objectives = []
+        paths = []
+        for cost, lab in front:
+            path = []
+            while lab != -1:
+                path.append(lab_node[lab])
+                lab = lab_pred[lab]
+            path.reverse()
+            objectives.append(cost)
+            paths.append(topo.to_ids(path))
+
+        return ParetoFront(objectives, paths)
+
+
+#  ANA CALISTIRMA BLOGU
+if __name__ == "__main__":
+    from ..experiment.demand_stream import iter_demands
+
+    print("\n--- PARETO CEPHESI (KESIN) SONUCLARI ---\n")
+
+    G = gg.graf_uret()
+    # Talep Dosyasını (DemandData) satır satır oku; dosya belleğe toplu alınmaz
+    DEMAND_FILE = os.path.join(gg.DATA_DIR, "DemandData.xlsx")
+
+    header = f"{'No':<4} {'Src':<6} {'Dst':<6} {'Talep':<8} {'Cephe':<7} {'Etiket':<9} {'Cozum(ms)':<10} {'Secim(us)':<10}"
+    print(header)
+    print("-" * 70)
+
+    weights = (0.33, 0.33, 0.34)
+    for index, (_, S, D, B) in enumerate(iter_demands(DEMAND_FILE)):
+        start = time.perf_counter()
+        solver = ParetoLabelSetting(G, S, D, B)
+        front = solver.run()
+        solve_ms = (time.perf_counter() - start) * 1000
+
+        # Ağırlık değişince yeniden çözmeden seçim
+        start = time.perf_counter()
+        path, cost, _ = front.best(weights)
+        pick_us = (time.perf_counter() - start) * 1e6
+
+        print(f"{index+1:<4} {S:<6} {D:<6} {B:<8} {len(front):<7} {solver.num_labels:<9} {solve_ms:<10.1f} {pick_us:<10.1f}")
+        if path and index == 0:
+            check = mt.evaluate_path(G, path, weights).total
+            print(f"     Ornek secim: {path} maliyet={cost:.4f} (evaluate_path: {check:.4f})")
@@ -1,36 +1,44 @@
 import numpy as np
 import random
+import time
 import networkx as nx
 from ..generation import generate_graf 
-from ..core import Metrics       
+from ..core.compiled import CompiledTopology
 
 class QLearningAgent:
-    def __init__(self, start_node, goal_node, G=None, alpha=0.1, gamma=0.9, epsilon=0.1, episodes=1000):
+    def __init__(self, start_node, goal_node, G=None, alpha=0.1, gamma=0.9, epsilon=0.1, episodes=1000, time_limit=None, stop=None):
         
         if G is None:
             print("Graf yükleniyor...")
             self.G = generate_graf.graf_uret()
         else:
             self.G = G
-            
-        self.nodes = list(self.G.nodes())
 
-        self.num_nodes = len(self.nodes)
+        # Komşuluklar ve metrikler derlenmiş CSR topolojisinden okunur.
+        # Q-tablosu yoğun düğüm indeksleriyle adreslenir.
+        self.topo = CompiledTopology.of(self.G)
+        self.nodes = self.topo.nodes()
+
+        self.num_nodes = self.topo.num_nodes
         
         self.start_node = start_node
         self.goal_node = goal_node
+        self._start_idx = self.topo.index_of(start_node)
+        self._goal_idx = self.topo.index_of(goal_node)
         
         # Hyperparameters
         self.alpha = alpha
         self.gamma = gamma
         self.epsilon = epsilon
         self.episodes = episodes
+        self.time_limit = time_limit  # Seconds; training stops early when exceeded (None: no limit)
+        self.stop = stop  # Event (threading / multiprocessing); training stops at the next step once set
         
         self.q_table = np.zeros((self.num_nodes, self.num_nodes))
 
     def get_valid_actions(self, current_node):
-        """Bir düğümden gidilebilecek komşuları döndürür"""
-        return list(self.G.neighbors(current_node))
+        """Bir düğümden (indeks) gidilebilecek komşu indekslerini döndürür"""
+        return self.topo.indices[self.topo.arc_slice(current_node)]
 
     def calculate_reward(self, path):
         """
@@ -40,17 +48,10 @@ class QLearningAgent:
         if not path or path[-1] != self.goal_node:
             return 0.1 
         
-        w_delay = 0.33
-        w_rel = 0.33
-        w_res = 0.34
+        weights = (0.33, 0.33, 0.34)  # (delay, reliability, resource)
         
-        total_delay = Metrics.Total_Delay(self.G, path)
-        rel_cost = Metrics.Total_Reliability(self.G, path)
-        res_cost = Metrics.Total_Bandwidth(self.G, path)
-        
-        total_cost = (w_delay * total_delay) + \
-                     (w_rel * rel_cost) + \
-                     (w_res * res_cost)
+        # Weighted per-edge costs are shared through the topology's cost cache
+        total_cost = self.topo.edge_costs(weights).path_cost(self.topo, path)
         
         if total_cost == 0: total_cost = 0.001
         
@@ -64,33 +65,40 @@ class QLearningAgent:
         decay_rate = 0.005 # Adjust based on episodes
         
         current_epsilon = start_epsilon
+        deadline = time.monotonic() + self.time_limit if self.time_limit is not None else None
+        
+        def expired():
+            # Checked every step: an episode can take up to 2 * num_nodes steps
+            return (deadline is not None and time.monotonic() >= deadline) or \
+                (self.stop is not None and self.stop.is_set())
         
         for episode in range(self.episodes):
-            current_node = self.start_node
+            if expired():
+                break
+            current_node = self._start_idx
             
             # Max steps to prevent infinite loops during training
             for _ in range(self.num_nodes * 2):
-                if current_node == self.goal_node:
+                if current_node == self._goal_idx or expired():
                     break
                 
                 actions = self.get_valid_actions(current_node)
-                if not actions:
+                if len(actions) == 0:
                     break 
                 
                 # Epsilon-Greedy Action Selection
                 if random.uniform(0, 1) < current_epsilon:
-                    next_node = random.choice(actions) 
+                    next_node = int(random.choice(actions))
                 else:
-                    q_values = [self.q_table[current_node, n] for n in actions]
-                    max_q = max(q_values)
+                    q_values = self.q_table[current_node, actions]
                     # Handle ties randomly
-                    best_candidates = [actions[i] for i in range(len(actions)) if q_values[i] == max_q]
-                    next_node = random.choice(best_candidates)
+                    best_candidates = actions[q_values == q_values.max()]
+                    next_node = int(random.choice(best_candidates))
                 
                 # Observe next state max Q
                 next_actions = self.get_valid_actions(next_node)
-                if next_actions:
-                    max_future_q = np.max([self.q_table[next_node, n] for n in next_actions])
+                if len(next_actions):
+                    max_future_q = self.q_table[next_node, next_actions].max()
                 else:
                     max_future_q = 0
                 
@@ -98,7 +106,7 @@ class QLearningAgent:
                 # Note: This is simplified. True Q-learning usually rewards strictly on transitions.
                 # Here we give a big sparse reward at the goal.
                 reward = 0
-                if next_node == self.goal_node:
+                if next_node == self._goal_idx:
                      # Calculate full path reward only at goal? 
                      # For Q-learning efficiency in sparse graphs, we can give a small step penalty
                      reward = 100 # Immediate goal reward
@@ -116,36 +124,37 @@ class QLearningAgent:
 
     def get_best_path(self):
         """Eğitilmiş Q-Tablosunu kullanarak en iyi yolu çıkarır"""
-        path = [self.start_node]
-        current_node = self.start_node
-        visited = set([self.start_node])
+        path = [self._start_idx]
+        current_node = self._start_idx
+        visited = np.zeros(self.num_nodes, dtype=bool)
+        visited[current_node] = True
         
-        while current_node != self.goal_node:
+        while current_node != self._goal_idx:
             actions = self.get_valid_actions(current_node)
-            valid_actions = [n for n in actions if n not in visited]
+            valid_actions = actions[~visited[actions]]
             
-            if not valid_actions:
+            if len(valid_actions) == 0:
                 return None
             
             # Select best action based on Q-table
-            q_values = [self.q_table[current_node, n] for n in valid_actions]
+            q_values = self.q_table[current_node, valid_actions]
             
             # If all Q-values are 0, we haven't learned this path
-            if max(q_values) == 0:
+            if q_values.max() == 0:
                 # Fallback: Pick random unvisited to try and proceed, or fail?
                 # Failing is safer to indicate no confidence.
                 # return None 
                 # Let's try heuristic: pick neighbor with max bandwith or something?
                 # For now, just pick random to avoid strict failure if possible
-                best_next_node = random.choice(valid_actions)
+                best_next_node = int(random.choice(valid_actions))
             else:
-                best_next_node = valid_actions[np.argmax(q_values)]
+                best_next_node = int(valid_actions[np.argmax(q_values)])
             
             path.append(best_next_node)
-            visited.add(best_next_node)
+            visited[best_next_node] = True
             current_node = best_next_node
             
             if len(path) > self.num_nodes: 
                 return None
                 
-        return path
\ No newline at end of file
+        return self.topo.to_ids(path)
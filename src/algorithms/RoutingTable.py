@@ -0,0 +1,202 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ..generation import generate_graf as gg
+from ..core import Metrics as mt
+from ..core.compiled import CompiledTopology
+from ..core.edge_costs import weights_key
+from .Dijkstra import shortest_path_tree, INF
+
+# Havuz (pool) işçilerinin paylaştığı durum; her işçiye başlatıcıda bir kez gönderilir
+_worker_topo = None
+_worker_cost = None
+
+
+def _init_worker(topo, step_cost):
+    global _worker_topo, _worker_cost
+    _worker_topo = topo
+    _worker_cost = step_cost
+
+
+def _solve_sources(sources):
+    """İşçi görevi: verilen kaynak indeksleri için (mesafe, önceki düğüm) satırları."""
+    return _solve_rows(_worker_topo, _worker_cost, sources)
+
+
+def _solve_rows(topo, step_cost, sources):
+    _, _, arc_source = topo.csr_lists
+    dist_rows = np.empty((len(sources), topo.num_nodes))
+    pred_rows = np.empty((len(sources), topo.num_nodes), dtype=np.int32)
+    for row, s in enumerate(sources):
+        dist, pred_arc = shortest_path_tree(topo, s, step_cost)
+        dist_rows[row] = dist
+        pred_rows[row] = [arc_source[a] if a != -1 else -1 for a in pred_arc]
+    return dist_rows, pred_rows
+
+
+class RoutingTable:
+    """
+    Sabit bir (ağırlık, talep) çifti için önceden hesaplanmış yönlendirme tablosu.
+
+    Her kaynak satırı o kaynaktan çıkan en kısa yol ağacıdır:
+    - pred[r, t]: r. kaynaktan t'ye giden en iyi yolda t'den önceki düğüm indeksi (-1: yol yok / kaynak)
+    - cost[r, t]: Bu yolun ağırlıklı toplam maliyeti (Metrics ile aynı tanım, yol yoksa inf)
+
+    Ağırlıklı maliyet yay bazında toplamsal olduğu için tek bir Dijkstra ağacı o kaynağın
+    bütün hedefleri için optimumdur (DijkstraSolver ile aynı sonuç). Sorgu, yolu hedeften
+    geriye yürüyerek çıkarır; maliyeti O(yol uzunluğu).
+
+    Tablo save() ile bir dizine düz .npy dosyaları olarak yazılır ve load() ile
+    bellek eşlemeli (memory-mapped) açılır; büyük tablolar belleğe kopyalanmaz.
+    """
+
+    def __init__(self, node_ids, sources, pred, cost, weights, demand):
+        self.node_ids = np.asarray(node_ids)
+        self.sources = np.asarray(sources)
+        self.pred = pred
+        self.cost = cost
+        self.weights = weights_key(weights)
+        self.demand = float(demand)
+        self._node_index = {int(n): i for i, n in enumerate(self.node_ids.tolist())}
+        self._row_of = {int(s): r for r, s in enumerate(self.sources.tolist())}
+
+    @classmethod
+    def build(cls, G, weights, demand=0.0, sources=None, workers=None):
+        """
+        Tabloyu hesaplar.
+
+        Parametreler:
+        - G: Ağ topolojisi (NetworkX graf veya CompiledTopology)
+        - weights: Gecikme, Güvenilirlik ve Bant Genişliği ağırlıkları
+        - demand: Talep sınıfı (Bunu sağlamayan hatlar kullanılmaz)
+        - sources: Kaynak düğüm kimlikleri (None: bütün düğümler)
+        - workers: İşlem havuzu boyutu (None: CPU sayısı, 1: havuzsuz tek işlem)
+        """
+        topo = CompiledTopology.of(G)
+        table = topo.edge_costs(weights, demand)
+        source_ids = list(topo.node_ids) if sources is None else list(sources)
+        source_idx = topo.to_indices(source_ids).tolist()
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(source_idx)))
+
+        if workers == 1:
+            dist, pred = _solve_rows(topo, table.step_cost_list, source_idx)
+        else:
+            # Her işçiye eşit büyüklükte kaynak grupları
+            chunks = [c.tolist() for c in np.array_split(source_idx, workers * 4) if len(c)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(topo, table.step_cost_list)) as pool:
+                parts = list(pool.map(_solve_sources, chunks))
+            dist = np.vstack([d for d, _ in parts])
+            pred = np.vstack([p for _, p in parts])
+
+        # Yol maliyetine hedef düğümün kendi maliyeti dahil değildir; kaynaktan kendisine maliyet 0
+        cost = dist - table.node_cost[None, :]
+        cost[np.arange(len(source_idx)), source_idx] = 0.0
+        return cls(topo.node_ids, source_ids, pred, cost, table.weights, demand)
+
+    def __len__(self):
+        return len(self.sources)
+
+    def matches(self, weights, demand):
+        """Tablo bu (ağırlık, talep) için mi hesaplandı?"""
+        return self.weights == weights_key(weights) and self.demand == float(demand)
+
+    def lookup(self, S, D):
+        """
+        S->D için (yol, maliyet) döndürür; yol yoksa (None, inf).
+        S tabloda bir kaynak değilse KeyError.
+        """
+        row = self._row_of[S]
+        target = self._node_index[D]
+        total = float(self.cost[row, target])
+        if total == INF:
+            return None, INF
+
+        pred = self.pred[row]
+        path = [target]
+        node = int(pred[target])
+        while node != -1:
+            path.append(node)
+            node = int(pred[node])
+        path.reverse()
+        return self.node_ids[path].tolist(), total
+
+    def path(self, S, D):
+        return self.lookup(S, D)[0]
+
+    def save(self, directory):
+        """Tabloyu dizine yazar: pred.npy, cost.npy, node_ids.npy, sources.npy ve meta.json."""
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "pred.npy"), np.asarray(self.pred))
+        np.save(os.path.join(directory, "cost.npy"), np.asarray(self.cost))
+        np.save(os.path.join(directory, "node_ids.npy"), self.node_ids)
+        np.save(os.path.join(directory, "sources.npy"), self.sources)
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({'weights': list(self.weights), 'demand': self.demand}, f)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """save() ile yazılmış tabloyu açar; mmap=True ise büyük matrisler diskten eşlenir."""
+        mode = 'r' if mmap else None
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        return cls(
+            np.load(os.path.join(directory, "node_ids.npy")),
+            np.load(os.path.join(directory, "sources.npy")),
+            np.load(os.path.join(directory, "pred.npy"), mmap_mode=mode),
+            np.load(os.path.join(directory, "cost.npy"), mmap_mode=mode),
+            meta['weights'],
+            meta['demand'],
+        )
+
+
+#  ANA CALISTIRMA BLOGU
+if __name__ == "__main__":
+    import random
+    import tempfile
+    from .Dijkstra import DijkstraSolver
+
+    print("\n--- TUM CIFTLER YONLENDIRME TABLOSU ---\n")
+
+    G = gg.graf_uret()
+    weights = {'delay': 0.33, 'reliability': 0.33, 'bandwidth': 0.34}
+    demand = 100.0
+
+    for workers in (1, None):
+        start = time.perf_counter()
+        rt = RoutingTable.build(G, weights, demand, workers=workers)
+        print(f"Kurulum (workers={workers or os.cpu_count()}): {time.perf_counter() - start:.2f} s, {len(rt)} kaynak")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rt.save(tmp)
+        rt = RoutingTable.load(tmp)
+
+        nodes = list(G.nodes)
+        pairs = [(random.choice(nodes), random.choice(nodes)) for _ in range(200)]
+
+        start = time.perf_counter()
+        for S, D in pairs:
+            DijkstraSolver(G, S, D, demand, weights).run()
+        solve_us = (time.perf_counter() - start) / len(pairs) * 1e6
+
+        start = time.perf_counter()
+        for S, D in pairs:
+            rt.lookup(S, D)
+        lookup_us = (time.perf_counter() - start) / len(pairs) * 1e6
+
+        # Tablo ile tek tek çözümün aynı maliyeti verdiğini kontrol et
+        worst = 0.0
+        for S, D in pairs[:50]:
+            path, cost = rt.lookup(S, D)
+            if path and len(path) > 1:
+                worst = max(worst, abs(mt.evaluate_path(G, path, weights).total - cost))
+
+        print(f"Dijkstra sorgu basina: {solve_us:.1f} us | Tablo sorgu basina: {lookup_us:.1f} us")
+        print(f"En buyuk maliyet farki (evaluate_path ile): {worst:.6f}")
@@ -0,0 +1,177 @@
+import heapq
+import os
+import random
+import time
+
+from ..generation import generate_graf as gg
+from ..core import Metrics as mt
+from ..core.compiled import CompiledTopology
+from .Dijkstra import shortest_path_tree, path_from_tree, INF
+
+
+def k_shortest_paths(topo, source, target, arc_cost, k):
+    """
+    Yen algoritması: kaynaktan hedefe en kısa k adet döngüsüz (loopless) yol.
+
+    Parametreler:
+    - topo: CompiledTopology
+    - source, target: Düğüm indeksleri
+    - arc_cost: Yay maliyetleri (liste); inf olan yaylar kullanılmaz
+    - k: İstenen yol sayısı
+
+    Döndürdüğü değer: artan maliyet sırasıyla [(adım maliyeti toplamı, indeks yolu), ...]
+    (k'dan az yol varsa hepsi döner).
+    """
+    cost = list(arc_cost)  # Yerinde geçici olarak bloklanacak
+    reverse_arc = topo.reverse_arc.tolist()
+    indptr, _, _ = topo.csr_lists
+
+    dist, pred = shortest_path_tree(topo, source, cost, target)
+    if dist[target] == INF:
+        return []
+
+    first = path_from_tree(topo, pred, target)
+    found = [(dist[target], first)]
+    found_arcs = [topo.arcs(first[:-1], first[1:]).tolist()]
+    candidates = []          # (maliyet, yol) yığını
+    seen = {tuple(first)}
+
+    while len(found) < k:
+        last = found[-1][1]
+        last_arcs = found_arcs[-1]
+
+        # Sapma (spur) düğümü: son bulunan yolun hedef dışındaki her düğümü
+        root_cost = 0.0
+        for i in range(len(last) - 1):
+            spur = last[i]
+            root = last[:i + 1]
+
+            # Aynı kökü paylaşan bulunmuş yolların bir sonraki yayını kapat
+            blocked = {}
+            for (_, p), p_arcs in zip(found, found_arcs):
+                if len(p) > i + 1 and p[:i + 1] == root:
+                    a = p_arcs[i]
+                    blocked[a] = cost[a]
+            # Kökteki düğümlere (sapma düğümü hariç) girişi kapat: yol döngüsüz kalsın
+            for node in root[:-1]:
+                for a in range(indptr[node], indptr[node + 1]):
+                    r = reverse_arc[a]
+                    if r != -1 and r not in blocked:
+                        blocked[r] = cost[r]
+            for a in blocked:
+                cost[a] = INF
+
+            spur_dist, spur_pred = shortest_path_tree(topo, spur, cost, target)
+
+            for a, c in blocked.items():
+                cost[a] = c
+
+            if spur_dist[target] != INF:
+                path = root[:-1] + path_from_tree(topo, spur_pred, target)
+                key = tuple(path)
+                if key not in seen:
+                    seen.add(key)
+                    heapq.heappush(candidates, (root_cost + spur_dist[target], path))
+
+            root_cost += cost[last_arcs[i]]
+
+        if not candidates:
+            break
+        total, path = heapq.heappop(candidates)
+        found.append((total, path))
+        found_arcs.append(topo.arcs(path[:-1], path[1:]).tolist())
+
+    return found
+
+
+class KShortestPaths:
+    def __init__(self, G, S, D, demand, weights, k=5):
+        """
+        Ağırlıklı toplam maliyete göre en iyi k alternatif yol (Yen algoritması).
+        Yay maliyetleri DijkstraSolver ile aynı (ağırlık, talep) önbelleğinden okunur.
+
+        Hem tek başına "en iyi k rota" sorgusu olarak, hem de GA popülasyonu ve
+        ACO başlangıç feromonu için tohum (seed) yol üretici olarak kullanılır.
+
+        Parametreler:
+        - G: Ağ topolojisi (NetworkX graf veya CompiledTopology)
+        - S, D: Kaynak ve Hedef düğümler
+        - demand: İstenen bant genişliği (Bunu sağlamayan hatlar kullanılmaz)
+        - weights: Gecikme, Güvenilirlik ve Bant Genişliği ağırlıkları
+        - k: İstenen yol sayısı
+        """
+        self.G = G
+        self.topo = CompiledTopology.of(G)
+        self.S = S
+        self.D = D
+        self.demand = demand
+        self.weights = weights
+        self.k = k
+
+    def paths(self):
+        """Sadece yolları (düğüm kimlik listeleri) artan maliyet sırasıyla döndürür."""
+        topo = self.topo
+        table = topo.edge_costs(self.weights, self.demand)
+        found = k_shortest_paths(topo, topo.index_of(self.S), topo.index_of(self.D),
+                                 table.step_cost_list, self.k)
+        return [topo.to_ids(p) for _, p in found]
+
+    def run(self):
+        """
+        Döndürdüğü değer: [(yol, maliyet, metrikler), ...] artan maliyet sırasıyla.
+        Her eleman DijkstraSolver.run ile aynı biçimdedir; yol yoksa boş liste.
+        """
+        results = []
+        for path in self.paths():
+            pm = mt.evaluate_path(self.topo, path, self.weights)
+            results.append((path, pm.total, {'delay': pm.delay, 'rel_cost': pm.reliability, 'bw_cost': pm.bandwidth}))
+        return results
+
+
+#  ANA CALISTIRMA BLOGU
+if __name__ == "__main__":
+    from itertools import islice
+
+    from ..experiment.demand_stream import iter_demands
+    from .GeneticAlgorithm import genetic_algorithm
+
+    print("\n--- YEN K-EN KISA YOL SONUCLARI ---\n")
+
+    G = gg.graf_uret()
+    # Talep Dosyasını (DemandData) satır satır oku; dosya belleğe toplu alınmaz
+    DEMAND_FILE = os.path.join(gg.DATA_DIR, "DemandData.xlsx")
+
+    weights = {'delay': 0.33, 'reliability': 0.33, 'bandwidth': 0.34}
+    K = 5
+    print(f"Kullanilan Agirliklar: {weights} | K = {K}\n")
+
+    _, S, D, B = next(iter_demands(DEMAND_FILE))
+    start = time.perf_counter()
+    routes = KShortestPaths(G, S, D, B, weights, k=K).run()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{S} -> {D} (talep {B}) icin en iyi {len(routes)} yol, {elapsed:.1f} ms:")
+    for rank, (path, cost, metrics) in enumerate(routes, 1):
+        print(f"  {rank}. maliyet={cost:.4f} gecikme={metrics['delay']:.2f} yol={path}")
+
+    # GA: rastgele popülasyon ile K-en kısa yol tohumlu popülasyonun karşılaştırması
+    print("\n--- GA TOHUMLAMA KARSILASTIRMASI ---\n")
+    header = f"{'No':<4} {'Src':<6} {'Dst':<6} {'Rastgele(300 nesil)':<22} {'Sure(s)':<9} {'Tohumlu(20 nesil)':<20} {'Sure(s)':<9}"
+    print(header)
+    print("-" * 80)
+
+    for index, (_, S, D, B) in enumerate(islice(iter_demands(DEMAND_FILE), 5)):
+        w = (weights['delay'], weights['reliability'], weights['bandwidth'])
+
+        random.seed(index)
+        start = time.perf_counter()
+        path = genetic_algorithm(G, S, D, B, generations=300, w_delay=w[0], w_rel=w[1], w_band=w[2])
+        plain_time = time.perf_counter() - start
+        plain_cost = mt.evaluate_path(G, path, w).total
+
+        random.seed(index)
+        start = time.perf_counter()
+        path = genetic_algorithm(G, S, D, B, generations=20, w_delay=w[0], w_rel=w[1], w_band=w[2], seed_k=10)
+        seeded_time = time.perf_counter() - start
+        seeded_cost = mt.evaluate_path(G, path, w).total
+
+        print(f"{index+1:<4} {S:<6} {D:<6} {plain_cost:<22.4f} {plain_time:<9.2f} {seeded_cost:<20.4f} {seeded_time:<9.2f}")
@@ -1,6 +1,6 @@
 import networkx as nx
-import pandas as pd
 import random
+from ..core.costed_path import CostedPath
 # from ..generation.generate_graf import graf_uret # Imported only for type hinting or testing if needed
 
 # G = graf_uret() # REMOVED: Do not generate graph on import
@@ -140,6 +140,8 @@ def generate_neighbor_path(G, path, S, D):
     """
     Var olan path üzerinde küçük bir değişiklik yaparak
     SA için komşu yol üretir.
+    path bir CostedPath ise sonuç da CostedPath olur ve yalnızca
+    değişen kuyruk bölümü yeniden maliyetlendirilir.
     """
     
     if len(path) < 3:
@@ -153,6 +155,9 @@ def generate_neighbor_path(G, path, S, D):
     
     if completed is None:
         return path[:]
+
+    if isinstance(path, CostedPath):
+        return path.rebase(completed)
     
     return completed
 
@@ -0,0 +1,219 @@
+"""
+Headless batch router. Loads a topology, streams a demand file through one algorithm in
+parallel worker processes and writes one result row per demand. Qt is never imported.
+
+    python -m src.cli DEMANDS -o RESULTS [options]
+
+Examples:
+    python -m src.cli src/data/DemandData.xlsx -o results.csv
+    python -m src.cli demands.csv -o results.jsonl --algorithm aco -p num_ants=10 -p max_iter=5
+    python -m src.cli demands.csv -o results.csv --synthetic geometric 100000 --seed 1
+    python -m src.cli demands.csv -o results.csv --topology /data/topo --workers 16
+
+Topologies: the Excel data (default; the .npz table cache is used when valid), a directory
+written by core.topology_store (memory-mapped, see --save-topology), or a synthetic model.
+All of them are compiled straight to a CompiledTopology; no NetworkX graph is built.
+
+ch and alt build their index (contraction hierarchy / landmark tables) once per demand
+class in every worker: demands that exclude the same links share one index, but a file
+with many distinct demands still pays for many builds. -p demand_step=50 rounds demands
+up to multiples of 50 Mbps so they share indexes; the routes still meet each demand but
+may not be optimal for it. Otherwise use dijkstra, which has no index.
+"""
+import argparse
+import functools
+import os
+import random
+import sys
+import time
+
+# name -> (module, solver class, default parameters). Imported only for the chosen algorithm.
+ALGORITHMS = {
+    'dijkstra': ('src.algorithms.Dijkstra', 'DijkstraSolver', {}),
+    'ch': ('src.algorithms.ContractionHierarchy', 'CHSolver', {}),
+    'alt': ('src.algorithms.ALT', 'ALTSolver', {}),
+    'larac': ('src.algorithms.LARAC', 'LARACSolver', {'max_delay': 100.0}),
+    'aco': ('src.algorithms.ACO_Algorithm', 'AntColonyOptimizer', {}),
+    'ga': (__name__, 'GeneticSolver', {}),
+    'qlearning': (__name__, 'QLearningSolver', {}),
+}
+
+# Algorithms whose result depends on random draws; they are seeded per demand (SeededSolver)
+STOCHASTIC = {'aco', 'ga', 'qlearning'}
+
+
+class GeneticSolver:
+    """genetic_algorithm behind the (G, S, D, demand, weights).run() solver interface."""
+
+    def __init__(self, G, S, D, demand, weights, **params):
+        self.G, self.S, self.D, self.demand, self.weights, self.params = G, S, D, demand, weights, params
+
+    def run(self):
+        from .algorithms.GeneticAlgorithm import genetic_algorithm
+        from .core.edge_costs import weights_key
+        w_delay, w_rel, w_band = weights_key(self.weights)
+        path = genetic_algorithm(self.G, self.S, self.D, self.demand, w_delay=w_delay, w_rel=w_rel,
+                                 w_band=w_band, **self.params)
+        return path, None, {}
+
+
+class QLearningSolver:
+    """QLearningAgent behind the solver interface (the agent ignores the bandwidth demand)."""
+
+    def __init__(self, G, S, D, demand, weights, **params):
+        self.G, self.S, self.D, self.params = G, S, D, params
+
+    def run(self):
+        from .algorithms.QLearning import QLearningAgent
+        agent = QLearningAgent(self.S, self.D, self.G, **self.params)
+        agent.train()
+        return agent.get_best_path(), None, {}
+
+
+class SeededSolver:
+    """
+    Seeds `random` and `numpy.random` from (seed, S, D, demand) before building the solver,
+    so a stochastic algorithm gives the same result for a demand regardless of chunking,
+    worker count or the order in which workers pick up chunks.
+    """
+
+    def __init__(self, solver, seed):
+        self.solver = solver
+        self.seed = seed
+
+    def __call__(self, G, S, D, demand, weights):
+        import numpy as np
+        state = hash((self.seed, S, D, float(demand))) & 0xFFFFFFFF
+        random.seed(state)
+        np.random.seed(state)
+        return self.solver(G, S, D, demand, weights)
+
+
+def parse_param(text):
+    """'name=value' -> (name, value) with int / float / bool / str detection."""
+    name, sep, value = text.partition("=")
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"expected name=value, got {text!r}")
+    for convert in (int, float):
+        try:
+            return name, convert(value)
+        except ValueError:
+            pass
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return name, lowered == "true"
+    return name, value
+
+
+def load_topology(args):
+    """CompiledTopology for --topology / --synthetic (see module docstring)."""
+    from .core.compiled import CompiledTopology
+    if args.synthetic:
+        from .generation.synthetic_graf import sentetik_tablolar
+        model, n = args.synthetic
+        return CompiledTopology.from_tables(sentetik_tablolar(model, int(n), seed=args.seed))
+    if args.topology == "excel":
+        from .generation import generate_graf
+        return generate_graf.derlenmis_graf_uret(None if args.no_cache else generate_graf.CACHE_PATH)
+    from .core.topology_store import MappedTopology
+    return MappedTopology(args.topology).compiled()
+
+
+def resolve_solver(algorithm, params=None, seed=None):
+    """
+    Solver factory with the (G, S, D, demand, weights) interface for an ALGORITHMS name;
+    params override the defaults. Returns the plain class when there is nothing to bind,
+    so the Dijkstra tree-cache fast path in demand_stream still applies.
+    """
+    import importlib
+    module, name, defaults = ALGORITHMS[algorithm]
+    solver = getattr(importlib.import_module(module), name)
+    params = dict(defaults, **(params or {}))
+    if params:
+        solver = functools.partial(solver, **params)
+    if algorithm in STOCHASTIC and seed is not None:
+        solver = SeededSolver(solver, seed)
+    return solver
+
+
+def make_solver(args):
+    return resolve_solver(args.algorithm, dict(args.param), args.seed)
+
+
+def add_topology_arguments(parser):
+    """Topology source options shared by the batch router and the route service."""
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--topology", default="excel",
+                        help="'excel' (default) or a directory written by --save-topology")
+    source.add_argument("--synthetic", nargs=2, metavar=("MODEL", "NODES"),
+                        help="synthetic topology: geometric, waxman, ba, grid or torus")
+    parser.add_argument("--no-cache", action="store_true", help="read the Excel files, ignore the .npz cache")
+    parser.add_argument("--seed", type=int, help="seed for synthetic topologies and stochastic algorithms")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli", description="Route a demand file in batch, without the GUI.")
+    parser.add_argument("demands", help="demand file: .csv, .xlsx or .jsonl (src, dst, demand_mbps)")
+    parser.add_argument("-o", "--output", required=True, help="result file: .csv, .jsonl or .parquet")
+    parser.add_argument("-a", "--algorithm", choices=sorted(ALGORITHMS), default="dijkstra")
+    parser.add_argument("-w", "--weights", type=float, nargs=3, default=(0.33, 0.33, 0.34),
+                        metavar=("DELAY", "RELIABILITY", "BANDWIDTH"))
+    parser.add_argument("-p", "--param", type=parse_param, action="append", default=[],
+                        metavar="NAME=VALUE",
+                        help="solver parameter / budget, e.g. num_ants=10, max_iter=5, generations=500, "
+                             "episodes=2000, max_delay=80, time_limit=0.5 (seconds; aco, ga, "
+                             "qlearning), demand_step=50 (ch, alt) (repeatable)")
+    add_topology_arguments(parser)
+    parser.add_argument("--save-topology", metavar="DIR",
+                        help="also write the loaded topology as a memory-mapped directory")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: all CPUs; 1 routes in this process)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="demands per task (default: 5000, or 8 for the stochastic algorithms "
+                             "so that slow demands still spread over all workers)")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="chunks queued or running at once (default: 2 x workers)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress output")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if abs(sum(args.weights) - 1.0) > 1e-5:
+        print(f"error: weights must sum to 1 (got {sum(args.weights):.3f})", file=sys.stderr)
+        return 2
+
+    from .experiment.demand_stream import run_pipeline
+
+    def log(message, end="\n"):
+        if not args.quiet:
+            print(message, end=end, file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    topo = load_topology(args)
+    log(f"topology: {topo.num_nodes} nodes, {topo.num_arcs // 2} links "
+        f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+    if args.save_topology:
+        from .core.topology_store import save_topology
+        save_topology(topo, args.save_topology)
+        log(f"topology saved to {args.save_topology}")
+
+    def progress(stats):
+        log(f"\r{stats.demands} demands, {stats.throughput:,.0f}/s", end="")
+
+    workers = args.workers if args.workers is not None else (os.cpu_count() or 1)
+    chunk_size = args.chunk_size or (8 if args.algorithm in STOCHASTIC else 5000)
+    try:
+        stats = run_pipeline(args.demands, args.output, topo, tuple(args.weights), make_solver(args),
+                             chunk_size, workers, args.max_in_flight, progress)
+    except (OSError, ValueError, TypeError, ImportError) as e:
+        log("")
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    log(f"\r{args.algorithm}: {stats} ({workers} workers) -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
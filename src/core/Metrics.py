@@ -1,12 +1,20 @@
-import networkx as nx
+import numpy as np
+from dataclasses import dataclass
 from math import log,exp
-from ..generation import generate_graf as gg
+from .compiled import CompiledTopology
+from .edge_costs import weights_key
 
 
 def Total_Delay(G,path):
     """
         Verilen yolun toplam gecikmesini (Link + Node Processing) hesaplar.
+        G, nx.Graph veya CompiledTopology olabilir.
         """
+    if isinstance(G, CompiledTopology):
+        idx = G.to_indices(path)
+        TotalDelay = G.link_delay[G.checked_arcs(idx[:-1], idx[1:])].sum() + G.proc_delay[idx[1:-1]].sum()
+        return round(float(TotalDelay),4)
+
     TotalDelay = 0
 
     for i in range(len(path)-1):
@@ -25,6 +33,11 @@ def Total_Reliability(G,path):
         Not: Çarpım işlemini toplama çevirmek için -log dönüşümü kullanılmıştır.
         Düşük değer = Yüksek Güvenilirlik.
         """
+    if isinstance(G, CompiledTopology):
+        idx = G.to_indices(path)
+        TotalReliability = G.link_rel_cost[G.checked_arcs(idx[:-1], idx[1:])].sum() + G.node_rel_cost[idx[1:-1]].sum()
+        return round(float(TotalReliability),4)
+
     TotalReliability = 0
 
     for i in range(len(path)-1):
@@ -46,6 +59,8 @@ def Total_Bandwidth(G,path):
         Verilen yolun bant genişliği maliyetini hesaplar.
         OSPF mantığı (1000 / Bandwidth) kullanılmıştır.
         """
+    if isinstance(G, CompiledTopology):
+        return round(float(G.bw_cost[G.path_arcs(path)].sum()),4)
 
     ResourceCost=0
     for i in range(len(path)-1):
@@ -58,8 +73,178 @@ def Total_Bandwidth(G,path):
             ResourceCost+= (1000/bw)
     return round(ResourceCost,4)
 
+def Min_Bandwidth(G,path):
+    """
+        Yol üzerindeki darboğaz (en düşük) bant genişliğini döndürür.
+        Tek düğümlü yol için sonsuz döner.
+        """
+    if len(path) < 2:
+        return float('inf')
+
+    if isinstance(G, CompiledTopology):
+        return float(G.bandwidth[G.path_arcs(path)].min())
+
+    min_mbps=float('inf')
+    for i in range(len(path)-1):
+        mbps = G.edges[path[i],path[i+1]]["bandwidth_mbps"]
+        if mbps < min_mbps:
+            min_mbps = mbps
+    return min_mbps
+
+
+
+@dataclass
+class PathMetrics:
+    """evaluate_path sonucu: bir yolun tüm QoS metrikleri."""
+    delay: float          # Total_Delay karşılığı (ms)
+    reliability: float    # Total_Reliability karşılığı (-log maliyeti)
+    bandwidth: float      # Total_Bandwidth karşılığı (1000/bw maliyeti)
+    min_bandwidth: float  # Min_Bandwidth karşılığı (darboğaz, Mbps)
+    hops: int             # Kenar sayısı
+    total: float          # Ağırlıklı toplam maliyet (yuvarlanmamış metriklerden)
+
+def evaluate_path(G, path, weights):
+    """
+        Yolun tüm metriklerini tek geçişte hesaplar.
+        Total_Delay, Total_Reliability, Total_Bandwidth ve Min_Bandwidth'i art arda
+        çağırmakla aynı sonucu verir; her kenar ve düğüm yalnızca bir kez okunur.
+        weights: {'delay','reliability','bandwidth'} sözlüğü veya (w_d, w_r, w_b) demeti.
+        """
+    w_delay, w_rel, w_band = weights_key(weights)
+    hops = max(len(path)-1, 0)
+
+    if isinstance(G, CompiledTopology):
+        idx = G.to_indices(path)
+        arcs = G.checked_arcs(idx[:-1], idx[1:])
+        inner = idx[1:-1]
+        TotalDelay = G.link_delay[arcs].sum() + G.proc_delay[inner].sum()
+        TotalReliability = G.link_rel_cost[arcs].sum() + G.node_rel_cost[inner].sum()
+        ResourceCost = G.bw_cost[arcs].sum()
+        min_mbps = float(G.bandwidth[arcs].min()) if hops else float('inf')
+    else:
+        adj = G.adj
+        nodes = G.nodes
+        TotalDelay = 0
+        TotalReliability = 0
+        ResourceCost = 0
+        min_mbps = float('inf')
+
+        for i in range(hops):
+            edge = adj[path[i]][path[i+1]]
+            TotalDelay += edge["link_delay_ms"]
+
+            r_link = edge["link_reliability"]
+            if r_link <= 0: r_link = 0.0001
+            TotalReliability += (-1*log(r_link))
+
+            bw = edge["bandwidth_mbps"]
+            if bw <= 0:
+                ResourceCost += 100000 # High penalty for 0 bandwidth
+            else:
+                ResourceCost += (1000/bw)
+            if bw < min_mbps:
+                min_mbps = bw
+
+            # Ara düğüm (ilk ve son düğüm hariç)
+            if i > 0:
+                node = nodes[path[i]]
+                TotalDelay += node["processing_delay_ms"]
+                r_node = node["node_reliability"]
+                if r_node <= 0: r_node = 0.0001
+                TotalReliability += (-1*log(r_node))
+
+    # Toplam yuvarlanmamış metriklerden (Batch_Path_Costs ile aynı); yuvarlama sadece gösterilen metriklerde
+    total = float((w_delay*TotalDelay) + (w_rel*TotalReliability) + (w_band*ResourceCost))
+    TotalDelay = round(float(TotalDelay),4)
+    TotalReliability = round(float(TotalReliability),4)
+    ResourceCost = round(float(ResourceCost),4)
+
+    return PathMetrics(TotalDelay, TotalReliability, ResourceCost, min_mbps, hops, total)
+
+@dataclass
+class BatchPathCosts:
+    """Batch_Path_Costs sonucu: her alan, yol sayısı uzunluğunda bir dizidir."""
+    delay: np.ndarray          # Total_Delay karşılığı
+    reliability: np.ndarray    # Total_Reliability karşılığı
+    bandwidth: np.ndarray      # Total_Bandwidth karşılığı
+    min_bandwidth: np.ndarray  # Min_Bandwidth karşılığı (darboğaz)
+    total: np.ndarray          # Ağırlıklı toplam maliyet
+
+def Flatten_Paths(paths):
+    """
+        Düzensiz (ragged) yol listesini tek düz düğüm dizisine ve ofsetlere çevirir.
+        Örn: [[0,5,7],[0,9]] -> flat=[0,5,7,0,9], offsets=[0,3,5]
+        """
+    lengths = np.fromiter((len(p) for p in paths), dtype=np.int64, count=len(paths))
+    offsets = np.zeros(len(paths)+1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = np.fromiter((n for p in paths for n in p), dtype=np.int64, count=int(offsets[-1]))
+    return flat, offsets
+
+def _segment_reduce(ufunc, values, counts, empty):
+    """
+        values dizisini ardışık segmentlere (uzunlukları counts) bölüp
+        her segmenti ufunc.reduceat ile indirger. Boş segmentler 'empty' alır.
+        """
+    out = np.full(len(counts), empty, dtype=np.float64)
+    nonempty = counts > 0
+    if nonempty.any():
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[nonempty]
+        out[nonempty] = ufunc.reduceat(values, starts)
+    return out
+
+def Batch_Path_Costs(G, flat_nodes, offsets, w_delay=0.33, w_rel=0.33, w_band=0.34, demand=0.0):
+    """
+        Bir yol kümesinin (ör. GA popülasyonu) tüm metriklerini tek NumPy geçişinde hesaplar.
+        Yollar Flatten_Paths biçiminde verilir (düz düğüm dizisi + ofsetler).
+        Metrikler tekil fonksiyonlarla aynı şekilde 4 basamağa yuvarlanır.
+        Ağırlıklı toplam, topolojinin (ağırlık, talep) önbelleğindeki yay maliyetlerinden
+        okunur ve evaluate_path.total gibi yuvarlanmaz; talebi (demand) karşılamayan yollar
+        için sonsuzdur.
+        """
+    G = CompiledTopology.of(G)
+    idx = G.to_indices(flat_nodes)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    lengths = np.diff(offsets)
+
+    # Ardışık düğüm çiftlerinden, yol sınırını aşmayanlar birer yaydır
+    is_start = np.zeros(len(idx), dtype=bool)
+    is_start[offsets[:-1][lengths > 0]] = True
+    pair = ~is_start[1:]
+    arcs = G.checked_arcs(idx[:-1][pair], idx[1:][pair])
+
+    # Ara düğümler: her yolun ilk ve son düğümü hariç
+    is_end = np.zeros(len(idx), dtype=bool)
+    is_end[offsets[1:][lengths > 0] - 1] = True
+    interior = idx[~is_start & ~is_end]
+
+    arc_counts = np.maximum(lengths - 1, 0)
+    node_counts = np.maximum(lengths - 2, 0)
+
+    delay = _segment_reduce(np.add, G.link_delay[arcs], arc_counts, 0.0) + \
+            _segment_reduce(np.add, G.proc_delay[interior], node_counts, 0.0)
+    reliability = _segment_reduce(np.add, G.link_rel_cost[arcs], arc_counts, 0.0) + \
+                  _segment_reduce(np.add, G.node_rel_cost[interior], node_counts, 0.0)
+    bandwidth = _segment_reduce(np.add, G.bw_cost[arcs], arc_counts, 0.0)
+    min_bandwidth = _segment_reduce(np.minimum, G.bandwidth[arcs], arc_counts, np.inf)
+
+    table = G.edge_costs((w_delay, w_rel, w_band), demand)
+    last = idx[offsets[1:][lengths > 0] - 1]
+    total = np.zeros(len(lengths))
+    total[lengths > 0] = -table.node_cost[last]
+    total[lengths == 1] = 0.0
+    total += _segment_reduce(np.add, table.step_cost[arcs], arc_counts, 0.0)
+
+    delay = np.round(delay, 4)
+    reliability = np.round(reliability, 4)
+    bandwidth = np.round(bandwidth, 4)
+
+    return BatchPathCosts(delay, reliability, bandwidth, min_bandwidth, total)
 
 if __name__ == "__main__":
+    import networkx as nx
+    from ..generation import generate_graf as gg
+
     print("--- METRİK HESAPLAMA TESTİ BAŞLIYOR ---\n")
 
     # 1. Grafı Oluştur
@@ -89,9 +274,35 @@ if __name__ == "__main__":
         bant_maliyeti = Total_Bandwidth(G, ornek_yol)
         print(f"3. Bant Genişliği Maliyeti: {bant_maliyeti}")
 
+        # --- TEST D: TEK GEÇİŞTE TÜM METRİKLER ---
+        pm = evaluate_path(G, ornek_yol, (0.33, 0.33, 0.34))
+        print(f"4. evaluate_path: {pm}")
+
         print("-" * 30)
         print("✅ TEST BAŞARIYLA TAMAMLANDI. Kodların hatasız çalışıyor.")
 
+        # --- MİKRO KIYASLAMA: rastgele yollar üzerinde ayrı çağrılar vs. tek geçiş ---
+        import random, time
+        from ..algorithms import path_utilities as pu
+        random.seed(0)
+        yollar = []
+        while len(yollar) < 2000:
+            s, d = random.sample(list(G.nodes), 2)
+            p = pu.generate_random_path(G, s, d)
+            if p: yollar.append(p)
+
+        start = time.perf_counter()
+        for p in yollar:
+            Total_Delay(G, p); Total_Reliability(G, p); Total_Bandwidth(G, p); Min_Bandwidth(G, p)
+        ayri = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for p in yollar:
+            evaluate_path(G, p, (0.33, 0.33, 0.34))
+        tek = time.perf_counter() - start
+        print(f"\nMikro kıyaslama ({len(yollar)} yol): ayrı çağrılar {ayri*1000:.1f} ms, "
+              f"evaluate_path {tek*1000:.1f} ms (x{ayri/tek:.2f})")
+
     except nx.NetworkXNoPath:
         print("❌ Hata: Seçilen düğümler arasında yol yok. Seed değiştirip tekrar dene.")
     except KeyError as e:
@@ -0,0 +1,437 @@
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List
+from .edge_costs import EdgeCostCache, EdgeCostTable
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# Derlenmiş topolojinin nx.Graph içinde saklandığı anahtar (G.graph[...])
+_CACHE_KEY = "_compiled_topology"
+
+# Topoloji başına saklanan hızlandırma dizini sayısı (ALT yer imleri, CH). Talepleri karışık
+# gelen toplu yönlendirmede dizin her talep değişiminde yeniden kurulmasın diye birden fazla.
+INDEX_CACHE_SIZE = 4
+
+# Topolojiyi tamamen tanımlayan diziler (türetilmişler dahil); from_columns bunlardan
+# hesaplama yapmadan kurar, core.topology_store bunları diske yazar
+ARRAY_ATTRIBUTES = (
+    "node_ids", "indptr", "indices", "link_delay", "bandwidth", "proc_delay",
+    "link_rel_cost", "node_rel_cost", "bw_cost", "arc_source", "arc_keys", "reverse_arc", "_lookup",
+)
+
+
+def reliability_cost(r):
+    """-log(r); log(0) hatasını önlemek için Metrics ile aynı güvenli alt sınır (0.0001)."""
+    r = np.asarray(r, dtype=np.float64)
+    return -np.log(np.where(r <= 0, 0.0001, r))
+
+
+def bandwidth_cost(bw):
+    """1000 / bw; bw <= 0 ise Metrics ile aynı 100000 cezası."""
+    bw = np.asarray(bw, dtype=np.float64)
+    with np.errstate(divide="ignore"):
+        return np.where(bw <= 0, 100000.0, 1000.0 / bw)
+
+
+class IndexCache:
+    """(ağırlık, talep) anahtarlı dizinlerin küçük LRU önbelleği (en fazla max_entries girdi)."""
+
+    def __init__(self, max_entries=INDEX_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        index = self._entries.get(key)
+        if index is not None:
+            self._entries.move_to_end(key)
+        return index
+
+    def put(self, key, index):
+        self._entries[key] = index
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)  # En eski kullanılanı çıkar
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CompiledTopology:
+    """
+    nx.Graph'ın dizi tabanlı (CSR) ve salt-okunur bir anlık görüntüsü.
+
+    Düğüm kimlikleri 0..n-1 aralığında yoğun int32 indekslere çevrilir.
+    Komşuluk CSR biçiminde tutulur: i düğümünün yayları (arc)
+    indptr[i]:indptr[i+1] aralığındadır ve indices[...] komşu indekslerini verir.
+    Yönsüz her kenar iki yay olarak (u->v ve v->u) saklanır.
+
+    Yay dizileri (uzunluk = yay sayısı):
+    - link_delay:     Hat gecikmesi (ms)
+    - link_rel_cost:  -log(hat güvenilirliği)
+    - bw_cost:        1000 / bant genişliği (bw <= 0 ise 100000 ceza)
+    - bandwidth:      Ham bant genişliği (Mbps)
+
+    Düğüm dizileri (uzunluk = düğüm sayısı):
+    - proc_delay:     İşleme gecikmesi (ms)
+    - node_rel_cost:  -log(düğüm güvenilirliği)
+
+    networkx arayüzünün küçük bir alt kümesini (neighbors, has_edge,
+    number_of_nodes ...) taklit eder; böylece path_utilities gibi
+    modüller nx.Graph yerine bunu da kullanabilir.
+    """
+
+    def __init__(self, node_ids, indptr, indices, link_delay, link_reliability,
+                 bandwidth, proc_delay, node_reliability):
+        self.node_ids = np.asarray(node_ids, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+
+        self.link_delay = np.asarray(link_delay, dtype=np.float64)
+        self.bandwidth = np.asarray(bandwidth, dtype=np.float64)
+        self.proc_delay = np.asarray(proc_delay, dtype=np.float64)
+
+        self.link_rel_cost = reliability_cost(link_reliability)
+        self.node_rel_cost = reliability_cost(node_reliability)
+        self.bw_cost = bandwidth_cost(self.bandwidth)
+
+        self.num_nodes = len(self.node_ids)
+        self.num_arcs = len(self.indices)
+
+        # Yay sahibi (kaynak) indeksleri ve sıralı yay anahtarları (u*n + v).
+        # CSR satırları sıralı olduğu için anahtarlar da global olarak sıralıdır,
+        # bu sayede (u, v) -> yay eşlemesi searchsorted ile vektörel yapılır.
+        self.arc_source = np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.indptr))
+        self.arc_keys = self.arc_source.astype(np.int64) * self.num_nodes + self.indices
+
+        # Her yayın ters yönü (v->u); feromon gibi simetrik güncellemeler için.
+        # Ters yayı olmayan yaylarda (yönlü graf) -1; kullananlar bunları atlamalıdır.
+        reverse_keys = self.indices.astype(np.int64) * self.num_nodes + self.arc_source
+        pos = np.searchsorted(self.arc_keys, reverse_keys)
+        found = pos < self.num_arcs
+        found[found] = self.arc_keys[pos[found]] == reverse_keys[found]
+        self.reverse_arc = np.where(found, pos, -1)
+
+        # Kimlik -> indeks eşlemesi (kimlikler negatif olmayan tamsayılar)
+        max_id = int(self.node_ids.max()) if self.num_nodes else -1
+        self._lookup = np.full(max_id + 1, -1, dtype=np.int64)
+        self._lookup[self.node_ids] = np.arange(self.num_nodes)
+        self._init_state()
+
+    @classmethod
+    def from_columns(cls, columns, fingerprint=None) -> 'CompiledTopology':
+        """
+        ARRAY_ATTRIBUTES dizilerinden hiçbir şey hesaplamadan ve kopyalamadan kurar.
+        Diziler numpy.memmap olabilir (bkz. core.topology_store); böylece aynı dosyayı
+        açan süreçler bellek sayfalarını paylaşır.
+        """
+        self = cls.__new__(cls)
+        for name in ARRAY_ATTRIBUTES:
+            setattr(self, name, columns[name])
+        self.num_nodes = len(self.node_ids)
+        self.num_arcs = len(self.indices)
+        self._init_state()
+        self._fingerprint = fingerprint
+        return self
+
+    def _init_state(self):
+        self.is_identity = bool(np.array_equal(self.node_ids, np.arange(self.num_nodes)))
+
+        # Python döngüleri için komşu listeleri/kümeleri (orijinal kimliklerle), tembel
+        self._neighbor_lists = None
+        self._neighbor_sets = None
+        self._csr_lists = None
+        self._arc_step_delay = None
+        self._bandwidth_levels = None
+        self._fingerprint = None
+        self.landmark_indexes = IndexCache()  # ALT yer imi (landmark) dizinleri; ALT.LandmarkIndex.of
+        self.hierarchies = IndexCache()  # Kontraksiyon hiyerarşileri; ContractionHierarchy.of
+
+        # (ağırlık, talep) anahtarlı yay maliyet tabloları; topolojiye bağlıdır,
+        # yeniden derlemede (invalidate) onunla birlikte atılır
+        self.edge_cost_cache = EdgeCostCache(self)
+
+    # --- Kurulum ---
+
+    @staticmethod
+    def from_nx_graph(G: 'nx.Graph') -> 'CompiledTopology':
+        """
+        generate_graf.graf_uret()'ten gelen ham NetworkX grafından derler.
+        Eksik öznitelikler NetworkTopology.from_nx_graph ile aynı varsayılanları alır.
+        """
+        node_ids = np.fromiter(G.nodes(), dtype=np.int64, count=G.number_of_nodes())
+        order = np.argsort(node_ids, kind="stable")
+        node_ids = node_ids[order]
+        n = len(node_ids)
+
+        proc_delay = np.empty(n)
+        node_rel = np.empty(n)
+        for i, node_id in enumerate(node_ids.tolist()):
+            data = G.nodes[node_id]
+            proc_delay[i] = data.get('processing_delay_ms', 0.0)
+            node_rel[i] = data.get('node_reliability', 1.0)
+
+        m = G.number_of_edges()
+        src = np.empty(m, dtype=np.int64)
+        dst = np.empty(m, dtype=np.int64)
+        bw = np.empty(m)
+        delay = np.empty(m)
+        rel = np.empty(m)
+        for k, (u, v, data) in enumerate(G.edges(data=True)):
+            src[k] = u
+            dst[k] = v
+            bw[k] = data.get('bandwidth_mbps', 100.0)
+            delay[k] = data.get('link_delay_ms', 5.0)
+            rel[k] = data.get('link_reliability', 1.0)
+
+        return CompiledTopology._from_edge_arrays(
+            node_ids, proc_delay, node_rel, src, dst, bw, delay, rel,
+            directed=G.is_directed()
+        )
+
+    @staticmethod
+    def from_tables(t) -> 'CompiledTopology':
+        """
+        generate_graf sütun tablolarından (node_id, s_ms, r_node, src, dst, capacity_mbps,
+        delay_ms, r_link) doğrudan derler; arada NetworkX grafı kurulmaz.
+        Aynı kenar birden çok kez verilmişse NetworkX'teki gibi sonuncusu geçerlidir.
+        """
+        node_ids = np.asarray(t['node_id']).astype(np.int64)
+        order = np.argsort(node_ids, kind="stable")
+        src = np.asarray(t['src']).astype(np.int64)
+        dst = np.asarray(t['dst']).astype(np.int64)
+
+        # Yönsüz tekrarları at (son geçen kalır)
+        span = int(max(node_ids.max(), src.max(), dst.max())) + 1 if len(src) else 1
+        key = np.minimum(src, dst) * span + np.maximum(src, dst)
+        _, last = np.unique(key[::-1], return_index=True)
+        keep = np.sort(len(key) - 1 - last)
+
+        return CompiledTopology._from_edge_arrays(
+            node_ids[order],
+            np.asarray(t['s_ms'], dtype=np.float64)[order],
+            np.asarray(t['r_node'], dtype=np.float64)[order],
+            src[keep], dst[keep],
+            np.asarray(t['capacity_mbps'], dtype=np.float64)[keep],
+            np.asarray(t['delay_ms'], dtype=np.float64)[keep],
+            np.asarray(t['r_link'], dtype=np.float64)[keep],
+        )
+
+    @staticmethod
+    def from_topology(topology) -> 'CompiledTopology':
+        """core.model.NetworkTopology nesnesinden derler."""
+        nodes = sorted(topology.get_nodes(), key=lambda nd: nd.id)
+        links = topology.get_links()
+        return CompiledTopology._from_edge_arrays(
+            np.array([nd.id for nd in nodes], dtype=np.int64),
+            np.array([nd.processing_delay for nd in nodes], dtype=np.float64),
+            np.array([nd.reliability for nd in nodes], dtype=np.float64),
+            np.array([l.source for l in links], dtype=np.int64),
+            np.array([l.target for l in links], dtype=np.int64),
+            np.array([l.bandwidth for l in links], dtype=np.float64),
+            np.array([l.delay for l in links], dtype=np.float64),
+            np.array([l.reliability for l in links], dtype=np.float64),
+        )
+
+    @staticmethod
+    def _from_edge_arrays(node_ids, proc_delay, node_rel, src, dst, bw, delay, rel, directed=False):
+        """Kenar sütunlarından CSR yapısını kurar (node_ids sıralı olmalıdır)."""
+        n = len(node_ids)
+        lookup = np.full(int(node_ids.max()) + 1 if n else 0, -1, dtype=np.int64)
+        lookup[node_ids] = np.arange(n)
+        u = lookup[src]
+        v = lookup[dst]
+
+        if not directed:
+            # Yönsüz kenarı iki yay olarak ekle
+            u, v = np.concatenate([u, v]), np.concatenate([v, u])
+            bw = np.concatenate([bw, bw])
+            delay = np.concatenate([delay, delay])
+            rel = np.concatenate([rel, rel])
+
+        order = np.lexsort((v, u))
+        u, v = u[order], v[order]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(u, minlength=n), out=indptr[1:])
+
+        return CompiledTopology(node_ids, indptr, v, delay[order], rel[order], bw[order],
+                                proc_delay, node_rel)
+
+    @staticmethod
+    def of(G) -> 'CompiledTopology':
+        """
+        Verilen graf için derlenmiş topolojiyi döndürür.
+        Zaten derlenmişse aynen döner; nx.Graph ise bir kez derlenip G.graph içinde saklanır.
+        Graf yerinde değiştirilirse invalidate(G) çağrılmalıdır.
+        """
+        if isinstance(G, CompiledTopology):
+            return G
+        if hasattr(G, "compiled"):
+            return G.compiled()  # Diskten eşlenmiş topoloji (topology_store.MappedTopology)
+        compiled = G.graph.get(_CACHE_KEY)
+        if compiled is None:
+            compiled = CompiledTopology.from_nx_graph(G)
+            G.graph[_CACHE_KEY] = compiled
+        return compiled
+
+    @staticmethod
+    def invalidate(G):
+        """
+        nx.Graph üzerinde saklanan derlenmiş kopyayı (ve ona bağlı maliyet
+        önbelleğini) siler. Derlenmiş bir topoloji verilirse yalnızca önbelleği temizlenir.
+        """
+        if isinstance(G, CompiledTopology):
+            G.edge_cost_cache.clear()
+        else:
+            G.graph.pop(_CACHE_KEY, None)
+
+    def edge_costs(self, weights, demand=0.0) -> EdgeCostTable:
+        """Verilen ağırlık ve talep için önbellekten yay maliyet tablosunu döndürür."""
+        return self.edge_cost_cache.get(weights, demand)
+
+    def demand_class(self, demand) -> float:
+        """
+        Talebi, aynı yayları eleyen en büyük talebe çevirir: talepten küçük olmayan en küçük
+        hat bant genişliği (talep en büyük bant genişliğini aşıyorsa talebin kendisi).
+        bandwidth < demand olan yaylar elendiği için aynı sınıftaki taleplerin maliyet
+        tabloları ve yolları birebir aynıdır; CH / ALT dizinleri talep başına değil sınıf
+        başına kurulur. RouteCache kovasından farkı: yaklaşık değil, kesindir.
+        """
+        if self._bandwidth_levels is None:
+            self._bandwidth_levels = np.unique(self.bandwidth)
+        levels = self._bandwidth_levels
+        i = int(np.searchsorted(levels, float(demand), side='left'))
+        return float(levels[i]) if i < len(levels) else float(demand)
+
+    @property
+    def arc_step_delay(self) -> np.ndarray:
+        """
+        Yay başına gecikme adımı: hat gecikmesi + hedef düğümün işlem gecikmesi.
+        Yol gecikmesi = adım toplamı - son düğümün işlem gecikmesi (Total_Delay ile aynı).
+        """
+        if self._arc_step_delay is None:
+            self._arc_step_delay = self.link_delay + self.proc_delay[self.indices]
+        return self._arc_step_delay
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Topolojinin içerik özeti (SHA-1). Diske yazılan türetilmiş tablolar (ör. ALT yer imleri)
+        bununla etiketlenir; farklı bir topolojiyle yüklenmeleri engellenir.
+        """
+        if self._fingerprint is None:
+            h = hashlib.sha1()
+            for arr in (self.node_ids, self.indptr, self.indices, self.link_delay,
+                        self.link_rel_cost, self.bandwidth, self.proc_delay, self.node_rel_cost):
+                h.update(np.ascontiguousarray(arr).tobytes())
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+    # --- İndeks dönüşümleri ---
+
+    def index_of(self, node_id) -> int:
+        """
+        Düğüm kimliğinin yoğun indeksi. Düğüm yoksa KeyError (nx.Graph'taki gibi);
+        -1 dönseydi NumPy onu son düğüm olarak okurdu.
+        """
+        if not self.has_node(node_id):
+            raise KeyError(f"Düğüm yok: {node_id}")
+        return int(self._lookup[node_id])
+
+    def to_indices(self, path) -> np.ndarray:
+        """Düğüm kimlik listesini yoğun indeks dizisine çevirir."""
+        arr = np.asarray(path, dtype=np.int64)
+        return arr if self.is_identity else self._lookup[arr]
+
+    def to_ids(self, idx_path) -> List[int]:
+        """İndeks dizisini orijinal düğüm kimliklerine çevirir."""
+        if self.is_identity:
+            return [int(i) for i in idx_path]
+        return self.node_ids[np.asarray(idx_path, dtype=np.int64)].tolist()
+
+    def arcs(self, u_idx, v_idx) -> np.ndarray:
+        """
+        (u, v) indeks çiftlerini yay indekslerine çevirir (vektörel).
+        Kenar yoksa -1 döner.
+        """
+        keys = np.asarray(u_idx, dtype=np.int64) * self.num_nodes + np.asarray(v_idx, dtype=np.int64)
+        pos = np.searchsorted(self.arc_keys, keys)
+        pos = np.minimum(pos, self.num_arcs - 1)
+        return np.where(self.arc_keys[pos] == keys, pos, -1)
+
+    def checked_arcs(self, u_idx, v_idx) -> np.ndarray:
+        """
+        arcs() ile aynı; ancak kenarlardan biri yoksa -1 döndürmek yerine ValueError verir
+        (nx grafındaki KeyError karşılığı). -1 ile indekslenen dizi sessizce son yayı okurdu.
+        """
+        arcs = self.arcs(u_idx, v_idx)
+        if (arcs < 0).any():
+            raise ValueError("Yol üzerinde grafta bulunmayan bir kenar var.")
+        return arcs
+
+    def path_arcs(self, path) -> np.ndarray:
+        """Düğüm kimlikleriyle verilen yolun ardışık yay indekslerini döndürür (kenar yoksa ValueError)."""
+        idx = self.to_indices(path)
+        return self.checked_arcs(idx[:-1], idx[1:])
+
+    def arc_slice(self, u_idx) -> slice:
+        return slice(int(self.indptr[u_idx]), int(self.indptr[u_idx + 1]))
+
+    # --- networkx uyumlu alt küme ---
+
+    @property
+    def neighbor_lists(self) -> List[List[int]]:
+        """Her düğümün komşularını orijinal kimliklerle tutan liste (indeks sırasıyla)."""
+        if self._neighbor_lists is None:
+            ids = self.node_ids[self.indices].tolist()
+            bounds = self.indptr.tolist()
+            self._neighbor_lists = [ids[bounds[i]:bounds[i + 1]] for i in range(self.num_nodes)]
+        return self._neighbor_lists
+
+    @property
+    def csr_lists(self):
+        """(indptr, indices, arc_source) dizilerinin Python listesi hali; saf Python döngüleri (Dijkstra vb.) için."""
+        if self._csr_lists is None:
+            self._csr_lists = (self.indptr.tolist(), self.indices.tolist(), self.arc_source.tolist())
+        return self._csr_lists
+
+    def neighbors(self, node_id) -> List[int]:
+        return self.neighbor_lists[self._lookup[node_id]]
+
+    def has_edge(self, u, v) -> bool:
+        # Tekil sorgularda NumPy çağrı maliyetinden kaçınmak için küme üyeliği kullanılır
+        if self._neighbor_sets is None:
+            self._neighbor_sets = [set(nbrs) for nbrs in self.neighbor_lists]
+        if not self.has_node(u):
+            return False
+        return v in self._neighbor_sets[self._lookup[u]]
+
+    def has_node(self, node_id) -> bool:
+        return 0 <= node_id < len(self._lookup) and self._lookup[node_id] >= 0
+
+    def number_of_nodes(self) -> int:
+        return self.num_nodes
+
+    def number_of_edges(self) -> int:
+        return self.num_arcs // 2
+
+    def nodes(self) -> List[int]:
+        return self.node_ids.tolist()
+
+    def __len__(self):
+        return self.num_nodes
+
+
+if __name__ == "__main__":
+    import time
+    from ..generation import generate_graf as gg
+
+    G = gg.graf_uret()
+    start = time.time()
+    topo = CompiledTopology.from_nx_graph(G)
+    print(f"Derleme süresi: {(time.time() - start) * 1000:.2f} ms")
+    print(f"Düğüm: {topo.num_nodes}, Yay: {topo.num_arcs}")
+    u, v = next(iter(G.edges()))
+    arc = topo.arcs(topo.index_of(u), topo.index_of(v))
+    print(f"({u}, {v}) gecikme: {topo.link_delay[arc]} / nx: {G.edges[u, v]['link_delay_ms']}")
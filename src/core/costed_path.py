@@ -0,0 +1,139 @@
+import numpy as np
+from .compiled import CompiledTopology
+
+
+class CostedPath(list):
+    """
+    Düğüm listesi gibi davranan, yanında önek (prefix) maliyet toplamlarını taşıyan yol.
+
+    k. konumdaki "adım" maliyeti, (k-1 -> k) yayının maliyeti ile k. düğümün
+    maliyetinin toplamıdır. _prefix[:, k] ilk k adımın toplamını tutar
+    (satırlar: gecikme, güvenilirlik maliyeti, bant genişliği maliyeti).
+    Toplam metrik = _prefix[:, -1] - son düğümün maliyeti (uç düğümler sayılmaz).
+
+    Bu sayede yolun ortasından bir bölümü değiştiren işlemler (mutasyon,
+    komşu yol üretimi) yalnızca değişen bölümü yeniden maliyetlendirir.
+    Nesne yerinde değiştirilmemelidir (append vb.); yeni yol için splice/rebase kullanılır.
+    """
+
+    def __init__(self, nodes, G, _prefix=None, _arc_bw=None):
+        super().__init__(nodes)
+        self.topo = CompiledTopology.of(G)
+        if _prefix is None:
+            steps, _arc_bw = self._steps(self)
+            _prefix = np.zeros((3, len(self)))
+            np.cumsum(steps, axis=1, out=_prefix[:, 1:])
+        self._prefix = _prefix
+        self._arc_bw = _arc_bw
+
+    def _steps(self, nodes):
+        """Verilen ardışık düğümler için adım maliyetlerini ve yay bant genişliklerini döndürür."""
+        topo = self.topo
+        idx = topo.to_indices(nodes)
+        arcs = topo.checked_arcs(idx[:-1], idx[1:])
+        head = idx[1:]
+        steps = np.vstack((
+            topo.link_delay[arcs] + topo.proc_delay[head],
+            topo.link_rel_cost[arcs] + topo.node_rel_cost[head],
+            topo.bw_cost[arcs],
+        ))
+        return steps, topo.bandwidth[arcs]
+
+    def _totals(self):
+        if len(self) < 2:
+            return np.zeros(3)
+        last = self.topo.index_of(self[-1])
+        return self._prefix[:, -1] - (self.topo.proc_delay[last], self.topo.node_rel_cost[last], 0.0)
+
+    def copy(self) -> 'CostedPath':
+        """Önek dizilerini paylaşan kopya (nesne değişmez kabul edildiği için güvenlidir)."""
+        return CostedPath(self, self.topo, _prefix=self._prefix, _arc_bw=self._arc_bw)
+
+    # --- Metrikler (Metrics modülündeki karşılıklarıyla aynı yuvarlama) ---
+
+    @property
+    def delay(self) -> float:
+        return round(float(self._totals()[0]), 4)
+
+    @property
+    def reliability(self) -> float:
+        return round(float(self._totals()[1]), 4)
+
+    @property
+    def bandwidth(self) -> float:
+        return round(float(self._totals()[2]), 4)
+
+    @property
+    def min_bandwidth(self) -> float:
+        return float(self._arc_bw.min()) if len(self._arc_bw) else float('inf')
+
+    def cost(self, w_delay, w_rel, w_band) -> float:
+        """
+        Ağırlıklı toplam maliyet. Batch_Path_Costs ve kenar maliyet tablosu gibi
+        yuvarlanmamış metriklerden hesaplanır; böylece iki kaynaktan gelen yollar
+        aynı ölçekte karşılaştırılır.
+        """
+        delay, rel, band = self._totals()
+        return float((delay * w_delay) + (rel * w_rel) + (band * w_band))
+
+    # --- Artımlı güncelleme ---
+
+    def splice(self, i, j, middle) -> 'CostedPath':
+        """
+        self[:i+1] + middle + self[j:] yolunu üretir.
+        Topolojiden yalnızca self[i] -> middle -> self[j] bölümünün maliyetleri okunur;
+        baş önekleri aynen kopyalanır, kuyruk önekleri sabit bir farkla kaydırılır.
+        Yeni yolun dizileri (düğüm listesi gibi) yine O(n) uzunluğunda yazılır, ancak
+        bu tek bir ön ayrılmış dizi üzerinde, ara dizi oluşturmadan yapılır.
+        """
+        segment = [self[i]] + list(middle) + [self[j]]
+        seg_steps, seg_bw = self._steps(segment)
+        k = i + len(segment) - 1  # self[j]'nin yeni yoldaki konumu
+
+        prefix = np.empty((3, k + len(self) - j))
+        prefix[:, :i + 1] = self._prefix[:, :i + 1]
+        seg = prefix[:, i + 1:k + 1]
+        np.cumsum(seg_steps, axis=1, out=seg)
+        seg += self._prefix[:, i:i + 1]
+        # Kuyruğun önek değerleri sabit bir farkla kayar
+        shift = prefix[:, k:k + 1] - self._prefix[:, j:j + 1]
+        np.add(self._prefix[:, j + 1:], shift, out=prefix[:, k + 1:])
+        arc_bw = np.concatenate((self._arc_bw[:i], seg_bw, self._arc_bw[j:]))
+
+        nodes = self[:i + 1] + segment[1:-1] + self[j:]
+        return CostedPath(nodes, self.topo, _prefix=prefix, _arc_bw=arc_bw)
+
+    def rebase(self, new_nodes) -> 'CostedPath':
+        """
+        Bu yoldan türetilmiş (ör. mutasyona uğramış ve sadeleştirilmiş) yeni düğüm
+        listesini maliyetlendirir. Ortak baş ve kuyruk bulunur, yalnızca aradaki
+        farklı bölüm splice ile yeniden hesaplanır. Ortak uç yoksa tam hesaplama yapılır.
+        Yeni yol grafta olmayan bir kenar içeriyorsa maliyetlendirilemez ve düz liste döner
+        (ör. hedefe ulaşamamış bir tamamlama); geçerlilik kontrolü çağırana kalır.
+        """
+        try:
+            return self._rebase(new_nodes)
+        except ValueError:
+            return list(new_nodes)
+
+    def _rebase(self, new_nodes) -> 'CostedPath':
+        a = np.asarray(self, dtype=np.int64)
+        b = np.asarray(new_nodes, dtype=np.int64)
+        n = min(len(a), len(b))
+        if n == 0:
+            return CostedPath(new_nodes, self.topo)
+
+        diff = np.flatnonzero(a[:n] != b[:n])
+        p = int(diff[0]) if len(diff) else n  # Ortak baş uzunluğu
+        diff = np.flatnonzero(a[::-1][:n] != b[::-1][:n])
+        s = int(diff[0]) if len(diff) else n  # Ortak kuyruk uzunluğu
+        s = min(s, n - p)
+
+        if p == 0 or s == 0:
+            return CostedPath(new_nodes, self.topo)
+        if p + s == len(a) == len(b):
+            return self
+
+        i = p - 1
+        j = len(a) - s
+        return self.splice(i, j, b[p:len(b) - s].tolist())
@@ -0,0 +1,112 @@
+import numpy as np
+from collections import OrderedDict
+from typing import Tuple
+
+
+def weights_key(weights) -> Tuple[float, float, float]:
+    """
+    Ağırlıkları (delay, reliability, bandwidth) demetine çevirir.
+    Sözlük ({'delay':..,'reliability':..,'bandwidth':..}) veya 3'lü demet/liste kabul edilir.
+    """
+    if isinstance(weights, dict):
+        return (float(weights['delay']), float(weights['reliability']), float(weights['bandwidth']))
+    w_delay, w_rel, w_band = weights
+    return (float(w_delay), float(w_rel), float(w_band))
+
+
+class EdgeCostTable:
+    """
+    Belirli bir (ağırlık, talep) çifti için yay bazlı ağırlıklı adım maliyetleri.
+
+    step_cost[a] (a: u->v yayı) = w_d*(hat gecikmesi + v işlem gecikmesi)
+                                + w_r*(-log r_link - log r_node(v))
+                                + w_b*(1000 / bw)
+    Talebi (demand) karşılamayan yayların maliyeti sonsuzdur.
+    node_cost[v], v düğümünün ağırlıklı maliyetidir; yolun son düğümü maliyete
+    dahil edilmediği için yol maliyeti = adım toplamı - node_cost[hedef].
+    """
+
+    def __init__(self, topo, weights, demand):
+        self.weights = weights
+        self.demand = demand
+        w_delay, w_rel, w_band = weights
+
+        self.node_cost = (w_delay * topo.proc_delay) + (w_rel * topo.node_rel_cost)
+        step = (w_delay * topo.link_delay) + (w_rel * topo.link_rel_cost) + \
+               (w_band * topo.bw_cost) + self.node_cost[topo.indices]
+        step[topo.bandwidth < demand] = np.inf
+        self.step_cost = step
+        self._reverse_arc = topo.reverse_arc
+        self._heuristic = None
+        self._step_cost_list = None
+        self._reverse_step_cost_list = None
+
+    @property
+    def step_cost_list(self):
+        """step_cost'un Python listesi hali (saf Python Dijkstra döngüleri için)."""
+        if self._step_cost_list is None:
+            self._step_cost_list = self.step_cost.tolist()
+        return self._step_cost_list
+
+    @property
+    def reverse_step_cost_list(self):
+        """
+        Geriye doğru aramalar için: a (x->w) yayında gerçek w->x yayının maliyeti.
+        Adım maliyeti hedef düğüm maliyetini içerdiği için iki yön simetrik değildir.
+        Ters yayı olmayan yaylarda (yönlü graf) inf.
+        """
+        if self._reverse_step_cost_list is None:
+            reverse = self._reverse_arc
+            self._reverse_step_cost_list = np.where(reverse >= 0, self.step_cost[reverse], np.inf).tolist()
+        return self._reverse_step_cost_list
+
+    @property
+    def heuristic(self) -> np.ndarray:
+        """ACO çekicilik değeri: 1 / (adım maliyeti + 0.0001); uygun olmayan yaylar için 0."""
+        if self._heuristic is None:
+            with np.errstate(divide="ignore"):
+                self._heuristic = 1.0 / (self.step_cost + 0.0001)
+        return self._heuristic
+
+    def path_cost(self, topo, path) -> float:
+        """Düğüm kimlikleriyle verilen yolun ağırlıklı toplam maliyeti (uygun değilse inf)."""
+        if len(path) < 2:
+            return 0.0
+        arcs = topo.path_arcs(path)
+        return float(self.step_cost[arcs].sum() - self.node_cost[topo.index_of(path[-1])])
+
+
+class EdgeCostCache:
+    """
+    Bir derlenmiş topolojiye ait EdgeCostTable nesnelerinin LRU önbelleği.
+    Anahtar: (ağırlıklar, talep). Topoloji değişince önbellek de geçersiz olur;
+    CompiledTopology her derlemede yeni bir önbellek oluşturur, clear() ise elle temizler.
+    """
+
+    def __init__(self, topo, max_entries=32):
+        self.topo = topo
+        self.max_entries = max_entries
+        self._tables = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, weights, demand=0.0) -> EdgeCostTable:
+        key = (weights_key(weights), float(demand))
+        table = self._tables.get(key)
+        if table is not None:
+            self._tables.move_to_end(key)
+            self.hits += 1
+            return table
+
+        self.misses += 1
+        table = EdgeCostTable(self.topo, key[0], key[1])
+        self._tables[key] = table
+        if len(self._tables) > self.max_entries:
+            self._tables.popitem(last=False)  # En eski kullanılanı çıkar
+        return table
+
+    def clear(self):
+        self._tables.clear()
+
+    def __len__(self):
+        return len(self._tables)
@@ -1,6 +1,9 @@
-import networkx as nx
+import itertools
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 @dataclass
 class Node:
@@ -34,18 +37,65 @@ class Link:
             'reliability': self.reliability
         }
 
+@dataclass
+class TopologyChange:
+    """
+    NetworkTopology üzerindeki tek bir yerinde değişikliği tarif eder; dinleyicilere iletilir.
+
+    kind: "link_removed", "link_updated" veya "node_updated"
+    worsened: Değişiklik hiçbir yolu iyileştiremiyorsa True (hat kopması, gecikme artışı,
+              bant genişliği/güvenilirlik düşüşü). Bu durumda değişen elemanı kullanmayan
+              en iyi yollar en iyi kalmaya devam eder.
+    """
+    kind: str
+    u: int
+    v: Optional[int]
+    old_version: int
+    new_version: int
+    worsened: bool
+
+    def touches(self, path) -> bool:
+        """Verilen yol değişen hattı/düğümü kullanıyor mu?"""
+        if self.v is None:
+            return self.u in path
+        return any({a, b} == {self.u, self.v} for a, b in zip(path, path[1:]))
+
 class NetworkTopology:
     """
     QoS özelliklerini yönetmek için networkx.Graph etrafında bir sarmalayıcı.
+
+    version: Topolojinin sürüm damgası. Her değişiklikte (düğüm/bağlantı ekleme,
+    temizleme) yeni bir değer alır; değerler süreç genelinde tekildir, böylece
+    yeniden oluşturulan bir topoloji de eski önbellek girdileriyle eşleşmez.
     """
+    _versions = itertools.count(1)
+
     def __init__(self):
+        import networkx as nx  # İlk topoloji kurulurken yüklenir; arayüz açılışını yavaşlatmaz
         self.graph = nx.Graph()
+        self.version = next(NetworkTopology._versions)
+        self._listeners: List[Callable[[TopologyChange], None]] = []
+
+    def touch(self):
+        """Topoloji dışarıdan değiştirildiğinde sürümü ilerletir."""
+        self.version = next(NetworkTopology._versions)
 
     def add_node(self, node: Node):
         self.graph.add_node(node.id, data=node)
+        self.touch()
 
     def add_link(self, link: Link):
         self.graph.add_edge(link.source, link.target, data=link)
+        self.touch()
+
+    def add_nodes(self, nodes: List[Node]):
+        """Toplu ekleme (tek add_nodes_from, sürüm bir kez ilerler)."""
+        self.graph.add_nodes_from((node.id, {'data': node}) for node in nodes)
+        self.touch()
+
+    def add_links(self, links: List[Link]):
+        self.graph.add_edges_from((link.source, link.target, {'data': link}) for link in links)
+        self.touch()
 
     def get_nodes(self) -> List[Node]:
         return [self.graph.nodes[n]['data'] for n in self.graph.nodes]
@@ -63,11 +113,109 @@ class NetworkTopology:
             return self.graph.nodes[u]['data']
         return None
 
+    # --- Yerinde güncellemeler ---
+    # Her güncelleme sürümü ilerletir ve kayıtlı dinleyicilere (dinamik yönlendirme
+    # tabloları, rota önbellekleri) bir TopologyChange iletir; böylece onlar baştan
+    # hesaplamak yerine sadece etkilenen kısmı onarabilir.
+
+    def add_listener(self, callback: Callable[[TopologyChange], None]):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[TopologyChange], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, kind: str, u: int, v: Optional[int], worsened: bool):
+        old_version = self.version
+        self.touch()
+        change = TopologyChange(kind, u, v, old_version, self.version, worsened)
+        for callback in list(self._listeners):
+            callback(change)
+
+    def remove_link(self, u: int, v: int):
+        """Bağlantıyı kaldırır (ör. hat arızası)."""
+        if not self.graph.has_edge(u, v):
+            raise KeyError(f"Bağlantı yok: {u}-{v}")
+        self.graph.remove_edge(u, v)
+        self._notify("link_removed", u, v, worsened=True)
+
+    def update_link(self, u: int, v: int, bandwidth: float = None, delay: float = None,
+                    reliability: float = None):
+        """Bağlantının QoS özelliklerini değiştirir; verilmeyen özellikler aynı kalır."""
+        link = self.get_link(u, v)
+        if link is None:
+            raise KeyError(f"Bağlantı yok: {u}-{v}")
+        worsened = True
+        if bandwidth is not None:
+            worsened &= bandwidth <= link.bandwidth
+            link.bandwidth = bandwidth
+        if delay is not None:
+            worsened &= delay >= link.delay
+            link.delay = delay
+        if reliability is not None:
+            worsened &= reliability <= link.reliability
+            link.reliability = reliability
+        self._notify("link_updated", u, v, worsened)
+
+    def update_node(self, u: int, processing_delay: float = None, reliability: float = None):
+        """Düğümün işlem gecikmesini ve/veya güvenilirliğini değiştirir."""
+        node = self.get_node(u)
+        if node is None:
+            raise KeyError(f"Düğüm yok: {u}")
+        worsened = True
+        if processing_delay is not None:
+            worsened &= processing_delay >= node.processing_delay
+            node.processing_delay = processing_delay
+        if reliability is not None:
+            worsened &= reliability <= node.reliability
+            node.reliability = reliability
+        self._notify("node_updated", u, None, worsened)
+
+    def mirror_to(self, G: 'nx.Graph') -> Callable[[TopologyChange], None]:
+        """
+        Yerinde güncellemeleri algoritmaların kullandığı ham grafa (from_nx_graph'a verilen,
+        'bandwidth_mbps', 'link_delay_ms' ... öznitelikli G) da uygulayan bir dinleyici
+        kaydeder. Her değişiklikte G'nin derlenmiş kopyası (CompiledTopology.invalidate)
+        silinir, böylece sonraki hesaplama güncel grafı kullanır. Dinleyiciyi döndürür.
+        """
+        def apply(change: TopologyChange):
+            from .compiled import CompiledTopology
+            if change.kind == "link_removed":
+                if G.has_edge(change.u, change.v):
+                    G.remove_edge(change.u, change.v)
+            elif change.kind == "link_updated":
+                link = self.get_link(change.u, change.v)
+                G.edges[change.u, change.v].update(bandwidth_mbps=link.bandwidth, link_delay_ms=link.delay,
+                                                   link_reliability=link.reliability)
+            elif change.kind == "node_updated":
+                node = self.get_node(change.u)
+                G.nodes[change.u].update(processing_delay_ms=node.processing_delay,
+                                         node_reliability=node.reliability)
+            CompiledTopology.invalidate(G)
+
+        self.add_listener(apply)
+        return apply
+
     def clear(self):
         self.graph.clear()
+        self.touch()
+
+    def save(self, path):
+        """Topolojiyi bellek eşlemeli disk biçiminde yazar (bkz. core.topology_store)."""
+        from .topology_store import save_topology
+        save_topology(self, path)
+
+    @staticmethod
+    def open(path):
+        """
+        save() ile yazılmış topolojiyi salt-okunur açar (topology_store.MappedTopology);
+        sütunlar ilk kullanımda numpy.memmap olarak eşlenir.
+        """
+        from .topology_store import MappedTopology
+        return MappedTopology(path)
 
     @staticmethod
-    def from_nx_graph(G: nx.Graph) -> 'NetworkTopology':
+    def from_nx_graph(G: 'nx.Graph') -> 'NetworkTopology':
         """
         Dışarıdan (generate_graf.py) gelen ham NetworkX grafını
         NetworkTopology yapısına dönüştürür.
@@ -75,28 +223,21 @@ class NetworkTopology:
         topology = NetworkTopology()
         
         # Nodes
-        for node_id, data in G.nodes(data=True):
-            # generate_graf.py'den gelen veriler: 'processing_delay_ms', 'node_reliability'
-            # Node sınıfı beklentisi: id, processing_delay, reliability
-            node = Node(
-                id=node_id,
-                processing_delay=data.get('processing_delay_ms', 0.0),
-                reliability=data.get('node_reliability', 1.0)
-            )
-            topology.add_node(node)
+        # generate_graf.py'den gelen veriler: 'processing_delay_ms', 'node_reliability'
+        # Node sınıfı beklentisi: id, processing_delay, reliability
+        topology.add_nodes([
+            Node(node_id, data.get('processing_delay_ms', 0.0), data.get('node_reliability', 1.0))
+            for node_id, data in G.nodes(data=True)
+        ])
             
         # Links
-        for u, v, data in G.edges(data=True):
-            # generate_graf.py: 'bandwidth_mbps', 'link_delay_ms', 'link_reliability'
-            # Link sınıfı: source, target, bandwidth, delay, reliability
-            link = Link(
-                source=u,
-                target=v,
-                bandwidth=data.get('bandwidth_mbps', 100.0),
-                delay=data.get('link_delay_ms', 5.0),
-                reliability=data.get('link_reliability', 1.0)
-            )
-            topology.add_link(link)
+        # generate_graf.py: 'bandwidth_mbps', 'link_delay_ms', 'link_reliability'
+        # Link sınıfı: source, target, bandwidth, delay, reliability
+        topology.add_links([
+            Link(u, v, data.get('bandwidth_mbps', 100.0), data.get('link_delay_ms', 5.0),
+                 data.get('link_reliability', 1.0))
+            for u, v, data in G.edges(data=True)
+        ])
             
         return topology
 
@@ -0,0 +1,146 @@
+import math
+import random
+import threading
+from collections import OrderedDict
+
+# Sonucu yalnızca girdilere bağlı olan (rastgelelik içermeyen) algoritmalar
+DETERMINISTIC_ALGORITHMS = frozenset({
+    "Dijkstra Algoritma",
+    "Pareto Algoritma",
+    "CH Algoritma",
+})
+
+
+def bucket_demand(demand, step) -> float:
+    """
+    Talebi step katlarına YUKARI yuvarlar (step <= 0 ise olduğu gibi bırakır).
+    Yuvarlanmış talebi karşılayan yol asıl talebi de karşılar.
+    """
+    demand = float(demand)
+    if step <= 0 or demand <= 0:
+        return demand
+    return math.ceil(demand / step) * step
+
+
+def _result_paths(value):
+    """Önbellekteki bir sonucun içerdiği yollar (tek yol, yol yok veya Pareto cephesi)."""
+    if value is None:
+        return []
+    if hasattr(value, 'paths'):
+        return value.paths
+    return [value]
+
+
+class RouteCache:
+    """
+    Algoritma sonuçlarının önbelleği; anahtar:
+    (algoritma, kaynak, hedef, talep kovası, ağırlıklar, topoloji sürümü, tohum).
+
+    - Talep kovası: demand_step > 0 ise talep, demand_step katlarına YUKARI yuvarlanır ve
+      algoritma da bu değerle çalıştırılır. Böylece kovadaki her talep için sonuç uygun
+      (feasible) kalır ve yakın talepler aynı girdiyi paylaşır. Varsayılan (demand_step=0)
+      kovalamaz: algoritma istenen talebin kendisiyle çalışır.
+    - Topoloji sürümü: NetworkTopology.version; topoloji değişince eski girdiler
+      hiç eşleşmez ve LRU ile zamanla atılır.
+    - Rastgele (stokastik) algoritmalar sadece tohum (seed) verilirse önbelleğe alınır;
+      tohum anahtarın parçasıdır ve hesaplama o tohumla yapılır.
+
+    En fazla max_entries girdi tutulur, en eski kullanılan atılır (LRU).
+    GUI ve arka plan iş parçacıkları birlikte kullanabilsin diye kilitlidir.
+    """
+
+    def __init__(self, max_entries=256, demand_step=0.0):
+        self.max_entries = max_entries
+        self.demand_step = demand_step
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def bucket_demand(self, demand) -> float:
+        """Talebi kova üst sınırına yuvarlar (demand_step <= 0 ise olduğu gibi bırakır)."""
+        return bucket_demand(demand, self.demand_step)
+
+    @staticmethod
+    def is_cacheable(algorithm, seed=None) -> bool:
+        return algorithm in DETERMINISTIC_ALGORITHMS or seed is not None
+
+    def make_key(self, algorithm, source, target, demand, weights, version, seed=None):
+        """weights=None: sonucu ağırlıktan bağımsız algoritmalar için (ör. Pareto cephesi)."""
+        from .edge_costs import weights_key  # numpy'yi arayüz açılışında yüklememek için
+        w = weights_key(weights) if weights is not None else None
+        return (algorithm, source, target, self.bucket_demand(demand), w, version, seed)
+
+    def get(self, key):
+        """Girdi varsa (True, değer), yoksa (False, None) döndürür."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)  # En eski kullanılanı çıkar
+
+    def get_or_compute(self, algorithm, source, target, demand, weights, version, compute, seed=None):
+        """
+        Önbellekte varsa sonucu döndürür, yoksa compute(kova_talebi) ile hesaplayıp saklar.
+        Önbelleğe alınamayan (tohumsuz stokastik) çağrılar da kova talebiyle, ama her seferinde
+        yeniden hesaplanır; böylece önbellekli ve önbelleksiz sonuçlar aynı talebi kullanır.
+        Tohum verilmişse hesaplama o tohumla yapılır; genel random durumu korunur.
+        """
+        if not self.is_cacheable(algorithm, seed):
+            return compute(self.bucket_demand(demand))
+
+        key = self.make_key(algorithm, source, target, demand, weights, version, seed)
+        found, value = self.get(key)
+        if found:
+            return value
+
+        if seed is not None:
+            state = random.getstate()
+            random.seed(seed)
+            try:
+                value = compute(key[3])
+            finally:
+                random.setstate(state)
+        else:
+            value = compute(key[3])
+        self.put(key, value)
+        return value
+
+    def on_topology_change(self, change):
+        """
+        NetworkTopology dinleyicisi: eski sürümün girdilerini yeni sürüme taşır veya atar.
+
+        Değişiklik hiçbir yolu iyileştiremiyorsa (change.worsened), deterministik bir
+        algoritmanın değişen hattı/düğümü kullanmayan sonucu hâlâ en iyidir ve yeni sürüme
+        taşınır. Diğer bütün eski sürüm girdileri atılır.
+        """
+        with self._lock:
+            migrated = OrderedDict()
+            for key, value in self._entries.items():
+                if key[5] != change.old_version:
+                    migrated[key] = value
+                elif change.worsened and key[0] in DETERMINISTIC_ALGORITHMS and \
+                        not any(change.touches(p) for p in _result_paths(value)):
+                    migrated[key[:5] + (change.new_version,) + key[6:]] = value
+            self._entries = migrated
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries),
+                'hit_rate': self.hits / total if total else 0.0}
+
+    def __len__(self):
+        return len(self._entries)
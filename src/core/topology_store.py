@@ -0,0 +1,234 @@
+"""
+Bellek eşlemeli (memory-mapped) disk üzerindeki topoloji biçimi.
+
+Bir topoloji, aşağıdaki dosyaları içeren bir dizindir. Her dizi ayrı bir .npy dosyasıdır
+(NumPy'nin standart biçimi, little-endian, C sıralı), böylece numpy.load(mmap_mode='r')
+ile kopyasız açılır ve aynı dosyayı açan bütün süreçler işletim sisteminin sayfa
+önbelleğini paylaşır.
+
+    meta.json                 {"format": "qos-topology", "version": 1, "num_nodes", "num_arcs",
+                               "fingerprint"}
+
+    Düğüm sütunları (uzunluk n, düğüm kimliğine göre sıralı):
+    node_ids.npy              int64   Düğüm kimlikleri
+    proc_delay.npy            float64 İşleme gecikmesi (ms)
+    node_reliability.npy      float64 Düğüm güvenilirliği
+    node_rel_cost.npy         float64 -log(düğüm güvenilirliği)
+    _lookup.npy               int64   Kimlik -> indeks (uzunluk max_id + 1, yoksa -1)
+
+    CSR komşuluğu (yönsüz her kenar iki yay: u->v ve v->u):
+    indptr.npy                int64   (n + 1) i. düğümün yayları indptr[i]:indptr[i+1]
+    indices.npy               int32   Yayın hedef düğüm indeksi (satır içinde sıralı)
+    arc_source.npy            int32   Yayın kaynak düğüm indeksi
+    arc_keys.npy              int64   kaynak * n + hedef (global olarak sıralı)
+    reverse_arc.npy           int64   Ters yönlü yayın indeksi
+
+    Yay sütunları (uzunluk = yay sayısı, CSR sırasında):
+    link_delay.npy            float64 Hat gecikmesi (ms)
+    bandwidth.npy             float64 Bant genişliği (Mbps)
+    link_reliability.npy      float64 Hat güvenilirliği
+    link_rel_cost.npy         float64 -log(hat güvenilirliği)
+    bw_cost.npy               float64 1000 / bant genişliği
+
+Türetilmiş diziler de saklandığı için açılışta hiçbir şey hesaplanmaz; dizin
+CompiledTopology.from_columns ile doğrudan derlenmiş topolojiye dönüşür.
+"""
+import json
+import os
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+
+from .compiled import ARRAY_ATTRIBUTES, CompiledTopology
+from .model import Link, Node, NetworkTopology
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+FORMAT = "qos-topology"
+FORMAT_VERSION = 1
+
+# Derlenmiş topolojide olmayan, yalnızca get_node/get_link için saklanan ham sütunlar
+RAW_COLUMNS = ("node_reliability", "link_reliability")
+
+
+def save_topology(G, path):
+    """
+    Topolojiyi dizine yazar. G: nx.Graph, NetworkTopology veya CompiledTopology.
+    Ham güvenilirlikler -log maliyetlerinden geri hesaplanır (kayan nokta yuvarlaması
+    dışında aynıdır; r <= 0 değerleri Metrics'teki gibi 0.0001 olarak saklanır).
+    """
+    if isinstance(G, NetworkTopology):
+        topo = CompiledTopology.from_topology(G)
+    else:
+        topo = CompiledTopology.of(G)
+
+    os.makedirs(path, exist_ok=True)
+    for name in ARRAY_ATTRIBUTES:
+        np.save(os.path.join(path, f"{name}.npy"), np.asarray(getattr(topo, name)))
+    np.save(os.path.join(path, "node_reliability.npy"), np.exp(-np.asarray(topo.node_rel_cost)))
+    np.save(os.path.join(path, "link_reliability.npy"), np.exp(-np.asarray(topo.link_rel_cost)))
+
+    meta = {'format': FORMAT, 'version': FORMAT_VERSION, 'num_nodes': topo.num_nodes,
+            'num_arcs': topo.num_arcs, 'fingerprint': topo.fingerprint}
+    with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+
+class MappedTopology:
+    """
+    Diskteki topolojinin salt-okunur görünümü; NetworkTopology ile aynı okuma arayüzü
+    (get_node, get_link, get_nodes, get_links, version).
+
+    Sütunlar ilk kullanıldıklarında numpy.memmap olarak açılır; Node/Link nesneleri
+    yalnızca istendiğinde üretilir ve saklanmaz. Algoritmalar compiled() (veya
+    CompiledTopology.of) ile dizileri kopyasız kullanır.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get('format') != FORMAT or self.meta.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen topoloji biçimi: {self.meta.get('format')} "
+                             f"v{self.meta.get('version')}")
+        self.version = next(NetworkTopology._versions)
+        self._columns = {}
+        self._compiled = None
+        self._graph = None
+
+    def column(self, name) -> np.ndarray:
+        """Sütunu tembel olarak eşler (ilk erişimde açılır, sonra aynı memmap kullanılır)."""
+        arr = self._columns.get(name)
+        if arr is None:
+            arr = np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode='r')
+            self._columns[name] = arr
+        return arr
+
+    def compiled(self) -> CompiledTopology:
+        if self._compiled is None:
+            columns = {name: self.column(name) for name in ARRAY_ATTRIBUTES}
+            self._compiled = CompiledTopology.from_columns(columns, self.meta['fingerprint'])
+        return self._compiled
+
+    def number_of_nodes(self) -> int:
+        return self.meta['num_nodes']
+
+    def number_of_edges(self) -> int:
+        return self.meta['num_arcs'] // 2
+
+    # --- NetworkTopology okuma arayüzü ---
+
+    def _index(self, node_id) -> int:
+        lookup = self.column("_lookup")
+        if not 0 <= node_id < len(lookup):
+            return -1
+        return int(lookup[node_id])
+
+    def _arc(self, u, v) -> int:
+        ui, vi = self._index(u), self._index(v)
+        if ui < 0 or vi < 0:
+            return -1
+        indptr = self.column("indptr")
+        lo, hi = int(indptr[ui]), int(indptr[ui + 1])
+        k = lo + int(np.searchsorted(self.column("indices")[lo:hi], vi))
+        return k if k < hi and self.column("indices")[k] == vi else -1
+
+    def get_node(self, u: int) -> Optional[Node]:
+        i = self._index(u)
+        if i < 0:
+            return None
+        return Node(int(u), float(self.column("proc_delay")[i]), float(self.column("node_reliability")[i]))
+
+    def get_link(self, u: int, v: int) -> Optional[Link]:
+        a = self._arc(u, v)
+        if a < 0:
+            return None
+        return Link(int(u), int(v), float(self.column("bandwidth")[a]), float(self.column("link_delay")[a]),
+                    float(self.column("link_reliability")[a]))
+
+    def get_nodes(self) -> List[Node]:
+        return [Node(*row) for row in zip(self.column("node_ids").tolist(), self.column("proc_delay").tolist(),
+                                          self.column("node_reliability").tolist())]
+
+    def get_links(self) -> List[Link]:
+        """Her yönsüz kenar bir kez (kaynak indeksi < hedef indeksi yönünde)."""
+        src, dst = self.column("arc_source"), self.column("indices")
+        arcs = np.flatnonzero(src < dst)
+        ids = self.column("node_ids")
+        return [Link(*row) for row in zip(ids[src[arcs]].tolist(), ids[dst[arcs]].tolist(),
+                                          self.column("bandwidth")[arcs].tolist(),
+                                          self.column("link_delay")[arcs].tolist(),
+                                          self.column("link_reliability")[arcs].tolist())]
+
+    @property
+    def graph(self) -> 'nx.Graph':
+        """
+        NetworkTopology.graph uyumluluğu (ör. arayüz çizimi): Node/Link verili tam bir
+        nx.Graph kopyası ilk erişimde kurulur. Büyük topolojilerde kullanılmamalıdır.
+        """
+        if self._graph is None:
+            import networkx as nx
+            G = nx.Graph()
+            G.add_nodes_from((node.id, {'data': node}) for node in self.get_nodes())
+            G.add_edges_from((link.source, link.target, {'data': link}) for link in self.get_links())
+            self._graph = G
+        return self._graph
+
+    # Salt-okunur: değişiklik olmadığı için dinleyicilere hiç bildirim gitmez
+    def add_listener(self, callback):
+        pass
+
+    def remove_listener(self, callback):
+        pass
+
+
+#  ANA CALISTIRMA BLOGU
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    from ..algorithms.Dijkstra import shortest_path_tree
+    from ..generation.synthetic_graf import sentetik_graf_uret
+
+    def _private_mb():
+        """Sürecin özel (anonim) belleği; paylaşılan memmap sayfaları buna dahil değildir."""
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssAnon"):
+                    return int(line.split()[1]) / 1024
+        return 0.0
+
+    def _worker(path):
+        """Her işçi aynı dizini açar ve tam bir en kısa yol ağacı hesaplar."""
+        private = _private_mb()
+        start = time.perf_counter()
+        mapped = MappedTopology(path)
+        topo = mapped.compiled()
+        open_ms = (time.perf_counter() - start) * 1000
+        cost = topo.edge_costs((0.33, 0.33, 0.34)).step_cost_list
+        shortest_path_tree(topo, 0, cost)
+        shared = all(isinstance(getattr(topo, name), np.memmap) for name in ("indices", "link_delay", "bandwidth"))
+        return open_ms, shared, _private_mb() - private
+
+    # Kullanım: python -m src.core.topology_store [düğüm sayısı]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 250_000
+    print("\n--- BELLEK ESLEMELI TOPOLOJI ---\n")
+    G = sentetik_graf_uret('geometric', n, seed=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        save_topology(G, tmp)
+        print(f"{n} dugum, {G.number_of_edges()} kenar yazildi: {time.perf_counter() - start:.2f} s, "
+              f"{sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp)) / 2**20:.0f} MB")
+
+        mapped = MappedTopology(tmp)
+        u, v = next(iter(G.edges))
+        print("get_node:", mapped.get_node(u))
+        print("get_link:", mapped.get_link(u, v), "| nx:", G.edges[u, v])
+        print("Ayni parmak izi:", mapped.compiled().fingerprint == CompiledTopology.of(G).fingerprint)
+
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            for k, (open_ms, shared, private) in enumerate(pool.map(_worker, [tmp] * 4)):
+                print(f"Isci {k}: acilis {open_ms:.1f} ms, memmap: {shared}, ozel bellek artisi {private:.0f} MB")
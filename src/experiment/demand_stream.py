@@ -0,0 +1,410 @@
+"""
+Streaming demand pipeline: read demands in chunks, route them with a bounded number of
+chunks in flight, and write results incrementally. Memory use depends on the chunk size
+and the in-flight bound, not on the number of demands.
+
+    reader  iter_demand_chunks(path)      CSV / Excel / JSONL -> lists of Demand
+    router  route_chunks(G, chunks, ...)  at most max_in_flight chunks queued or running
+    writer  ResultWriter(path)            CSV / JSONL / Parquet, one chunk at a time
+
+run_pipeline() connects the three and returns PipelineStats (with demands/sec).
+"""
+import csv
+import json
+import os
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from ..core import Metrics as mt
+from ..core.compiled import CompiledTopology
+from ..algorithms.Dijkstra import DijkstraSolver, path_from_tree, shortest_path_tree
+
+
+class Demand(NamedTuple):
+    index: int  # 1-based row number among the valid demands
+    src: int
+    dst: int
+    demand_mbps: float
+
+
+RESULT_FIELDS = ("index", "src", "dst", "demand_mbps", "status", "cost",
+                 "delay", "rel_cost", "bw_cost", "hops", "path")
+
+DEMAND_COLUMNS = ("src", "dst", "demand_mbps")
+
+
+# --- Reader ---
+
+def _parse_demand(index, values) -> Optional[Demand]:
+    """(src, dst, demand) values -> Demand; decimal commas ("12,5") are accepted. None if invalid."""
+    try:
+        src, dst, demand = values
+        return Demand(index, int(src), int(dst), float(str(demand).replace(',', '.')))
+    except (TypeError, ValueError):
+        return None
+
+
+def _rows_with_header(rows) -> Iterator[tuple]:
+    """
+    Yields (src, dst, demand) value triples. Named columns are used when the first row is a
+    header containing them; otherwise the first three columns are used (like Karslastirma).
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return
+    header = [str(c).strip().lower() if c is not None else "" for c in first]
+    if all(c in header for c in DEMAND_COLUMNS):
+        cols = [header.index(c) for c in DEMAND_COLUMNS]
+    else:
+        cols = [0, 1, 2]
+        if _parse_demand(0, first[:3]) is not None:
+            yield tuple(first[:3])
+    for row in rows:
+        yield tuple(row[c] if c < len(row) else None for c in cols)
+
+
+class _Semicolon(csv.excel):
+    delimiter = ";"
+
+
+def _csv_rows(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=";,\t")
+        except csv.Error:
+            # Ragged rows defeat the sniffer; fall back to the first line. ";" and tab win over
+            # ",", which may be a decimal comma (Excel exports with a Turkish locale)
+            first = sample.splitlines()[0] if sample else ""
+            dialect = _Semicolon if ";" in first else csv.excel_tab if "\t" in first else csv.excel
+        yield from csv.reader(f, dialect)
+
+
+def _excel_rows(path):
+    # read_only mode streams rows from the sheet XML instead of loading the workbook
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from wb.worksheets[0].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _jsonl_rows(path):
+    """One object per line ({"src", "dst", "demand_mbps"}) or a [src, dst, demand] list."""
+    with open(path, encoding='utf-8') as f:
+        yield list(DEMAND_COLUMNS)
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            obj = json.loads(line)
+            yield [obj.get(c) for c in DEMAND_COLUMNS] if isinstance(obj, dict) else obj
+
+
+_READERS = {'.csv': _csv_rows, '.txt': _csv_rows, '.xlsx': _excel_rows, '.xlsm': _excel_rows,
+            '.jsonl': _jsonl_rows, '.ndjson': _jsonl_rows}
+
+
+def iter_demands(path) -> Iterator[Demand]:
+    """Yields the valid demands of a CSV, Excel or JSONL file one by one; invalid rows are skipped."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in _READERS:
+        raise ValueError(f"Unsupported demand file: {path} (supported: {', '.join(_READERS)})")
+    index = 0
+    for values in _rows_with_header(_READERS[ext](path)):
+        demand = _parse_demand(index + 1, values)
+        if demand is not None:
+            index += 1
+            yield demand
+
+
+def iter_demand_chunks(demands: Iterable[Demand], chunk_size=5000) -> Iterator[List[Demand]]:
+    """Groups a demand stream (or a file path) into lists of at most chunk_size demands."""
+    if isinstance(demands, (str, os.PathLike)):
+        demands = iter_demands(demands)
+    chunk = []
+    for demand in demands:
+        chunk.append(demand)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# --- Router ---
+
+class TreeCache:
+    """
+    LRU cache of full shortest-path trees keyed by (source index, demand). One tree answers
+    every demand with that source and bandwidth, so the Dijkstra fast path runs one search
+    per repeated (source, demand) instead of one per demand. Bounded by the total number of
+    stored tree entries (max_entries), so memory stays flat on large topologies.
+
+    A full tree costs more than a single-target search that stops at the target, so a tree
+    is only built for a key that repeats: within the chunk (force=True) or across chunks
+    (seen before in the last seen_entries keys).
+    """
+
+    def __init__(self, topo, weights, max_entries=1 << 22, seen_entries=1 << 16):
+        self.topo = topo
+        self.weights = weights
+        self.capacity = max(1, max_entries // max(topo.num_nodes, 1))
+        self.seen_capacity = seen_entries
+        self._trees = OrderedDict()
+        self._seen = OrderedDict()
+
+    def pred(self, source, demand, force=False):
+        """Predecessor-arc list of the tree, or None on the first sighting of an unforced key."""
+        key = (source, demand)
+        pred = self._trees.get(key)
+        if pred is not None:
+            self._trees.move_to_end(key)
+            return pred
+        if not force and key not in self._seen:
+            self._seen[key] = None
+            if len(self._seen) > self.seen_capacity:
+                self._seen.popitem(last=False)
+            return None
+        self._seen.pop(key, None)
+        table = self.topo.edge_costs(self.weights, demand)
+        pred = shortest_path_tree(self.topo, source, table.step_cost_list)[1]
+        self._trees[key] = pred
+        if len(self._trees) > self.capacity:
+            self._trees.popitem(last=False)
+        return pred
+
+
+# Pool workers share one compiled topology and solver setup, sent once by the initializer
+_worker_topo = None
+_worker_solver = None
+_worker_weights = None
+_worker_trees = None
+
+
+def _init_worker(topo, solver, weights):
+    global _worker_topo, _worker_solver, _worker_weights, _worker_trees
+    _worker_topo = topo
+    _worker_solver = solver
+    _worker_weights = weights
+    _worker_trees = TreeCache(topo, weights) if solver is DijkstraSolver else None
+
+
+def _route_worker_chunk(chunk):
+    return route_chunk(_worker_topo, chunk, _worker_weights, _worker_solver, _worker_trees)
+
+
+def _result_row(d, path, metrics):
+    if not path:
+        return (d.index, d.src, d.dst, d.demand_mbps, "NO_PATH", None, None, None, None, None, "")
+    return (d.index, d.src, d.dst, d.demand_mbps, "OK", metrics.total, metrics.delay,
+            metrics.reliability, metrics.bandwidth, len(path) - 1, "-".join(map(str, path)))
+
+
+def route_chunk(topo, chunk, weights, solver=DijkstraSolver, trees=None) -> List[tuple]:
+    """
+    Routes one chunk; returns one RESULT_FIELDS row per demand, in input order. With
+    DijkstraSolver, repeated (source, demand) pairs are answered from a TreeCache (the same
+    optimal paths, see DijkstraSolver); everything else runs the solver once per demand.
+    The demands are routed in order of demand: CH and ALT keep their per-demand indexes in
+    a small LRU (IndexCache), which an unordered chunk would keep evicting and rebuilding.
+    """
+    if solver is DijkstraSolver and trees is None:
+        trees = TreeCache(topo, weights)
+    repeats = Counter((d.src, d.demand_mbps) for d in chunk) if trees is not None else None
+    rows = [None] * len(chunk)
+    for i in sorted(range(len(chunk)), key=lambda i: chunk[i].demand_mbps):
+        d = chunk[i]
+        path = None
+        if topo.has_node(d.src) and topo.has_node(d.dst):
+            pred = None
+            if trees is not None:
+                pred = trees.pred(topo.index_of(d.src), d.demand_mbps, repeats[(d.src, d.demand_mbps)] > 1)
+            if pred is not None:
+                target = topo.index_of(d.dst)
+                if pred[target] != -1 or d.src == d.dst:
+                    path = topo.to_ids(path_from_tree(topo, pred, target))
+            else:
+                path = solver(topo, d.src, d.dst, d.demand_mbps, weights).run()[0]
+        rows[i] = _result_row(d, path, mt.evaluate_path(topo, path, weights) if path else None)
+    return rows
+
+
+def route_chunks(G, chunks: Iterable[List[Demand]], weights, solver=DijkstraSolver,
+                 workers=None, max_in_flight=None) -> Iterator[List[tuple]]:
+    """
+    Routes a stream of demand chunks and yields result chunks in input order.
+
+    - workers: process count (None: os.cpu_count(); 0 or 1: route in this process)
+    - max_in_flight: chunks submitted but not yet yielded (default 2 * workers). The reader
+      is not advanced while the limit is reached, so a slow writer or router never causes
+      the whole demand file to be buffered.
+    - solver: any class with the (G, S, D, demand, weights).run() interface
+    """
+    topo = CompiledTopology.of(G)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers <= 1:
+        trees = TreeCache(topo, weights) if solver is DijkstraSolver else None
+        for chunk in chunks:
+            yield route_chunk(topo, chunk, weights, solver, trees)
+        return
+
+    max_in_flight = max_in_flight or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(topo, solver, weights)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_route_worker_chunk, chunk))
+        while pending:
+            yield pending.popleft().result()
+
+
+# --- Writer ---
+
+class ResultWriter:
+    """
+    Incremental result writer; the format follows the file extension (.csv, .jsonl, .parquet).
+    Each write() appends one chunk and nothing is kept in memory. Parquet output needs pyarrow
+    and writes one row group per chunk.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.format = os.path.splitext(path)[1].lower().lstrip('.')
+        self.rows_written = 0
+        self._parquet = None
+        if self.format == 'csv':
+            self._file = open(path, 'w', newline='', encoding='utf-8')
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(RESULT_FIELDS)
+        elif self.format in ('jsonl', 'ndjson'):
+            self._file = open(path, 'w', encoding='utf-8')
+        elif self.format == 'parquet':
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Parquet output requires pyarrow (pip install pyarrow)") from e
+            self._pa = pa
+            self._schema = pa.schema([
+                ("index", pa.int64()), ("src", pa.int64()), ("dst", pa.int64()),
+                ("demand_mbps", pa.float64()), ("status", pa.string()), ("cost", pa.float64()),
+                ("delay", pa.float64()), ("rel_cost", pa.float64()), ("bw_cost", pa.float64()),
+                ("hops", pa.int64()), ("path", pa.string())])
+            self._parquet = pq.ParquetWriter(path, self._schema)
+            self._file = None
+        else:
+            raise ValueError(f"Unsupported result file: {path} (supported: .csv, .jsonl, .parquet)")
+
+    def write(self, rows):
+        if self.format == 'csv':
+            self._csv.writerows(rows)
+        elif self._parquet is not None:
+            columns = list(zip(*rows)) if rows else [[] for _ in RESULT_FIELDS]
+            self._parquet.write_table(self._pa.Table.from_arrays(
+                [self._pa.array(col, type=field.type) for col, field in zip(columns, self._schema)],
+                schema=self._schema))
+        else:
+            self._file.writelines(json.dumps(dict(zip(RESULT_FIELDS, row))) + "\n" for row in rows)
+        self.rows_written += len(rows)
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# --- Pipeline ---
+
+@dataclass
+class PipelineStats:
+    demands: int = 0
+    routed: int = 0
+    no_path: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Demands per second over the whole run (reading, routing and writing)."""
+        return self.demands / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self):
+        return (f"{self.demands} demands ({self.routed} routed, {self.no_path} without path) "
+                f"in {self.seconds:.2f} s -> {self.throughput:,.0f} demands/sec")
+
+
+def run_pipeline(demand_path, output_path, G=None, weights=(0.33, 0.33, 0.34),
+                 solver=DijkstraSolver, chunk_size=5000, workers=None, max_in_flight=None,
+                 progress=None) -> PipelineStats:
+    """
+    Streams demand_path through the solver into output_path.
+
+    G defaults to the Excel topology (generate_graf.graf_uret). progress, if given, is called
+    with the running PipelineStats after each written chunk.
+    """
+    if G is None:
+        from ..generation import generate_graf
+        G = generate_graf.graf_uret()
+
+    stats = PipelineStats()
+    start = time.perf_counter()
+    chunks = iter_demand_chunks(demand_path, chunk_size)
+    with ResultWriter(output_path) as writer:
+        for rows in route_chunks(G, chunks, weights, solver, workers, max_in_flight):
+            writer.write(rows)
+            routed = sum(1 for row in rows if row[4] == "OK")
+            stats.demands += len(rows)
+            stats.routed += routed
+            stats.no_path += len(rows) - routed
+            stats.seconds = time.perf_counter() - start
+            if progress is not None:
+                progress(stats)
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.experiment.demand_stream [demand count] [workers]
+    import random
+    import sys
+    import tempfile
+
+    from ..generation import generate_graf
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    G = generate_graf.graf_uret()
+    nodes = list(G.nodes)
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        demand_path = os.path.join(tmp, "demands.csv")
+        with open(demand_path, "w", newline="") as f:
+            out = csv.writer(f, delimiter=";")
+            out.writerow(DEMAND_COLUMNS)
+            for _ in range(count):
+                out.writerow((rng.choice(nodes), rng.choice(nodes), rng.choice(range(10, 210, 10))))
+
+        def report(stats):
+            print(f"\r  {stats.demands:>10} demands, {stats.throughput:,.0f}/s", end="", flush=True)
+
+        for ext in ("csv", "jsonl"):
+            out_path = os.path.join(tmp, f"results.{ext}")
+            stats = run_pipeline(demand_path, out_path, G, workers=workers, progress=report)
+            print(f"\r{ext:<6} {stats} | output {os.path.getsize(out_path) / 2**20:.1f} MB")
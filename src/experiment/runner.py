@@ -1,6 +1,11 @@
+import multiprocessing
+import os
 import random
+import tempfile
+import threading
 import time
 import math
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import List, Tuple, Optional, Any
 from ..core.model import NetworkTopology
@@ -28,151 +33,347 @@ class AlgorithmStats:
     max_time: float
     avg_path_len: float
     status: str # "OK", "FAIL", "PARTIAL"
+    avg_gap: float = 0.0 # % cost gap to the exact Dijkstra optimum (same demand)
 
 @dataclass
 class ExperimentResult:
     case: ExperimentCase
     results: List[AlgorithmStats]
 
+# Algorithms without random draws: all repetitions of a case run as one job, so their
+# preprocessing (routing table, contraction hierarchy) is done once and not timed
+DETERMINISTIC = ("Dijkstra Algoritma", "CH Algoritma")
+
+
 def run_custom_experiment(
     topology: NetworkTopology,
     cases: List[Tuple[int, int, float]],
     algorithms: List[Any], # Changed from RoutingAlgorithm
     weights: Tuple[float, float, float],
-    repetitions: int = 5
+    repetitions: int = 5,
+    workers: Optional[int] = None
 ) -> List[ExperimentResult]:
-    
-    experiment_results = []
+    """
+    Runs every algorithm `repetitions` times on every case.
+
+    workers: processes for the independent (case, algorithm, repetition) jobs (None: all
+    CPUs, 1: everything in this process). Dijkstra runs are routing-table lookups and stay
+    in this process; see ExperimentPool for how workers get the topology.
+    """
     w_delay, w_rel, w_res = weights
     
     # Optimize: Generate raw graph once for the entire experiment
     # This prevents regenerating it 100+ times inside loops
     # Assuming topology doesn't change during experiment
     G = experiment_graph_instance(topology) 
+    w_dict = {'delay': w_delay, 'reliability': w_rel, 'bandwidth': w_res}
+    
+    from ..algorithms.RoutingTable import RoutingTable
     
+    # Exact routing tables, one per demand level, over the case sources only.
+    # Built once per experiment; every Dijkstra run and optimality gap is then a lookup.
+    # Built in this process (workers=1): the experiment pool below already keeps the
+    # other CPUs busy, and a second pool per demand level would only oversubscribe them.
+    case_sources = sorted({s for s, _, _ in cases})
+    tables = {}
+    def routing_table(demand):
+        if demand not in tables:
+            tables[demand] = RoutingTable.build(G, w_dict, demand, sources=case_sources, workers=1)
+        return tables[demand]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    pooled = [(i, algo) for i in range(len(cases)) for algo in algorithms if algo != "Dijkstra Algoritma"]
+    pool = ExperimentPool(G, workers) if workers > 1 and pooled else None
+
+    # (case index, algorithm) -> [(SimpleResult or None, demand used)], or futures of them
+    runs = {}
+    try:
+        if pool is not None:
+            for i, algo in pooled:
+                s, d, b = cases[i]
+                if algo in DETERMINISTIC:
+                    runs[(i, algo)] = [pool.submit(_algorithm_job, s, d, b, algo, weights, repetitions)]
+                else:
+                    runs[(i, algo)] = [pool.submit(_algorithm_job, s, d, b, algo, weights, 1)
+                                       for _ in range(repetitions)]
+        for i, (s, d, b) in enumerate(cases):
+            for algo in algorithms:
+                if (i, algo) not in runs:
+                    runs[(i, algo)] = run_algorithm(G, s, d, b, algo, weights, repetitions, routing_table)
+        if pool is not None:
+            for i, algo in pooled:
+                runs[(i, algo)] = [run for future in runs[(i, algo)] for run in future.result()]
+    finally:
+        if pool is not None:
+            pool.close()
+
+    experiment_results = []
     for i, (s, d, b) in enumerate(cases):
-        case_obj = ExperimentCase(i+1, s, d, b)
-        algo_stats_list = []
+        # Exact optimum per demand level, used as the reference for optimality gaps
+        def optimal_cost(demand):
+            return routing_table(demand).lookup(s, d)[1]
+
+        algo_stats_list = [algorithm_stats(algo, runs[(i, algo)], repetitions, optimal_cost)
+                           for algo in algorithms]
+        experiment_results.append(ExperimentResult(case=ExperimentCase(i+1, s, d, b), results=algo_stats_list))
         
-        for algo in algorithms:
-            times = []
-            costs = []
-            path_lens = []
-            success_count = 0
-            
-            # Initialize Algorithm Object if needed based on 'algo' type (string vs object)
-            # In MainWindow we passed STRINGS for new algos.
-            # We need to instantiate here or handle it.
-            
-            # Logic adapted for new setup
-            algo_instance = None
-            algo_name = str(algo)
-            
-            # Since strict OOP interface is broken, we handle manually
-            
-            for _ in range(repetitions):
-                res = None
-                start_t = time.time()
-                try:
-                    # Using cached G from outside loop 
-                    
-                    if algo == "ACO Algoritma":
-                        from ..algorithms.ACO_Algorithm import AntColonyOptimizer
-                        # Weights dictionary
-                        w_dict = {'delay': w_delay, 'reliability': w_rel, 'bandwidth': w_res}
-                        # Optimized for speed/reliability balance
-                        optimizer = AntColonyOptimizer(G, s, d, 0.1, w_dict, num_ants=10, max_iter=5)
-                        best_path, cost, _ = optimizer.run()
-
-
-                        if best_path:
-                            # Mock existing result structure
-                            # We can create a simple object
-                            res = SimpleResult(best_path, cost, time.time() - start_t)
-                            
-                    elif algo == "Genetik Algoritma":
-                        from ..algorithms.GeneticAlgorithm import genetic_algorithm
-                        # Fix: Pass weights as keyword arguments, otherwise they override pop_size/generations
-                        # Reduced pop/gen for UI responsiveness
-                        best_path = genetic_algorithm(
-                            G, s, d, 
-                            demand_mbps=0.1, 
-                            pop_size=20,
-                            generations=20,
-                            w_delay=w_delay, 
-                            w_rel=w_rel, 
-                            w_band=w_res
-                        )
-                        if best_path:
-                            # GA returns only path. recalculate cost?
-
-                            # For speed, assume cost=0 or calculate later.
-                            # calculate cost
-                            from ..core import Metrics as mt
-                            d_val = mt.Total_Delay(G, best_path)
-                            r_val = mt.Total_Reliability(G, best_path)
-                            b_val = mt.Total_Bandwidth(G, best_path)
-                            total = (w_delay * d_val) + (w_rel * r_val) + (w_res * b_val)
-                            res = SimpleResult(best_path, total, time.time() - start_t)
-
-                    elif algo == "Q-Learning Algoritma":
-                        from ..algorithms.QLearning import QLearningAgent
-                        # Use s and d from the loop
-                        agent = QLearningAgent(s, d, G=G)
-                        # QL takes time
-                        agent.train()
-                        path = agent.get_best_path()
-
-
-                        if path:
-                             res = SimpleResult(path, 0.0, time.time() - start_t)
-
-
-                except Exception as e:
-                    print(f"Error in experiment for {algo} case {i}: {e}")
-                    import traceback
-                    traceback.print_exc()
+    return experiment_results
 
+
+def run_algorithm(G, s, d, b, algo, weights, repetitions, routing_table=None):
+    """
+    `repetitions` timed runs of one algorithm on one case -> [(SimpleResult or None, demand used)].
+    Preprocessing (Dijkstra routing table, CH hierarchy) happens before the timed runs.
+    routing_table(demand) is only needed for Dijkstra.
+    """
+    w_delay, w_rel, w_res = weights
+    w_dict = {'delay': w_delay, 'reliability': w_rel, 'bandwidth': w_res}
+
+    # Since strict OOP interface is broken, we handle manually
+    if algo == "Dijkstra Algoritma":
+        routing_table(b) # Build outside the timed loop; repetitions then time the lookup
+    elif algo == "CH Algoritma":
+        from ..algorithms.ContractionHierarchy import ContractionHierarchy
+        ContractionHierarchy.of(G, w_dict, b) # Preprocessing is likewise not timed
+
+    return [_run_once(G, s, d, b, algo, weights, w_dict, routing_table) for _ in range(repetitions)]
+
+
+def _run_once(G, s, d, b, algo, weights, w_dict, routing_table):
+    w_delay, w_rel, w_res = weights
+    res = None
+    demand_used = 0.1 # Demand actually handed to the algorithm (for gap reference)
+    start_t = time.time()
+    try:
+        # Using cached G from outside loop 
+        
+        if algo == "ACO Algoritma":
+            from ..algorithms.ACO_Algorithm import AntColonyOptimizer
+            # Optimized for speed/reliability balance
+            optimizer = AntColonyOptimizer(G, s, d, 0.1, w_dict, num_ants=10, max_iter=5)
+            best_path, cost, _ = optimizer.run()
+
+
+            if best_path:
+                # Mock existing result structure
+                # We can create a simple object
+                res = SimpleResult(best_path, cost, time.time() - start_t)
                 
-                if res:
-                    times.append(res.execution_time)
-                    costs.append(res.total_cost)
-                    path_lens.append(len(res.path_nodes))
-                    success_count += 1
-            
-            # Calculate Stats (Same as before)
-            if success_count > 0:
-                avg_time = sum(times) / len(times)
-                min_time = min(times)
-                max_time = max(times)
-                avg_cost = sum(costs) / len(costs)
-                avg_len = sum(path_lens) / len(path_lens)
-                
-                if len(times) > 1:
-                    std_dev = math.sqrt(sum((x - avg_time) ** 2 for x in times) / (len(times) - 1))
-                else:
-                    std_dev = 0.0
-                status = "OK"
-            else:
-                avg_time = 0.0; min_time = 0.0; max_time = 0.0; avg_cost = 0.0; avg_len = 0.0; std_dev = 0.0
-                status = "FAIL"
-            
-            stats = AlgorithmStats(
-                algorithm_name=algo_name,
-                success_rate=success_count / repetitions,
-                avg_cost=avg_cost,
-                avg_time=avg_time,
-                std_dev_time=std_dev,
-                min_time=min_time,
-                max_time=max_time,
-                avg_path_len=avg_len,
-                status=status
+        elif algo == "Genetik Algoritma":
+            from ..algorithms.GeneticAlgorithm import genetic_algorithm
+            # Fix: Pass weights as keyword arguments, otherwise they override pop_size/generations
+            # Reduced pop/gen for UI responsiveness
+            best_path = genetic_algorithm(
+                G, s, d, 
+                demand_mbps=0.1, 
+                pop_size=20,
+                generations=20,
+                w_delay=w_delay, 
+                w_rel=w_rel, 
+                w_band=w_res
             )
-            algo_stats_list.append(stats)
-            
-        experiment_results.append(ExperimentResult(case=case_obj, results=algo_stats_list))
+            if best_path:
+                # GA returns only path. recalculate cost?
+
+                # For speed, assume cost=0 or calculate later.
+                # calculate cost
+                from ..core import Metrics as mt
+                total = mt.evaluate_path(G, best_path, weights).total
+                res = SimpleResult(best_path, total, time.time() - start_t)
+
+        elif algo == "Q-Learning Algoritma":
+            from ..algorithms.QLearning import QLearningAgent
+            # Use s and d from the loop
+            agent = QLearningAgent(s, d, G=G)
+            # QL takes time
+            agent.train()
+            path = agent.get_best_path()
+
+
+            demand_used = 0.0 # Q-Learning ignores bandwidth demand
+
+
+            if path:
+                 from ..core import Metrics as mt
+                 total = mt.evaluate_path(G, path, weights).total
+                 res = SimpleResult(path, total, time.time() - start_t)
+
+        elif algo == "Dijkstra Algoritma":
+            # Exact solver: respects the case bandwidth demand
+            demand_used = b
+            best_path, cost = routing_table(b).lookup(s, d)
+            if best_path:
+                res = SimpleResult(best_path, cost, time.time() - start_t)
+
+        elif algo == "CH Algoritma":
+            from ..algorithms.ContractionHierarchy import CHSolver
+            demand_used = b
+            best_path, cost, _ = CHSolver(G, s, d, b, w_dict).run()
+            if best_path:
+                res = SimpleResult(best_path, cost, time.time() - start_t)
+
+
+    except Exception as e:
+        print(f"Error in experiment for {algo} case {s}->{d}: {e}")
+        import traceback
+        traceback.print_exc()
+
+    return res, demand_used
+
+
+def algorithm_stats(algo, runs, repetitions, optimal_cost) -> AlgorithmStats:
+    """Aggregates the runs of one algorithm on one case; optimal_cost(demand) is the gap reference."""
+    results = [res for res, _ in runs if res]
+    times = [res.execution_time for res in results]
+    costs = [res.total_cost for res in results]
+    path_lens = [len(res.path_nodes) for res in results]
+    success_count = len(results)
+    
+    # Calculate Stats (Same as before)
+    if success_count > 0:
+        avg_time = sum(times) / len(times)
+        min_time = min(times)
+        max_time = max(times)
+        avg_cost = sum(costs) / len(costs)
+        avg_len = sum(path_lens) / len(path_lens)
         
-    return experiment_results
+        if len(times) > 1:
+            std_dev = math.sqrt(sum((x - avg_time) ** 2 for x in times) / (len(times) - 1))
+        else:
+            std_dev = 0.0
+        status = "OK"
+        
+        opt = optimal_cost(runs[-1][1])
+        avg_gap = 100.0 * (avg_cost - opt) / opt if 0 < opt < float('inf') else 0.0
+    else:
+        avg_time = 0.0; min_time = 0.0; max_time = 0.0; avg_cost = 0.0; avg_len = 0.0; std_dev = 0.0
+        avg_gap = 0.0
+        status = "FAIL"
+    
+    return AlgorithmStats(
+        algorithm_name=str(algo),
+        success_rate=success_count / repetitions,
+        avg_cost=avg_cost,
+        avg_time=avg_time,
+        std_dev_time=std_dev,
+        min_time=min_time,
+        max_time=max_time,
+        avg_path_len=avg_len,
+        status=status,
+        avg_gap=avg_gap
+    )
+
+
+# --- Process pool ---
+
+# Pool workers share the experiment topology, sent once by the initializer (see ExperimentPool),
+# and the pool's stop event
+_worker_G = None
+_worker_stop = None
+
+
+def _init_worker(source, stop):
+    global _worker_G, _worker_stop
+    if isinstance(source, str):  # Memory-mapped topology directory
+        from ..core.topology_store import MappedTopology
+        source = MappedTopology(source).compiled()
+    _worker_G = source
+    _worker_stop = stop
+
+
+def _algorithm_job(s, d, b, algo, weights, repetitions):
+    """Worker task: run_algorithm on the worker's topology (Dijkstra is not run in workers)."""
+    return run_algorithm(_worker_G, s, d, b, algo, weights, repetitions)
+
+
+def comparison_job(algo_name, src, dst, demand, weights):
+    """Worker task: comparison_run on the worker's topology; (None, 0.0) once the pool is stopped."""
+    if _worker_stop.is_set():
+        return None, 0.0
+    return comparison_run(_worker_G, algo_name, src, dst, demand, weights, _worker_stop)
+
+
+def comparison_run(G, algo_name, src, dst, demand, weights, stop=None):
+    """
+    One timed run of a stochastic algorithm with the comparison dialog's settings
+    (MainWindow.ComparisonWorker) -> (path or None, seconds). Once the `stop` event is set
+    the algorithm returns at its next iteration.
+    """
+    start_time = time.time()
+    path = None
+    w_d, w_r, w_b = weights
+    try:
+        if algo_name == "ACO Algoritma":
+            from ..algorithms.ACO_Algorithm import AntColonyOptimizer
+            weights_dict = {'delay': w_d, 'reliability': w_r, 'bandwidth': w_b}
+            # Create new instance for fairness
+            aco = AntColonyOptimizer(G, src, dst, demand, weights_dict, num_ants=10, max_iter=5, stop=stop)
+            path, _, _ = aco.run()
+
+        elif algo_name == "Genetik Algoritma":
+            from ..algorithms.GeneticAlgorithm import genetic_algorithm
+            path = genetic_algorithm(G, src, dst, demand_mbps=demand,
+                                     w_delay=w_d, w_rel=w_r, w_band=w_b, stop=stop)
+
+        elif algo_name == "Q-Learning Algoritma":
+            from ..algorithms.QLearning import QLearningAgent
+            params = {'alpha': 0.1, 'gamma': 0.9, 'epsilon': 0.1, 'episodes': 2000}
+            agent = QLearningAgent(src, dst, G, alpha=params['alpha'], gamma=params['gamma'], epsilon=params['epsilon'], episodes=params['episodes'], stop=stop)
+            agent.train()
+            path = agent.get_best_path()
+    except Exception:
+        path = None # Fail safely
+    return path, time.time() - start_time
+
+
+class ExperimentPool:
+    """
+    Process pool for independent experiment jobs. The workers get the compiled topology
+    once, never per job: inherited as a global when the pool is started by fork from the
+    main thread, otherwise (spawn, or a pool started from a GUI worker thread, where
+    forking is unsafe) through a memory-mapped topology directory (core.topology_store)
+    whose pages all workers share.
+
+    stop is a multiprocessing Event shared with the workers; close(cancel=True) sets it,
+    so running comparison jobs return at their algorithm's next iteration.
+    """
+
+    def __init__(self, G, workers=None):
+        from ..core.compiled import CompiledTopology
+        topo = CompiledTopology.of(G)
+        self.workers = workers or os.cpu_count() or 1
+        self._directory = None
+        if ("fork" in multiprocessing.get_all_start_methods()
+                and threading.current_thread() is threading.main_thread()):
+            context, source = multiprocessing.get_context("fork"), topo
+        else:
+            from ..core.topology_store import save_topology
+            self._directory = tempfile.TemporaryDirectory(
+                prefix="qos-topology-", dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+            save_topology(topo, self._directory.name)
+            context, source = multiprocessing.get_context("spawn"), self._directory.name
+        self.stop = context.Event()
+        self.pool = ProcessPoolExecutor(self.workers, mp_context=context,
+                                        initializer=_init_worker, initargs=(source, self.stop))
+
+    def submit(self, fn, *args) -> Future:
+        return self.pool.submit(fn, *args)
+
+    def close(self, cancel=False):
+        """Waits for the running jobs; cancel=True drops the queued ones and stops the running ones."""
+        if cancel:
+            self.stop.set()
+        self.pool.shutdown(wait=True, cancel_futures=cancel)
+        if self._directory is not None:
+            self._directory.cleanup()
+            self._directory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close(cancel=exc[0] is not None)
 
 class SimpleResult:
     def __init__(self, path, cost, time):
@@ -192,19 +393,17 @@ def experiment_graph_instance(topology):
         import networkx as nx
         raw_G = nx.Graph()
         
-        # Nodes
-        for n in topology.get_nodes():
-            raw_G.add_node(n.id, 
-                           processing_delay_ms=n.processing_delay,
-                           node_reliability=n.reliability,
-                           id=n.id) # Some algos might use 'id' attribute
+        # Nodes (bulk insert; 'id' kept because some algos might use it)
+        raw_G.add_nodes_from((n.id, {'processing_delay_ms': n.processing_delay,
+                                     'node_reliability': n.reliability,
+                                     'id': n.id})
+                             for n in topology.get_nodes())
                            
         # Links
-        for l in topology.get_links():
-            raw_G.add_edge(l.source, l.target,
-                           bandwidth_mbps=l.bandwidth,
-                           link_delay_ms=l.delay,
-                           link_reliability=l.reliability)
+        raw_G.add_edges_from((l.source, l.target, {'bandwidth_mbps': l.bandwidth,
+                                                   'link_delay_ms': l.delay,
+                                                   'link_reliability': l.reliability})
+                             for l in topology.get_links())
         return raw_G
 
     # Fallback
@@ -220,3 +419,33 @@ def run_experiment() -> str:
 
 
 
+
+
+if __name__ == "__main__":
+    # Wall-clock speedup of the process pool: python -m src.experiment.runner [cases] [repetitions] [workers ...]
+    import sys
+
+    n_cases = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    cpus = os.cpu_count() or 1
+    worker_counts = [int(w) for w in sys.argv[3:]] or sorted({1, 2, cpus})
+    algorithms = ["ACO Algoritma", "Genetik Algoritma", "Q-Learning Algoritma", "Dijkstra Algoritma"]
+
+    topology = NetworkTopology.from_nx_graph(generate_graf.graf_uret())
+    nodes = [n.id for n in topology.get_nodes()]
+    rng = random.Random(0)
+    cases = [(s, d, rng.uniform(10.0, 80.0)) for s, d in (rng.sample(nodes, 2) for _ in range(n_cases))]
+
+    print(f"\n--- PARALLEL EXPERIMENT RUNNER ({n_cases} cases x {len(algorithms)} algorithms x "
+          f"{repetitions} repetitions, {cpus} CPUs) ---\n")
+    print(f"{'Workers':>8} {'Wall s':>8} {'Speedup':>8} {'Efficiency':>11}   Success (%)")
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        results = run_custom_experiment(topology, cases, algorithms, (0.33, 0.33, 0.34), repetitions, workers)
+        wall = time.perf_counter() - start
+        baseline = baseline or wall
+        success = {algo: 100 * sum(r.results[k].success_rate for r in results) / len(results)
+                   for k, algo in enumerate(algorithms)}
+        print(f"{workers:>8} {wall:8.1f} {baseline / wall:7.2f}x {baseline / wall / min(workers, cpus):10.0%}   "
+              + ", ".join(f"{algo.split()[0]} {rate:.0f}" for algo, rate in success.items()))
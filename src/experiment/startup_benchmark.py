@@ -0,0 +1,127 @@
+"""
+Startup benchmark: import-time profile (python -X importtime), headless time-to-first-route
+and, when PyQt6 is available, GUI time-to-first-window / time-to-first-route.
+
+Every measurement runs in a fresh interpreter so module caches and the page cache state of
+one run do not leak into the next (the .npz topology cache on disk is used as in normal runs).
+
+    python -m src.experiment.startup_benchmark [repetitions]
+"""
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Modules imported before the window appears, and the set main_window used to import eagerly
+WINDOW_IMPORTS = ["src.core.model", "src.core.route_cache"]
+EAGER_IMPORTS = WINDOW_IMPORTS + [
+    "src.generation.generate_graf", "src.algorithms.ACO_Algorithm", "src.algorithms.GeneticAlgorithm",
+    "src.algorithms.QLearning", "src.algorithms.Pareto", "src.algorithms.RoutingTable",
+    "src.algorithms.ContractionHierarchy", "src.algorithms.path_utilities", "src.experiment.runner",
+]
+
+
+def import_profile(modules):
+    """
+    Runs `python -X importtime -c "import ..."` and returns (total_ms, by_package), where
+    by_package maps each top-level package to the self time of all its modules (ms).
+    """
+    statement = "import " + ", ".join(modules)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    total_us = 0
+    by_package = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        by_package[package] = by_package.get(package, 0.0) + int(self_us) / 1000
+        if not name[1:].startswith(" "):  # Top-level import of the statement
+            total_us += int(cumulative_us)
+    return total_us / 1000, dict(sorted(by_package.items(), key=lambda kv: -kv[1]))
+
+
+def headless_first_route():
+    """
+    Child process: compile the topology straight from the cached tables and compute one
+    route, without Qt, networkx or pandas.
+    """
+    start = time.perf_counter()
+    from src.generation import generate_graf
+    from src.algorithms.Dijkstra import DijkstraSolver
+    imported = time.perf_counter()
+    topo = generate_graf.derlenmis_graf_uret()
+    loaded = time.perf_counter()
+    nodes = topo.nodes()
+    DijkstraSolver(topo, nodes[0], nodes[-1], 0.0, (0.33, 0.33, 0.34)).run()
+    routed = time.perf_counter()
+    if "--strict" in sys.argv:
+        assert not {"networkx", "pandas", "PyQt6"} & set(sys.modules), "headless path imported a heavy module"
+    print(json.dumps({'import_ms': (imported - start) * 1000, 'load_ms': (loaded - imported) * 1000,
+                      'route_ms': (routed - loaded) * 1000}))
+
+
+def _run_child(args, env=None):
+    """Runs a child interpreter; returns (wall ms including interpreter start, stdout)."""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable] + args, cwd=ROOT, capture_output=True, text=True,
+                          env=env, timeout=300)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "child failed")
+    return wall_ms, proc.stdout
+
+
+def measure_headless(repetitions=3):
+    runs = []
+    for _ in range(repetitions):
+        wall_ms, out = _run_child(["-m", "src.experiment.startup_benchmark", "--headless", "--strict"])
+        timings = json.loads(out.strip().splitlines()[-1])
+        timings['first_route_wall_ms'] = wall_ms
+        runs.append(timings)
+    return {k: statistics.median(r[k] for r in runs) for k in runs[0]}
+
+
+def measure_gui(repetitions=3):
+    """time-to-first-window / time-to-first-route of main.py (offscreen); None without PyQt6."""
+    if importlib.util.find_spec("PyQt6") is None:
+        return None
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    runs = []
+    for _ in range(repetitions):
+        _, out = _run_child([os.path.join(ROOT, "main.py"), "--startup-benchmark"], env)
+        line = next(l for l in out.splitlines() if l.startswith("STARTUP "))
+        runs.append(json.loads(line[len("STARTUP "):]))
+    return {k: statistics.median(r[k] for r in runs) for k in runs[0]}
+
+
+if __name__ == "__main__":
+    if "--headless" in sys.argv:
+        headless_first_route()
+        sys.exit(0)
+
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    print("\n--- STARTUP BENCHMARK ---\n")
+    for label, modules in (("Window imports (lazy)", WINDOW_IMPORTS), ("All modules (eager)", EAGER_IMPORTS)):
+        total_ms, by_package = import_profile(modules)
+        top = ", ".join(f"{pkg} {ms:.0f}" for pkg, ms in list(by_package.items())[:5])
+        print(f"{label:<26} {total_ms:7.1f} ms  | heaviest (self ms): {top}")
+
+    headless = measure_headless(repetitions)
+    print(f"\nHeadless first route       {headless['first_route_wall_ms']:7.1f} ms wall "
+          f"(imports {headless['import_ms']:.1f}, topology {headless['load_ms']:.1f}, "
+          f"route {headless['route_ms']:.1f} ms)")
+
+    gui = measure_gui(repetitions)
+    if gui is None:
+        print("GUI                        skipped (PyQt6 not installed)")
+    else:
+        print(f"GUI first window           {gui['first_window_ms']:7.1f} ms")
+        print(f"GUI first route            {gui['first_route_ms']:7.1f} ms")
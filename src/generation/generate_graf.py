@@ -1,5 +1,5 @@
-import networkx as nx
-import pandas as pd
+import hashlib
+import numpy as np
 
 
 
@@ -14,50 +14,115 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 NODE_DATA_PATH = os.path.join(DATA_DIR, "NodeData.xlsx")
 EDGE_DATA_PATH = os.path.join(DATA_DIR, "EdgeData.xlsx")
 
+# Excel'den okunmuş tabloların ikili önbelleği; Excel dosyaları değişince yeniden oluşturulur
+CACHE_PATH = os.path.join(DATA_DIR, ".cache", "graf_tablolari.npz")
 
+NODE_COLUMNS = ["node_id", "s_ms", "r_node"]
+EDGE_COLUMNS = ["src", "dst", "capacity_mbps", "delay_ms", "r_link"]
 
-# Excel'den Graf oluşturucu 
-def graf_uret():
 
-    # Boş bir graph oluştur
-    G = nx.Graph()
+def kaynak_anahtari(paths=None):
+    """
+    Kaynak dosyaların boyut + değiştirilme zamanı özeti; içerik okunmaz.
+    paths verilmezse o anki NODE_DATA_PATH / EDGE_DATA_PATH (excel_tablolari'nın okuduğu dosyalar).
+    """
+    h = hashlib.sha1()
+    for path in paths or (NODE_DATA_PATH, EDGE_DATA_PATH):
+        st = os.stat(path)
+        h.update(f"{os.path.basename(path)}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return h.hexdigest()
 
-    
-    #  NODE VERİLERİNİ OKU
-    df_nodes = pd.read_excel(NODE_DATA_PATH)
 
-    # Her satır bir node'u temsil eder
-    for _, row in df_nodes.iterrows():
-        node_id = int(row["node_id"])
+def excel_tablolari():
+    """Excel dosyalarını okur; sütun adı -> numpy dizisi sözlüğü döndürür."""
+    import pandas as pd  # Yalnızca önbellek geçersizken gerekir; açılışta yüklenmez
 
-        G.add_node(
-            node_id,
-            processing_delay_ms = float(row["s_ms"]),
-            node_reliability    = float(row["r_node"])
-        )
-
-   
-    # 2) EDGE VERİLERİNİ OKU
+    df_nodes = pd.read_excel(NODE_DATA_PATH)
     df_edges = pd.read_excel(EDGE_DATA_PATH)
+    tablolar = {c: df_nodes[c].to_numpy() for c in NODE_COLUMNS}
+    tablolar.update({c: df_edges[c].to_numpy() for c in EDGE_COLUMNS})
+    return tablolar
+
+
+def graf_tablolari(cache_path=CACHE_PATH):
+    """
+    Düğüm/kenar tablolarını önbellekten, önbellek yoksa veya Excel dosyaları değişmişse
+    Excel'den okur (ve önbelleği yeniler). cache_path=None önbelleği kapatır.
+    """
+    if cache_path is None:
+        return excel_tablolari()
+
+    key = kaynak_anahtari()
+    try:
+        with np.load(cache_path) as data:
+            if str(data["key"]) == key:
+                return {c: data[c] for c in NODE_COLUMNS + EDGE_COLUMNS}
+    except (OSError, KeyError, ValueError):
+        pass  # Önbellek yok veya bozuk
+
+    tablolar = excel_tablolari()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Önce geçici dosyaya yaz, sonra yer değiştir; yarım yazılmış önbellek okunmasın
+        tmp = f"{cache_path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp, key=key, **tablolar)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass  # Yazılamayan dizin: önbelleksiz devam
+    return tablolar
+
+
+
+# Excel'den Graf oluşturucu (tablolar önbellekten gelebilir, bkz. graf_tablolari)
+def graf_uret(cache_path=CACHE_PATH):
+    return tablolardan_graf(graf_tablolari(cache_path))
+
+
+def derlenmis_graf_uret(cache_path=CACHE_PATH):
+    """
+    Başsız (arayüzsüz) hızlı açılış: tablolardan NetworkX grafı kurmadan doğrudan
+    CompiledTopology derler. networkx ve pandas (önbellek geçerliyse) hiç yüklenmez;
+    çözücüler (DijkstraSolver, CHSolver, ...) derlenmiş topolojiyi G olarak kabul eder.
+    """
+    from ..core.compiled import CompiledTopology
+    return CompiledTopology.from_tables(graf_tablolari(cache_path))
+
+
+def tablolardan_graf(t):
+    """
+    Sütun tablolarından (NODE_COLUMNS / EDGE_COLUMNS adlarıyla) NetworkX grafı kurar.
+    Sütunlar tek seferde Python listelerine çevrilir ve graf toplu add_nodes_from /
+    add_edges_from ile doldurulur; satır satır DataFrame erişimi yoktur.
+    """
+    import networkx as nx  # Yalnızca graf kurulurken; graf_tablolari() networkx'e ihtiyaç duymaz
 
-    # Her satır bir edge'i temsil eder
-    for _, row in df_edges.iterrows():
-        src = int(row["src"])
-        dst = int(row["dst"])
+    G = nx.Graph()
 
-        G.add_edge(
-            src,
-            dst,
-            bandwidth_mbps   = float(row["capacity_mbps"]),
-            link_delay_ms    = float(row["delay_ms"]),
-            link_reliability = float(row["r_link"])
-        )
+    #  NODE VERİLERİ
+    ids = np.asarray(t["node_id"]).astype(np.int64).tolist()
+    s_ms = np.asarray(t["s_ms"], dtype=float).tolist()
+    r_node = np.asarray(t["r_node"], dtype=float).tolist()
+    G.add_nodes_from(zip(ids, [
+        {'processing_delay_ms': s, 'node_reliability': r} for s, r in zip(s_ms, r_node)
+    ]))
+
+    # EDGE VERİLERİ
+    src = np.asarray(t["src"]).astype(np.int64).tolist()
+    dst = np.asarray(t["dst"]).astype(np.int64).tolist()
+    cap = np.asarray(t["capacity_mbps"], dtype=float).tolist()
+    delay = np.asarray(t["delay_ms"], dtype=float).tolist()
+    r_link = np.asarray(t["r_link"], dtype=float).tolist()
+    G.add_edges_from(zip(src, dst, [
+        {'bandwidth_mbps': b, 'link_delay_ms': d, 'link_reliability': r} for b, d, r in zip(cap, delay, r_link)
+    ]))
 
     return G
 
 
 # Grafik yapısını kontrol et
 def kontrol_yazdir(G):
+    import networkx as nx
+
     print("GRAF HIZLI KONTROL")
     print("Düğüm sayısı:", G.number_of_nodes())
     print("Kenar sayısı:", G.number_of_edges())
@@ -73,7 +138,82 @@ def kontrol_yazdir(G):
     print("Bağlı mı?:", nx.is_connected(G))
 
 
+def _satir_satir_graf(df_nodes, df_edges):
+    """Eski satır satır kurulum (iterrows + add_node/add_edge); yalnızca karşılaştırma için."""
+    import networkx as nx
+
+    G = nx.Graph()
+    for _, row in df_nodes.iterrows():
+        G.add_node(int(row["node_id"]), processing_delay_ms=float(row["s_ms"]),
+                   node_reliability=float(row["r_node"]))
+    for _, row in df_edges.iterrows():
+        G.add_edge(int(row["src"]), int(row["dst"]), bandwidth_mbps=float(row["capacity_mbps"]),
+                   link_delay_ms=float(row["delay_ms"]), link_reliability=float(row["r_link"]))
+    return G
+
+
 # Ana çalıştırma bloğu
 if __name__ == "__main__":
+    import networkx as nx
+    import sys
+    import time
+
+    # Excel ile önbellekten yükleme karşılaştırması
+    start = time.perf_counter()
+    G_excel = graf_uret(cache_path=None)
+    excel_ms = (time.perf_counter() - start) * 1000
+    graf_tablolari()  # Önbelleği hazırla
+
+    start = time.perf_counter()
     G = graf_uret()
+    cache_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Excel: {excel_ms:.0f} ms | Onbellek: {cache_ms:.0f} ms")
+    print("Ayni graf mi?:", nx.utils.graphs_equal(G, G_excel))
     kontrol_yazdir(G)
+
+    # Toplu kurulum karşılaştırması (varsayılan ~1M kenarlı sentetik tablo)
+    # Kullanım: python -m src.generation.generate_graf [düğüm sayısı]
+    import pandas as pd
+    from ..core.compiled import CompiledTopology
+    from ..core.model import NetworkTopology, Node, Link
+    from .synthetic_graf import geometrik_kenarlar, qos_tablolari
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 250_000
+    rng = np.random.default_rng(0)
+    t = qos_tablolari(*geometrik_kenarlar(n, rng), rng)
+    df_nodes = pd.DataFrame({c: t[c] for c in NODE_COLUMNS})
+    df_edges = pd.DataFrame({c: t[c] for c in EDGE_COLUMNS})
+    print(f"\n--- TOPLU KURULUM: {n} dugum, {len(df_edges)} kenar ---")
+
+    start = time.perf_counter()
+    G_old = _satir_satir_graf(df_nodes, df_edges)
+    old_graph_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    G = tablolardan_graf({c: df_nodes[c].to_numpy() for c in NODE_COLUMNS} |
+                         {c: df_edges[c].to_numpy() for c in EDGE_COLUMNS})
+    new_graph_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    topo_old = NetworkTopology()
+    for node_id, data in G.nodes(data=True):
+        topo_old.add_node(Node(id=node_id, processing_delay=data['processing_delay_ms'],
+                               reliability=data['node_reliability']))
+    for u, v, data in G.edges(data=True):
+        topo_old.add_link(Link(source=u, target=v, bandwidth=data['bandwidth_mbps'],
+                               delay=data['link_delay_ms'], reliability=data['link_reliability']))
+    old_topo_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    NetworkTopology.from_nx_graph(G)
+    new_topo_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    CompiledTopology.from_tables(t)
+    compiled_s = time.perf_counter() - start
+
+    print(f"graf_uret (iterrows -> toplu):            {old_graph_s:6.2f} s -> {new_graph_s:6.2f} s")
+    print(f"NetworkTopology.from_nx_graph:            {old_topo_s:6.2f} s -> {new_topo_s:6.2f} s")
+    print(f"CompiledTopology.from_tables (NetworkX'siz): {compiled_s:6.2f} s")
+    print("Ayni graf mi?:", nx.utils.graphs_equal(G, G_old))
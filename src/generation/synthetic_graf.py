@@ -0,0 +1,219 @@
+import math
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Tuple, Union
+
+import numpy as np
+
+from .generate_graf import tablolardan_graf
+
+# Bir dağılım: (alt, üst) düzgün aralığı veya f(rng, boyut) -> dizi
+Dagilim = Union[Tuple[float, float], Callable[[np.random.Generator, int], np.ndarray]]
+
+
+@dataclass
+class QoSDagilimi:
+    """
+    Düğüm ve hat QoS özelliklerinin dağılımları. Alan adları Excel sütunlarıyla aynıdır;
+    varsayılan aralıklar NodeData.xlsx / EdgeData.xlsx içindeki değer aralıklarıdır.
+    """
+    s_ms: Dagilim = (0.5, 2.0)            # processing_delay_ms
+    r_node: Dagilim = (0.95, 0.999)       # node_reliability
+    capacity_mbps: Dagilim = (100.0, 1000.0)  # bandwidth_mbps
+    delay_ms: Dagilim = (3.0, 15.0)       # link_delay_ms
+    r_link: Dagilim = (0.95, 0.999)       # link_reliability
+
+    def ornekle(self, alan, rng, boyut):
+        dagilim = getattr(self, alan)
+        if callable(dagilim):
+            return np.asarray(dagilim(rng, boyut), dtype=float)
+        alt, ust = dagilim
+        return rng.uniform(alt, ust, boyut)
+
+
+# --- Kenar üreticiler: hepsi (düğüm sayısı, kaynak dizisi, hedef dizisi) döndürür ---
+
+def geometrik_kenarlar(n, rng, ortalama_derece=8.0, yaricap=None):
+    """
+    Rastgele geometrik graf: birim karede rastgele noktalar, aralarındaki uzaklık yarıçaptan
+    küçükse kenar. Noktalar yarıçap boyunda hücrelere bölünür ve yalnızca komşu hücreler
+    karşılaştırılır (O(n)); yarıçap verilmezse ortalama dereceden hesaplanır.
+    """
+    r = yaricap if yaricap is not None else math.sqrt(ortalama_derece / (math.pi * n))
+    pos = rng.random((n, 2))
+    g = max(1, int(1.0 / r))  # Hücre kenarı 1/g >= r
+    cx = np.minimum((pos[:, 0] * g).astype(np.int64), g - 1)
+    cy = np.minimum((pos[:, 1] * g).astype(np.int64), g - 1)
+    order = np.argsort(cx * g + cy, kind='stable')
+    counts = np.bincount(cx * g + cy, minlength=g * g)
+    start = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    src, dst = [], []
+    # Her hücre çifti bir kez: kendisi ve "yarım düzlemdeki" 4 komşu
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        nx_, ny_ = cx + dx, cy + dy
+        i = np.flatnonzero((nx_ >= 0) & (nx_ < g) & (ny_ >= 0) & (ny_ < g))
+        cell = nx_[i] * g + ny_[i]
+        cnt = counts[cell]
+        # Her i için komşu hücrenin sıralı dizideki aralığı (parçalı arange)
+        ii = np.repeat(i, cnt)
+        offs = np.repeat(start[cell] - np.cumsum(cnt) + cnt, cnt) + np.arange(cnt.sum())
+        jj = order[offs]
+        keep = ((pos[ii] - pos[jj]) ** 2).sum(axis=1) <= r * r
+        if dx == 0 and dy == 0:
+            keep &= jj > ii
+        src.append(ii[keep])
+        dst.append(jj[keep])
+    return n, np.concatenate(src), np.concatenate(dst)
+
+
+def waxman_kenarlar(n, rng, alpha=0.15, beta=None, ortalama_derece=8.0):
+    """
+    Waxman grafı: u-v kenarı beta * exp(-d / (alpha * L)) olasılıkla (L: en büyük uzaklık).
+    beta verilmezse beklenen ortalama derece ortalama_derece olacak şekilde örneklemeyle ayarlanır.
+    Bütün çiftler satır blokları halinde vektörel denenir; maliyet O(n^2), ~50k düğüme kadar uygundur.
+    """
+    pos = rng.random((n, 2))
+    L = math.sqrt(2.0)
+    if beta is None:
+        a, b = rng.integers(0, n, (2, 200_000))
+        kernel = np.exp(-np.sqrt(((pos[a] - pos[b]) ** 2).sum(axis=1)) / (alpha * L)).mean()
+        beta = min(1.0, ortalama_derece / ((n - 1) * kernel))
+
+    src, dst = [], []
+    block = max(1, (1 << 22) // n)
+    for a in range(0, n, block):
+        rows = np.arange(a, min(a + block, n))
+        d = np.hypot(pos[rows, 0, None] - pos[None, :, 0], pos[rows, 1, None] - pos[None, :, 1])
+        hit = rng.random(d.shape) < beta * np.exp(-d / (alpha * L))
+        hit &= np.arange(n)[None, :] > rows[:, None]
+        r, c = np.nonzero(hit)
+        src.append(rows[r])
+        dst.append(c)
+    return n, np.concatenate(src), np.concatenate(dst)
+
+
+def barabasi_albert_kenarlar(n, rng, m=4):
+    """
+    Barabási–Albert tercihli bağlanma (Batagelj–Brandes yöntemi): her yeni düğüm m kenar açar,
+    hedef daha önceki bütün kenar uçlarından düzgün seçilir (dereceyle orantılı). Ardışık
+    bağımlılık işaretçi atlamasıyla (pointer jumping) vektörel çözülür; öz döngüler ve tekrar
+    eden kenarlar atılır.
+    """
+    M = n * m
+    # Uç dizisi: 2k = k. kenarın kaynağı (k // m), 2k+1 = [0, 2k] aralığında rastgele bir uç
+    ptr = np.arange(2 * M, dtype=np.int64)
+    ptr[1::2] = (rng.random(M) * (2 * np.arange(M) + 1)).astype(np.int64)
+    while True:
+        nxt = ptr[ptr]
+        if np.array_equal(nxt, ptr):
+            break
+        ptr = nxt
+    src = np.arange(M) // m
+    dst = (ptr[1::2] // 2) // m
+
+    keep = src != dst
+    lo, hi = np.minimum(src[keep], dst[keep]), np.maximum(src[keep], dst[keep])
+    key = np.unique(lo * n + hi)
+    return n, key // n, key % n
+
+
+def izgara_kenarlar(n, rng=None, torus=False):
+    """
+    satir x sutun ızgara (torus=True ise kenarlar karşı kenara sarılır). Kareye en yakın
+    boyutlar seçilir, bu yüzden düğüm sayısı n'den biraz az olabilir.
+    """
+    rows = max(1, math.isqrt(n))
+    cols = max(1, n // rows)
+    ids = np.arange(rows * cols).reshape(rows, cols)
+    src = [ids[:, :-1].ravel(), ids[:-1, :].ravel()]
+    dst = [ids[:, 1:].ravel(), ids[1:, :].ravel()]
+    if torus:
+        if cols > 2:
+            src.append(ids[:, -1])
+            dst.append(ids[:, 0])
+        if rows > 2:
+            src.append(ids[-1, :])
+            dst.append(ids[0, :])
+    return rows * cols, np.concatenate(src), np.concatenate(dst)
+
+
+MODELLER = {
+    'geometric': geometrik_kenarlar,
+    'waxman': waxman_kenarlar,
+    'ba': barabasi_albert_kenarlar,
+    'grid': izgara_kenarlar,
+    'torus': lambda n, rng, **kw: izgara_kenarlar(n, rng, torus=True, **kw),
+}
+
+
+def qos_tablolari(n, src, dst, rng, qos=None):
+    """Kenar dizilerine QoS sütunlarını ekler; generate_graf ile aynı sütun tabloları."""
+    qos = qos or QoSDagilimi()
+    m = len(src)
+    return {
+        'node_id': np.arange(n),
+        's_ms': qos.ornekle('s_ms', rng, n),
+        'r_node': qos.ornekle('r_node', rng, n),
+        'src': np.asarray(src),
+        'dst': np.asarray(dst),
+        'capacity_mbps': qos.ornekle('capacity_mbps', rng, m),
+        'delay_ms': qos.ornekle('delay_ms', rng, m),
+        'r_link': qos.ornekle('r_link', rng, m),
+    }
+
+
+def graf_kur(n, src, dst, rng, qos=None):
+    """Kenar dizilerinden QoS özellikli NetworkX grafı (toplu add_nodes_from / add_edges_from)."""
+    return tablolardan_graf(qos_tablolari(n, src, dst, rng, qos))
+
+
+def sentetik_tablolar(model, n, seed=None, qos=None, **params):
+    """
+    Sentetik topolojinin sütun tabloları (generate_graf.graf_tablolari ile aynı adlar);
+    CompiledTopology.from_tables ile NetworkX grafı kurmadan derlenebilir.
+    Parametreler sentetik_graf_uret ile aynıdır.
+    """
+    if model not in MODELLER:
+        raise ValueError(f"Bilinmeyen model: {model} (seçenekler: {', '.join(MODELLER)})")
+    rng = np.random.default_rng(seed)
+    n, src, dst = MODELLER[model](n, rng, **params)
+    return qos_tablolari(n, src, dst, rng, qos)
+
+
+def sentetik_graf_uret(model, n, seed=None, qos=None, **params):
+    """
+    Ölçekleme deneyleri için sentetik topoloji; graf_uret() ile aynı özellik adlarını taşır.
+
+    Parametreler:
+    - model: 'geometric', 'waxman', 'ba', 'grid' veya 'torus'
+    - n: Düğüm sayısı (ızgara modellerinde kareye yuvarlanır)
+    - seed: Tohum; aynı tohum aynı grafı üretir
+    - qos: QoSDagilimi (None: Excel verisindeki aralıklar)
+    - params: Modele özgü parametreler (ortalama_derece, yaricap, alpha, beta, m)
+    """
+    return tablolardan_graf(sentetik_tablolar(model, n, seed, qos, **params))
+
+
+#  ANA CALISTIRMA BLOGU
+if __name__ == "__main__":
+    # Kullanım: python -m src.generation.synthetic_graf [düğüm sayıları...]
+    sizes = [int(x) for x in sys.argv[1:]] or [10_000, 250_000]
+
+    print("\n--- SENTETIK TOPOLOJI URETICI ---\n")
+    print(f"{'Model':<11} {'Dugum':<9} {'Kenar':<10} {'Ort. derece':<12} {'Kenar uretimi(s)':<17} {'Graf kurulumu(s)':<17}")
+    print("-" * 80)
+    for n in sizes:
+        for model in MODELLER:
+            if model == 'waxman' and n > 50_000:
+                continue  # O(n^2)
+            rng = np.random.default_rng(1)
+            start = time.perf_counter()
+            nodes, src, dst = MODELLER[model](n, rng)
+            gen_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            G = graf_kur(nodes, src, dst, rng)
+            build_s = time.perf_counter() - start
+            print(f"{model:<11} {nodes:<9} {G.number_of_edges():<10} {2 * G.number_of_edges() / nodes:<12.2f} {gen_s:<17.2f} {build_s:<17.2f}")
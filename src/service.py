@@ -0,0 +1,558 @@
+"""
+Local route-query service: an asyncio HTTP/JSON server that keeps one compiled topology
+(and its edge-cost tables) in memory and answers route requests from other processes on
+the same host. Qt is never imported.
+
+    python -m src.service [--port 8765] [topology options as in src.cli] [options]
+    python -m src.service --benchmark [--requests N] [--concurrency C]
+
+Endpoints (HTTP/1.1, keep-alive):
+    POST /route    one query object, or a list of them -> one result object / a list
+    GET  /stats    request counts, batch sizes, p50 / p99 latency (ms) and throughput
+    GET  /health   {"status": "ok", "nodes": ..., "links": ...}
+
+Query: {"source": 8, "target": 44, "demand": 150, "weights": [0.33, 0.33, 0.34],
+        "algorithm": "dijkstra", "params": {}, "budget_ms": 250}
+Only source and target are required; algorithm names and params are those of src.cli.
+Result: the demand_stream RESULT_FIELDS (path as a list of node ids) plus latency_ms;
+status is OK, NO_PATH, TIMEOUT (budget_ms exceeded) or ERROR (with "error").
+
+Queued queries are collected into batches: a batch is formed as soon as a pool slot is
+free, so under load the batches grow by themselves (optionally waiting --batch-window-ms
+for more). Queries of one batch with the same algorithm, params and weights go to the
+process pool as one task, where route_chunk answers queries sharing a (source, demand)
+from one shortest-path tree; each worker keeps its trees (TreeCache) across batches.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count
+
+from .cli import ALGORITHMS, STOCHASTIC, add_topology_arguments, load_topology, resolve_solver
+
+DEFAULT_PORT = 8765
+DEFAULT_WEIGHTS = (0.33, 0.33, 0.34)
+MAX_BODY = 1 << 20
+# Part of a query's remaining budget kept back for returning the result from the worker,
+# on top of the largest of the last RETURN_WINDOW measured worker -> event loop delays
+RESULT_MARGIN = 0.005
+RETURN_WINDOW = 64
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large"}
+
+
+class QueryError(ValueError):
+    """Malformed route query (answered with HTTP 400)."""
+
+
+def parse_query(obj):
+    """
+    Validates one query object; returns (group key, source, target, demand, budget seconds).
+    The group key (algorithm, params, weights) decides which queries may share a pool task.
+    """
+    if not isinstance(obj, dict):
+        raise QueryError("query must be a JSON object")
+    try:
+        source, target = int(obj['source']), int(obj['target'])
+        demand = float(obj.get('demand', 0.0))
+        weights = obj.get('weights', DEFAULT_WEIGHTS)
+        if isinstance(weights, dict):
+            weights = (weights['delay'], weights['reliability'], weights['bandwidth'])
+        weights = tuple(float(w) for w in weights)
+        budget = obj.get('budget_ms')
+        budget = None if budget is None else float(budget) / 1000
+    except KeyError as e:
+        raise QueryError(f"missing field {e}") from None
+    except (TypeError, ValueError) as e:
+        raise QueryError(f"invalid field: {e}") from None
+    if len(weights) != 3 or abs(sum(weights) - 1.0) > 1e-5:
+        raise QueryError("weights must be three numbers summing to 1")
+    algorithm = obj.get('algorithm', 'dijkstra')
+    if algorithm not in ALGORITHMS:
+        raise QueryError(f"unknown algorithm {algorithm!r}; one of {', '.join(sorted(ALGORITHMS))}")
+    params = obj.get('params') or {}
+    if not isinstance(params, dict):
+        raise QueryError("params must be a JSON object")
+    try:
+        params = tuple(sorted(params.items()))
+        hash(params)
+    except TypeError:
+        raise QueryError("params values must be numbers, strings or booleans") from None
+    return (algorithm, params, weights), source, target, demand, budget
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile (q in 0..100) of an already sorted list; None when empty."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+class ServiceStats:
+    """Counters and a window of the last `window` query latencies (seconds)."""
+
+    def __init__(self, window=100_000):
+        self.started = time.perf_counter()
+        self.latencies = deque(maxlen=window)
+        self.status = {}
+        self.batches = 0
+        self.tasks = 0
+        self.batched_queries = 0
+
+    def record(self, status, seconds):
+        self.status[status] = self.status.get(status, 0) + 1
+        self.latencies.append(seconds)
+
+    def snapshot(self):
+        latencies = sorted(self.latencies)
+        elapsed = time.perf_counter() - self.started
+        answered = sum(self.status.values())
+
+        def ms(value):
+            return None if value is None else round(value * 1000, 3)
+
+        return {'queries': answered, 'status': dict(self.status), 'batches': self.batches,
+                'pool_tasks': self.tasks,
+                'mean_batch': round(self.batched_queries / self.batches, 2) if self.batches else None,
+                'p50_ms': ms(percentile(latencies, 50)), 'p99_ms': ms(percentile(latencies, 99)),
+                'throughput_qps': round(answered / elapsed, 1) if elapsed > 0 else None,
+                'uptime_s': round(elapsed, 1)}
+
+
+# Pool workers hold the topology (sent once by the initializer) and one TreeCache per weights
+_worker_topo = None
+_worker_seed = None
+_worker_trees = {}
+MAX_TREE_CACHES = 8
+
+
+def _init_worker(topo, warm_weights, seed):
+    global _worker_topo, _worker_seed
+    _worker_topo = topo
+    _worker_seed = seed
+    _worker_trees.clear()
+    for weights in warm_weights:
+        topo.edge_costs(weights)
+
+
+def _solve_group(algorithm, params, weights, demands, deadlines, margin=RESULT_MARGIN):
+    """
+    Pool task: (RESULT_FIELDS rows for demands sharing (algorithm, params, weights),
+    time.monotonic() when they were ready). deadlines are time.monotonic() values (or None);
+    a stochastic algorithm gets the rest of its query's budget minus `margin` seconds as
+    time_limit and returns its best path so far when it runs out.
+    """
+    from .algorithms.Dijkstra import DijkstraSolver
+    from .experiment.demand_stream import TreeCache, route_chunk
+    if algorithm in STOCHASTIC and any(deadline is not None for deadline in deadlines):
+        rows = []
+        for d, deadline in zip(demands, deadlines):
+            bound = dict(params)
+            if deadline is not None:
+                remaining = deadline - time.monotonic() - margin
+                if remaining <= 0:  # Already answered with TIMEOUT by the service
+                    rows.append((d.index, d.src, d.dst, d.demand_mbps, "TIMEOUT") + (None,) * 5 + ("",))
+                    continue
+                bound['time_limit'] = remaining
+            rows.extend(route_chunk(_worker_topo, [d], weights, resolve_solver(algorithm, bound, _worker_seed)))
+        return rows, time.monotonic()
+    solver = resolve_solver(algorithm, dict(params), _worker_seed)
+    trees = None
+    if solver is DijkstraSolver:
+        trees = _worker_trees.pop(weights, None) or TreeCache(_worker_topo, weights)
+        _worker_trees[weights] = trees  # Re-inserted last: the dict order is the LRU order
+        if len(_worker_trees) > MAX_TREE_CACHES:
+            del _worker_trees[next(iter(_worker_trees))]
+    return route_chunk(_worker_topo, demands, weights, solver, trees), time.monotonic()
+
+
+class _Pending:
+    __slots__ = ("key", "demand", "future", "deadline")
+
+    def __init__(self, key, demand, future, deadline):
+        self.key, self.demand, self.future, self.deadline = key, demand, future, deadline
+
+
+class RouteService:
+    """
+    Batching route server around one CompiledTopology.
+
+    workers:          pool processes (default: all CPUs)
+    max_in_flight:    pool tasks queued or running at once (default: 2 x workers); while
+                      all slots are busy, queries queue up and form the next, larger batch
+    batch_window_ms:  extra time to wait for more queries once a batch has started
+    max_batch:        queries per batch
+    default_budget_ms: time budget of queries that do not set budget_ms (None: unlimited)
+    """
+
+    def __init__(self, topo, workers=None, max_in_flight=None, batch_window_ms=0.0, max_batch=512,
+                 default_budget_ms=None, warm_weights=(DEFAULT_WEIGHTS,), seed=None):
+        self.topo = topo
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or 2 * self.workers
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch = max_batch
+        self.default_budget = None if default_budget_ms is None else default_budget_ms / 1000
+        self.warm_weights = tuple(warm_weights)
+        self.seed = seed
+        self.stats = ServiceStats()
+        self._ids = count(1)
+        self._queue = None
+        self._slots = None
+        self._pool = None
+        self._batcher = None
+        self._tasks = set()
+        self._connections = {}
+        self._server = None
+        self._return_delays = deque(maxlen=RETURN_WINDOW)
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT):
+        """Starts the pool, the batcher and the listener; returns the bound (host, port)."""
+        for weights in self.warm_weights:
+            self.topo.edge_costs(weights)
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                         initargs=(self.topo, self.warm_weights, self.seed))
+        self._batcher = asyncio.create_task(self._batch_loop())
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            for writer in self._connections.values():
+                writer.close()  # Idle keep-alive connections see EOF and their handlers return
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    # --- Queries ---
+
+    async def route(self, obj):
+        """Answers one query object (raises QueryError when it is malformed)."""
+        from .experiment.demand_stream import Demand
+        key, source, target, demand, budget = parse_query(obj)
+        if budget is None:
+            budget = self.default_budget
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        future = loop.create_future()
+        deadline = None if budget is None else start + budget  # loop.time() is time.monotonic()
+        self._queue.put_nowait(_Pending(key, Demand(next(self._ids), source, target, demand), future, deadline))
+        result = {'src': source, 'dst': target, 'demand_mbps': demand}
+        try:
+            row = await asyncio.wait_for(asyncio.shield(future), budget)
+            result.update(self._row_dict(row))
+        except asyncio.TimeoutError:
+            future.cancel()  # Dropped by the batcher if it has not been dispatched yet
+            result['status'] = "TIMEOUT"
+        except Exception as e:  # The solver failed in the worker (e.g. unknown parameter)
+            result.update(status="ERROR", error=f"{type(e).__name__}: {e}")
+        seconds = loop.time() - start
+        result['latency_ms'] = round(seconds * 1000, 3)
+        self.stats.record(result['status'], seconds)
+        return result
+
+    @staticmethod
+    def _row_dict(row):
+        from .experiment.demand_stream import RESULT_FIELDS
+        result = dict(zip(RESULT_FIELDS[4:], row[4:]))
+        result['path'] = [int(u) for u in result['path'].split("-")] if result['path'] else []
+        return result
+
+    async def _collect(self):
+        """Waits for the first query, then takes what is queued (up to max_batch)."""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_window
+        while len(batch) < self.max_batch:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._slots.acquire()
+            now = loop.time()
+            groups = {}
+            for pending in await self._collect():
+                if pending.future.done() or (pending.deadline is not None and pending.deadline <= now):
+                    continue  # Timed out while queued: not worth sending to the pool
+                groups.setdefault(pending.key, []).append(pending)
+            if not groups:
+                self._slots.release()
+                continue
+            self.stats.batches += 1
+            self.stats.batched_queries += sum(map(len, groups.values()))
+            for k, (key, group) in enumerate(groups.items()):
+                if k:
+                    await self._slots.acquire()
+                task = asyncio.create_task(self._run_group(key, group))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    def result_margin(self):
+        """Seconds of a query's budget kept back for getting its result from the pool."""
+        return RESULT_MARGIN + max(self._return_delays, default=0.0)
+
+    async def _run_group(self, key, group):
+        algorithm, params, weights = key
+        self.stats.tasks += 1
+        loop = asyncio.get_running_loop()
+        try:
+            rows, ready = await loop.run_in_executor(
+                self._pool, _solve_group, algorithm, params, weights, [p.demand for p in group],
+                [p.deadline for p in group], self.result_margin())
+            self._return_delays.append(max(0.0, loop.time() - ready))
+        except Exception as e:
+            for pending in group:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+        else:
+            for pending, row in zip(group, rows):
+                if not pending.future.done():
+                    pending.future.set_result(row)
+        finally:
+            self._slots.release()
+
+    # --- HTTP ---
+
+    async def _respond(self, method, path, body):
+        if path == "/route":
+            if method != "POST":
+                return 405, {'error': "use POST"}
+            try:
+                payload = json.loads(body or b"null")
+            except ValueError as e:
+                return 400, {'error': f"invalid JSON: {e}"}
+            try:
+                if isinstance(payload, list):
+                    for obj in payload:
+                        parse_query(obj)  # Reject the whole list before routing any of it
+                    return 200, list(await asyncio.gather(*(self.route(obj) for obj in payload)))
+                return 200, await self.route(payload)
+            except QueryError as e:
+                return 400, {'error': str(e)}
+        if path == "/stats" and method == "GET":
+            return 200, self.stats.snapshot()
+        if path == "/health" and method == "GET":
+            return 200, {'status': "ok", 'nodes': self.topo.num_nodes, 'links': self.topo.num_arcs // 2,
+                         'workers': self.workers}
+        return 404, {'error': f"no route for {method} {path}"}
+
+    async def _handle_connection(self, reader, writer):
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY:
+                    status, payload = 413, {'error': f"body larger than {MAX_BODY} bytes"}
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self._respond(method, target.split("?", 1)[0], body)
+                data = json.dumps(payload).encode()
+                close = status == 413 or headers.get("connection", "").lower() == "close"
+                extra = "Connection: close\r\n" if close else ""
+                writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(data)}\r\n{extra}\r\n".encode() + data)
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass  # Client went away or sent something that is not HTTP
+        finally:
+            del self._connections[task]
+            writer.close()
+
+
+class RouteClient:
+    """Minimal keep-alive HTTP/JSON client for the service (one connection, one request at a time)."""
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT):
+        self.host, self.port = host, port
+        self._reader = self._writer = None
+
+    async def request(self, method, path, payload=None):
+        """Returns (HTTP status, decoded JSON body)."""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self._writer.write(f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\n"
+                           f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+        await self._writer.drain()
+        status = int((await self._reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self._reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self._reader.readexactly(length))
+
+    async def route(self, source, target, **query):
+        return (await self.request("POST", "/route", dict(query, source=source, target=target)))[1]
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+
+async def run_load(host, port, queries, concurrency=64):
+    """
+    Sends the queries over `concurrency` keep-alive connections, each waiting for its answer
+    before the next query (closed loop). Returns client-side latencies (s), wall time (s), results.
+    """
+    pending = iter(queries)
+    latencies = []
+    results = []
+
+    async def connection():
+        client = RouteClient(host, port)
+        try:
+            for query in pending:
+                start = time.perf_counter()
+                _, result = await client.request("POST", "/route", query)
+                latencies.append(time.perf_counter() - start)
+                results.append(result)
+        finally:
+            await client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(connection() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - start, results
+
+
+def benchmark_queries(topo, n, hot_sources=32, seed=0):
+    """Query mix of a service client: a few busy sources, random targets, a handful of demands."""
+    rng = random.Random(seed)
+    nodes = topo.nodes()
+    sources = rng.sample(nodes, min(hot_sources, len(nodes)))
+    return [{'source': rng.choice(sources), 'target': rng.choice(nodes),
+             'demand': rng.choice((0.0, 100.0, 500.0))} for _ in range(n)]
+
+
+async def _benchmark(topo, args):
+    queries = benchmark_queries(topo, args.requests, seed=args.seed or 0)
+    print(f"\n--- ROUTE SERVICE BENCHMARK ({topo.num_nodes} nodes, {len(queries)} queries, "
+          f"concurrency {args.concurrency}) ---\n")
+    print(f"{'Mode':<26} {'p50 ms':>8} {'p99 ms':>8} {'queries/s':>10} {'mean batch':>11}")
+    reference = None
+    for label, max_batch, window in (("unbatched", 1, 0.0), ("batched", args.max_batch, args.batch_window_ms)):
+        service = RouteService(topo, args.workers, args.max_in_flight, window, max_batch, args.budget_ms,
+                               seed=args.seed)
+        host, port = await service.start("127.0.0.1", 0)
+        try:
+            await run_load(host, port, queries[:args.concurrency * 2], args.concurrency)  # Warm-up
+            service.stats = ServiceStats()
+            latencies, wall, results = await run_load(host, port, queries, args.concurrency)
+            stats = service.stats.snapshot()
+        finally:
+            await service.close()
+        latencies.sort()
+        print(f"{label:<26} {percentile(latencies, 50) * 1000:8.2f} {percentile(latencies, 99) * 1000:8.2f} "
+              f"{len(latencies) / wall:10,.0f} {stats['mean_batch'] or 0:11.1f}   {stats['status']}")
+        costs = sorted((r['src'], r['dst'], r['demand_mbps'], r.get('cost')) for r in results)
+        if reference is None:
+            reference = costs
+        elif costs != reference:
+            print("  ! results differ from the unbatched run")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m src.service",
+                                     description="Serve route queries over HTTP/JSON on this host.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    add_topology_arguments(parser)
+    parser.add_argument("-j", "--workers", type=int, default=None, help="pool processes (default: all CPUs)")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="pool tasks queued or running at once (default: 2 x workers)")
+    parser.add_argument("--batch-window-ms", type=float, default=0.0,
+                        help="wait this long for more queries once a batch has started (default: 0)")
+    parser.add_argument("--max-batch", type=int, default=512, help="queries per batch")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="time budget of queries that do not set budget_ms (default: unlimited)")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="start a service on a free localhost port, load it and report latency")
+    parser.add_argument("--requests", type=int, default=5000, help="--benchmark: number of queries")
+    parser.add_argument("--concurrency", type=int, default=64, help="--benchmark: client connections")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    start = time.perf_counter()
+    try:
+        topo = load_topology(args)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(f"topology: {topo.num_nodes} nodes, {topo.num_arcs // 2} links "
+          f"({(time.perf_counter() - start) * 1000:.0f} ms)", file=sys.stderr)
+    if args.benchmark:
+        asyncio.run(_benchmark(topo, args))
+        return 0
+
+    async def serve():
+        service = RouteService(topo, args.workers, args.max_in_flight, args.batch_window_ms, args.max_batch,
+                               args.budget_ms, seed=args.seed)
+        host, port = await service.start(args.host, args.port)
+        print(f"serving on http://{host}:{port} ({service.workers} workers)", file=sys.stderr, flush=True)
+        try:
+            await service.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
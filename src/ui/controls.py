@@ -2,7 +2,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QComboBox, QDoubleSpinBox, QPushButton, QGroupBox, QFormLayout, QSpinBox,
     QTabWidget, QListWidget, QListWidgetItem, QLineEdit, QTableWidget, QTableWidgetItem, QHeaderView,
-    QCheckBox, QScrollArea, QFrame
+    QCheckBox, QScrollArea, QFrame, QProgressBar
 )
 from PyQt6.QtCore import pyqtSignal, Qt
 
@@ -66,7 +66,7 @@ class SingleAnalysisPanel(QWidget):
         algo_layout = QVBoxLayout()
         
         self.combo_algo = QComboBox()
-        self.combo_algo.addItems(["Algoritma Seçiniz...", "ACO Algoritma", "Genetik Algoritma", "Q-Learning Algoritma"])
+        self.combo_algo.addItems(["Algoritma Seçiniz...", "ACO Algoritma", "Genetik Algoritma", "Q-Learning Algoritma", "Dijkstra Algoritma", "Pareto Algoritma", "NSGA-II Genetik Algoritma", "CH Algoritma"])
 
 
 
@@ -101,6 +101,13 @@ class SingleAnalysisPanel(QWidget):
         add_weight_row_direct("Güvenilirlik Ağ.:", self.spin_reliability)
         add_weight_row_direct("Kaynak Ağ.:", self.spin_resource)
 
+        # Optional seed: makes stochastic algorithms reproducible and lets their results be cached
+        self.spin_seed = QSpinBox()
+        self.spin_seed.setRange(-1, 999999)
+        self.spin_seed.setValue(-1)
+        self.spin_seed.setSpecialValueText("Rastgele")
+        add_weight_row_direct("Tohum (Seed):", self.spin_seed)
+
         # Connect signals for dynamic limits
         self.spin_delay.valueChanged.connect(self.update_weight_limits)
         self.spin_reliability.valueChanged.connect(self.update_weight_limits)
@@ -112,6 +119,10 @@ class SingleAnalysisPanel(QWidget):
         self.btn_calculate = QPushButton("En İyi Yolu Hesapla")
         self.btn_calculate.setStyleSheet("font-weight: bold; padding: 8px;")
         algo_layout.addWidget(self.btn_calculate)
+
+        self.btn_export_front = QPushButton("Pareto Cephesini Kaydet (CSV)")
+        self.btn_export_front.setEnabled(False) # Enabled once a front has been computed
+        algo_layout.addWidget(self.btn_export_front)
         
         algo_group.setLayout(algo_layout)
         self.layout.addWidget(algo_group)
@@ -127,6 +138,7 @@ class SingleAnalysisPanel(QWidget):
         self.lbl_res_time = QLabel("-")
         self.lbl_res_path = QLabel("-")
         self.lbl_res_path.setWordWrap(True) # Allow long paths to wrap
+        self.lbl_res_cache = QLabel("-")
         
         res_layout.addRow("Toplam Gecikme:", self.lbl_res_delay)
         res_layout.addRow("Toplam Güven.:", self.lbl_res_rel)
@@ -134,6 +146,7 @@ class SingleAnalysisPanel(QWidget):
         res_layout.addRow("Toplam Maliyet:", self.lbl_res_cost)
         res_layout.addRow("Çalışma Süresi:", self.lbl_res_time)
         res_layout.addRow("Bulunan Yol:", self.lbl_res_path)
+        res_layout.addRow("Önbellek:", self.lbl_res_cache)
         res_group.setLayout(res_layout)
         self.layout.addWidget(res_group)
         
@@ -177,6 +190,7 @@ class ExperimentPanel(QWidget):
     Control Panel for Experimental Setup (New Interface).
     """
     run_custom_experiment_signal = pyqtSignal()
+    stop_experiment_signal = pyqtSignal()
     request_random_cases_signal = pyqtSignal()
 
     def __init__(self):
@@ -228,6 +242,7 @@ class ExperimentPanel(QWidget):
         
         case_group.setLayout(case_layout)
         layout.addWidget(case_group)
+        self.case_group = case_group
         
         # 2. Algorithm Selection
         algo_group = QGroupBox("Algoritma")
@@ -249,6 +264,14 @@ class ExperimentPanel(QWidget):
         item_ql = QListWidgetItem("Q-Learning Algoritma")
         item_ql.setCheckState(Qt.CheckState.Unchecked)
         self.list_algos.addItem(item_ql)
+        
+        item_dj = QListWidgetItem("Dijkstra Algoritma")
+        item_dj.setCheckState(Qt.CheckState.Unchecked)
+        self.list_algos.addItem(item_dj)
+
+        item_ch = QListWidgetItem("CH Algoritma")
+        item_ch.setCheckState(Qt.CheckState.Unchecked)
+        self.list_algos.addItem(item_ch)
 
 
 
@@ -257,6 +280,7 @@ class ExperimentPanel(QWidget):
         
         algo_group.setLayout(algo_layout)
         layout.addWidget(algo_group)
+        self.algo_group = algo_group
         
         # 3. Settings
         set_group = QGroupBox("Ayarlar")
@@ -269,6 +293,7 @@ class ExperimentPanel(QWidget):
         
         set_group.setLayout(set_layout)
         layout.addWidget(set_group)
+        self.set_group = set_group
         
 
         
@@ -279,6 +304,17 @@ class ExperimentPanel(QWidget):
         self.btn_run_exp.setStyleSheet("font-weight: bold; background-color: #007bff; color: white; padding: 5px;")
         layout.addWidget(self.btn_run_exp)
         
+        # Progress and stop, active while an experiment runs
+        self.progress_exp = QProgressBar()
+        self.progress_exp.setFormat("%v / %m")
+        self.progress_exp.setVisible(False)
+        layout.addWidget(self.progress_exp)
+        
+        self.btn_stop_exp = QPushButton("Durdur")
+        self.btn_stop_exp.clicked.connect(self.stop_experiment_signal.emit)
+        self.btn_stop_exp.setEnabled(False)
+        layout.addWidget(self.btn_stop_exp)
+        
         layout.addStretch()
 
     def add_case(self):
@@ -297,6 +333,21 @@ class ExperimentPanel(QWidget):
     def clear_cases(self):
         self.table_cases.setRowCount(0)
 
+    def set_running(self, running):
+        """Locks the setup while an experiment runs; only the stop button stays active."""
+        for widget in (self.case_group, self.algo_group, self.set_group, self.btn_run_exp):
+            widget.setEnabled(not running)
+        self.btn_stop_exp.setEnabled(running)
+        if running:
+            self.progress_exp.setRange(0, 0) # Busy indicator until the first progress report
+            self.progress_exp.setVisible(True)
+        else:
+            self.progress_exp.setVisible(False)
+
+    def set_progress(self, done, total):
+        self.progress_exp.setRange(0, total)
+        self.progress_exp.setValue(done)
+
     def update_node_lists(self, num_nodes):
         self.combo_source.clear()
         self.combo_target.clear()
@@ -314,11 +365,14 @@ class ControlPanel(QWidget):
     algorithm_changed_signal = pyqtSignal(str)
     source_changed_signal = pyqtSignal(int)
     target_changed_signal = pyqtSignal(int)
+    weights_changed_signal = pyqtSignal()
+    export_front_signal = pyqtSignal()
     run_experiment_signal = pyqtSignal() # Kept for compatibility if used, but we prefer new one
     
     # New Signal
     request_random_cases_signal = pyqtSignal()
     run_custom_experiment_signal = pyqtSignal() # Forwarded from ExperimentPanel
+    stop_experiment_signal = pyqtSignal() # Forwarded from ExperimentPanel
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -341,11 +395,16 @@ class ControlPanel(QWidget):
         self.pnl_single.combo_algo.currentTextChanged.connect(self.algorithm_changed_signal.emit)
         self.pnl_single.spin_source.valueChanged.connect(self.source_changed_signal.emit)
         self.pnl_single.spin_target.valueChanged.connect(self.target_changed_signal.emit)
+        self.pnl_single.spin_delay.valueChanged.connect(self.weights_changed_signal.emit)
+        self.pnl_single.spin_reliability.valueChanged.connect(self.weights_changed_signal.emit)
+        self.pnl_single.spin_resource.valueChanged.connect(self.weights_changed_signal.emit)
+        self.pnl_single.btn_export_front.clicked.connect(self.export_front_signal.emit)
         
         # Connect Experiment Panel
         # New: Use direct signal proxy, no disconnect hacks
         self.pnl_experiment.request_random_cases_signal.connect(self.request_random_cases_signal.emit)
         self.pnl_experiment.run_custom_experiment_signal.connect(self.run_custom_experiment_signal.emit)
+        self.pnl_experiment.stop_experiment_signal.connect(self.stop_experiment_signal.emit)
 
     # --- Delegated Methods (Single Analysis) ---
 
@@ -357,6 +416,18 @@ class ControlPanel(QWidget):
     def get_selected_algorithm(self):
         return self.pnl_single.combo_algo.currentText()
 
+    def get_seed(self):
+        """Selected seed, or None when stochastic algorithms should stay random."""
+        seed = self.pnl_single.spin_seed.value()
+        return None if seed < 0 else seed
+
+    def set_cache_stats(self, stats):
+        self.pnl_single.lbl_res_cache.setText(
+            f"{stats['hits']} isabet / {stats['misses']} ıska ({stats['size']} kayıt)")
+
+    def set_front_available(self, available):
+        self.pnl_single.btn_export_front.setEnabled(available)
+
     def set_selection_values(self, s, t):
         self.pnl_single.spin_source.blockSignals(True)
         self.pnl_single.spin_target.blockSignals(True)
@@ -421,6 +492,14 @@ class ControlPanel(QWidget):
             "repetitions": reps
         }
     
+    def set_experiment_running(self, running):
+        """Disables everything except the experiment's stop button while it runs."""
+        self.pnl_single.setEnabled(not running)
+        self.pnl_experiment.set_running(running)
+
+    def set_experiment_progress(self, done, total):
+        self.pnl_experiment.set_progress(done, total)
+
     def add_cases_batch(self, cases_list):
         for (s, d, b) in cases_list:
              row = self.pnl_experiment.table_cases.rowCount()
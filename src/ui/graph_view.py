@@ -6,7 +6,6 @@ from PyQt6.QtCore import Qt, QRectF, pyqtSignal, QPointF, QTimer, QSize
 from PyQt6.QtGui import (QPen, QBrush, QColor, QPainter, QFont, QAction, 
                         QRadialGradient, QGradient, QIcon, QPixmap)
 from typing import Dict, Optional, Tuple, List
-import networkx as nx
 import random
 from ..core.model import NetworkTopology, Node
 
@@ -451,6 +450,7 @@ class GraphView(QGraphicsView):
                  num_nodes = len(topology.graph.nodes())
                  k_value = 12.0 / (num_nodes ** 0.5) if num_nodes > 0 else None
                  
+                 import networkx as nx
                  pos = nx.spring_layout(
                      topology.graph, 
                       scale=950, 
@@ -1,20 +1,20 @@
-from PyQt6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QMessageBox, QApplication, QDialog, QTextEdit, QVBoxLayout, QTableWidgetItem
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from typing import Optional, List, Tuple
+from PyQt6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QMessageBox, QApplication, QDialog, QTextEdit, QVBoxLayout, QTableWidgetItem, QFileDialog
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+from typing import TYPE_CHECKING, Optional, List, Tuple
 import random
 import statistics
+import threading
 
+# Only lightweight modules are imported here so the window can appear quickly.
+# networkx, numpy, the data loader and the algorithm modules are imported on first use
+# (topology loading runs in NetworkLoader, solvers are imported in the branch that runs them).
 from ..core.model import NetworkTopology
-
-from ..generation import generate_graf
-from ..algorithms.ACO_Algorithm import AntColonyOptimizer
-from ..algorithms.GeneticAlgorithm import genetic_algorithm
-from ..algorithms.QLearning import QLearningAgent
-from ..algorithms import path_utilities
-
-from ..experiment import runner as experiment_runner
+from ..core.route_cache import RouteCache
 from .results_dialog import ResultsDialog
 
+if TYPE_CHECKING:
+    from ..algorithms.RoutingTable import RoutingTable
+
 from .graph_view import GraphView
 from .controls import ControlPanel
 
@@ -29,82 +29,195 @@ class RoutingResult:
         self.execution_time = execution_time
 
 
+class NetworkLoader(QThread):
+    """Loads the topology off the GUI thread; the window shows a loading state meanwhile."""
+    finished_signal = pyqtSignal(object, object) # (nx.Graph, NetworkTopology)
+    error_signal = pyqtSignal(str)
+
+    def run(self):
+        try:
+            from ..generation import generate_graf
+            from ..core.compiled import CompiledTopology
+            G = generate_graf.graf_uret()
+            topology = NetworkTopology.from_nx_graph(G)
+            CompiledTopology.of(G) # Compile here so the first route does not pay for it
+            self.finished_signal.emit(G, topology)
+        except Exception as e:
+            self.error_signal.emit(str(e))
+
+
 class ComparisonWorker(QThread):
     finished_signal = pyqtSignal(dict)
+    cancelled_signal = pyqtSignal(dict) # Results of the jobs finished before cancel()
+    partial_signal = pyqtSignal(dict) # Results so far, same format as finished_signal
+    progress_signal = pyqtSignal(int, int, float) # (jobs done, total jobs, ETA in seconds)
     error_signal = pyqtSignal(str)
+
+    PARTIAL_INTERVAL = 0.25 # Seconds between partial_signal / progress_signal emissions
+    POLL_INTERVAL = 0.2 # Longest wait for pool results before checking for cancellation
     
-    def __init__(self, G, cases, algorithms, weights, repetitions):
+    def __init__(self, G, cases, algorithms, weights, repetitions, route_cache=None, version=None, workers=None):
         super().__init__()
         self.G = G
         self.cases = cases
         self.algorithms = algorithms
         self.weights = weights
         self.repetitions = repetitions
+        self.tables = {} # demand -> RoutingTable over the case sources
+        # Deterministic baselines are reused across repetitions and comparison runs
+        self.route_cache = route_cache if route_cache is not None else RouteCache(demand_step=0)
+        self.version = version
+        self.workers = workers # Processes for the stochastic runs (None: all CPUs, 1: this thread)
+        self._stop = threading.Event()
         
+    def routing_table(self, demand):
+        """Exact all-pairs table for this comparison's weights, built once per demand level."""
+        if demand not in self.tables:
+            from ..algorithms.RoutingTable import RoutingTable
+            sources = sorted({src for src, _, _ in self.cases})
+            # Built in this thread: a process pool must not be forked from a running QThread
+            self.tables[demand] = RoutingTable.build(self.G, self.weights, demand, sources=sources, workers=1)
+        return self.tables[demand]
+
+    def cancel(self):
+        """
+        Cooperative stop: queued jobs are dropped and running algorithms return at their
+        next iteration; cancelled_signal then carries the results finished so far.
+        """
+        self._stop.set()
+
     def run(self):
         try:
+            import os
             import time
-            from ..core import Metrics as mt
-            
-            # metrics = {algo: {'costs': [], 'times': []}}
-            data = {algo: {'costs': [], 'times': []} for algo in self.algorithms}
+            from collections import deque
+            from concurrent.futures import FIRST_COMPLETED, wait
+            from ..experiment.runner import DETERMINISTIC, ExperimentPool, comparison_job
             
-            # Weights
-            w_d = self.weights[0]
-            w_r = self.weights[1]
-            w_b = self.weights[2]
+            # metrics = {algo: {'costs': [], 'times': [], 'gaps': []}}
+            # 'gaps': cost relative to the exact Dijkstra optimum of the same case (%)
+            data = {algo: {'costs': [], 'times': [], 'gaps': []} for algo in self.algorithms}
+            optimum = {}
             
-            for rep in range(self.repetitions):
-                for (src, dst, demand) in self.cases:
-                    for algo_name in self.algorithms:
-                        
-                        start_time = time.time()
-                        path = None
-                        
-                        try:
-                            if algo_name == "ACO Algoritma":
-                                weights_dict = {'delay': w_d, 'reliability': w_r, 'bandwidth': w_b}
-                                # Create new instance for fairness
-                                aco = AntColonyOptimizer(self.G, src, dst, demand, weights_dict, num_ants=10, max_iter=5)
-                                path, _, _ = aco.run()
-                                
-                            elif algo_name == "Genetik Algoritma":
-                                path = genetic_algorithm(self.G, src, dst, demand_mbps=demand, 
-                                                         w_delay=w_d, w_rel=w_r, w_band=w_b)
-                                
-                            elif algo_name == "Q-Learning Algoritma":
-                                params = {'alpha': 0.1, 'gamma': 0.9, 'epsilon': 0.1, 'episodes': 2000}
-                                agent = QLearningAgent(src, dst, self.G, alpha=params['alpha'], gamma=params['gamma'], epsilon=params['epsilon'], episodes=params['episodes'])
-                                agent.train()
-                                path = agent.get_best_path()
-                        except Exception:
-                            path = None # Fail safely
-                            
-                        duration = time.time() - start_time
-                        
-                        # Calculate Cost
-                        if path:
-                            d = mt.Total_Delay(self.G, path)
-                            r = mt.Total_Reliability(self.G, path)
-                            b = mt.Total_Bandwidth(self.G, path)
-                            
-                            # Penalty if bandwidth not met
-                            penalty = 500 if b < demand else 0
-                            
-                            cost = (w_d * d) + (w_r * r) + (w_b * (1000/(b+0.1))) + penalty
-                            
-                            data[algo_name]['costs'].append(cost)
-                            data[algo_name]['times'].append(duration)
-                        else:
-                            pass 
-
-            self.finished_signal.emit(data)
+            # Stochastic runs are independent jobs for a process pool; Dijkstra / CH answer
+            # from the routing tables and the route cache in this thread
+            jobs = [(algo_name, src, dst, demand) for rep in range(self.repetitions)
+                    for (src, dst, demand) in self.cases for algo_name in self.algorithms]
+            workers = self.workers or os.cpu_count() or 1
+            pooled = any(algo_name not in DETERMINISTIC for algo_name, _, _, _ in jobs)
+            pool = ExperimentPool(self.G, workers) if workers > 1 and pooled else None
+
+            start_time = time.time()
+            progress = {'done': 0, 'emitted': 0.0}
+
+            def record(job, path, duration):
+                algo_name, src, dst, demand = job
+                
+                # Calculate Cost
+                if path:
+                    cost = self.case_cost(path, demand)
+                    
+                    data[algo_name]['costs'].append(cost)
+                    data[algo_name]['times'].append(duration)
+
+                    # Optimality gap against the exact solution (computed once per case)
+                    key = (src, dst, demand)
+                    if key not in optimum:
+                        opt_path, _ = self.routing_table(demand).lookup(src, dst)
+                        optimum[key] = self.case_cost(opt_path, demand) if opt_path else None
+                    if optimum[key]:
+                        data[algo_name]['gaps'].append(100.0 * (cost - optimum[key]) / optimum[key])
+
+                progress['done'] += 1
+                now = time.time()
+                if now - progress['emitted'] >= self.PARTIAL_INTERVAL or progress['done'] == len(jobs):
+                    progress['emitted'] = now
+                    done = progress['done']
+                    self.progress_signal.emit(done, len(jobs), (now - start_time) / done * (len(jobs) - done))
+                    self.partial_signal.emit(self.snapshot(data))
+
+            try:
+                futures = {}
+                local = deque()
+                for job in jobs:
+                    if pool is not None and job[0] not in DETERMINISTIC:
+                        futures[pool.submit(comparison_job, *job, self.weights)] = job
+                    else:
+                        local.append(job)
+                
+                # Results are recorded as they complete; in-thread jobs run between pool polls
+                pending = set(futures)
+                while (pending or local) and not self._stop.is_set():
+                    if local:
+                        job = local.popleft()
+                        result = self.solve(*job)
+                        if self._stop.is_set():
+                            break # The run may have returned early on the stop event
+                        record(job, *result)
+                    finished, pending = wait(pending, timeout=0 if local else self.POLL_INTERVAL,
+                                             return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        if self._stop.is_set():
+                            break # Jobs finishing now may have been cut short by the stop event
+                        record(futures[future], *future.result())
+            finally:
+                if pool is not None:
+                    pool.close(cancel=True)
+
+            if self._stop.is_set():
+                self.cancelled_signal.emit(self.snapshot(data))
+            else:
+                self.finished_signal.emit(data)
             
         except Exception as e:
             self.error_signal.emit(str(e))
 
+    @staticmethod
+    def snapshot(data):
+        """Copy of the results for another thread; the lists keep growing in this one."""
+        return {algo: {key: list(values) for key, values in metrics.items()} for algo, metrics in data.items()}
+
+    def solve(self, algo_name, src, dst, demand):
+        """One timed run in this thread -> (path or None, seconds)."""
+        import time
+        from ..experiment.runner import DETERMINISTIC, comparison_run
+        if algo_name not in DETERMINISTIC:
+            return comparison_run(self.G, algo_name, src, dst, demand, self.weights, self._stop)
+        
+        start_time = time.time()
+        try:
+            if algo_name == "Dijkstra Algoritma":
+                path = self.route_cache.get_or_compute(
+                    algo_name, src, dst, demand, self.weights, self.version,
+                    lambda dm: self.routing_table(dm).lookup(src, dst)[0])
+            else:
+                from ..algorithms.ContractionHierarchy import CHSolver
+                # Hierarchy is built on the first query of each demand class
+                path = self.route_cache.get_or_compute(
+                    algo_name, src, dst, demand, self.weights, self.version,
+                    lambda dm: CHSolver(self.G, src, dst, dm, self.weights).run()[0])
+        except Exception:
+            path = None # Fail safely
+        return path, time.time() - start_time
+
+
+    def case_cost(self, path, demand):
+        """
+        Weighted total of the path (Metrics.evaluate_path), the objective the routing table
+        minimises, so costs and optimality gaps are on the experiment runner's scale.
+        """
+        from ..core import Metrics as mt
+        pm = mt.evaluate_path(self.G, path, self.weights)
+        
+        # Penalty if the bottleneck bandwidth does not meet the demand
+        penalty = 500 if pm.min_bandwidth < demand else 0
+        
+        return pm.total + penalty
+
 
 class MainWindow(QMainWindow):
+    network_ready = pyqtSignal() # Emitted each time a topology has finished loading
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Akilli-Rota-Bulucu")
@@ -129,6 +242,12 @@ class MainWindow(QMainWindow):
         self.source_id: Optional[int] = None
         self.target_id: Optional[int] = None
         self.worker = None # For Threading
+        self.results_dialog = None # Live ResultsDialog of the running / last comparison
+        self.loader = None # NetworkLoader while a topology is being loaded
+        self.pareto_front = None # (source, target, ParetoFront) of the last Pareto / NSGA-II solve
+        self.routing_table: Optional['RoutingTable'] = None # All-pairs table for the last Dijkstra weights/demand
+        self.route_cache = RouteCache(demand_step=0) # Single-analysis results; algorithms run with the exact demand
+        self.comparison_cache = RouteCache(demand_step=0) # Comparison baselines use exact case demands
         
         # Connect Signals
         self.controls.generate_signal.connect(self.generate_network)
@@ -138,23 +257,58 @@ class MainWindow(QMainWindow):
         # Connect Manual Selection Signals
         self.controls.source_changed_signal.connect(self.on_manual_source_changed)
         self.controls.target_changed_signal.connect(self.on_manual_target_changed)
+        self.controls.weights_changed_signal.connect(self.on_weights_changed)
+        self.controls.export_front_signal.connect(self.export_pareto_front)
         
         # Connect Experiment Signals
         self.controls.request_random_cases_signal.connect(self.generate_random_cases)
         self.controls.run_custom_experiment_signal.connect(self.run_custom_experiment)
+        self.controls.stop_experiment_signal.connect(self.stop_experiment)
         
-        # Initial Generation
-        self.generate_network()
+        # Initial Generation: started once the event loop runs, so the window paints first
+        QTimer.singleShot(0, self.generate_network)
 
     def generate_network(self):
+        """Starts loading the topology in the background; controls are disabled until it is ready."""
+        if self.loader is not None and self.loader.isRunning():
+            return
+        self.statusBar().showMessage("Ağ yükleniyor...")
+        self.controls.setEnabled(False)
+        self.loader = NetworkLoader()
+        self.loader.finished_signal.connect(self.on_network_loaded)
+        self.loader.error_signal.connect(self.on_network_error)
+        self.loader.start()
+
+    def on_topology_changed(self, change):
+        """Results derived from the previous topology version are no longer valid."""
+        self.routing_table = None
+        self.pareto_front = None
+        self.controls.set_front_available(False)
+
+    def on_network_error(self, err):
+        self.statusBar().showMessage("Hata")
+        self.controls.setEnabled(True)
+        QMessageBox.critical(self, "Hata", f"Ağ oluşturulamadı: {err}")
+
+    def on_network_loaded(self, G, topology):
         try:
-            # Use the new generation logic from graf_uret
-            G = generate_graf.graf_uret()
             # Store Raw Graph
             self.G = G
+            self.pareto_front = None
+            self.routing_table = None
+            self.route_cache.clear() # Old entries can no longer match the new topology version
+            self.comparison_cache.clear()
+            self.controls.set_front_available(False)
             
-            # Convert to our UI model
-            self.topology = NetworkTopology.from_nx_graph(G)
+            # UI model, converted by the loader
+            self.topology = topology
+            # In-place link/node updates are applied to self.G (the graph the algorithms use)
+            # and reset what was derived from it, before the caches migrate their entries
+            self.topology.mirror_to(self.G)
+            self.topology.add_listener(self.on_topology_changed)
+            # In-place link/node updates migrate still-valid cached routes instead of dropping them
+            self.topology.add_listener(self.route_cache.on_topology_change)
+            self.topology.add_listener(self.comparison_cache.on_topology_change)
             
             self.graph_view.set_topology(self.topology)
             
@@ -166,9 +320,13 @@ class MainWindow(QMainWindow):
             self.target_id = None
             self.update_selection_ui()
             self.controls.show_results(None)
+            self.statusBar().showMessage("Ağ hazır", 3000)
+            self.network_ready.emit()
             
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Ağ oluşturulamadı: {str(e)}")
+        finally:
+            self.controls.setEnabled(True)
 
     def on_node_selected(self, node_id: int):
         if self.source_id is None:
@@ -245,36 +403,74 @@ class MainWindow(QMainWindow):
             # Use stored graph
             G_algo = self.G
             
+            S, D = self.source_id, self.target_id
+            seed = self.controls.get_seed()
+            version = self.topology.version
+
+            def cached(compute, weights=weights_dict):
+                # Deterministic algorithms always hit the cache; stochastic ones only with a seed
+                return self.route_cache.get_or_compute(algo_name, S, D, 0.1, weights, version, compute, seed)
+
             if algo_name == "ACO Algoritma":
-                aco = AntColonyOptimizer(
+                from ..algorithms.ACO_Algorithm import AntColonyOptimizer
+                final_path = cached(lambda demand: AntColonyOptimizer(
                     G_algo, 
-                    self.source_id, 
-                    self.target_id, 
-                    demand=0.1, 
+                    S, 
+                    D, 
+                    demand=demand, 
                     weights=weights_dict,
                     num_ants=10, 
                     max_iter=5 
-                )
-                best_path, cost, metrics = aco.run()
-                final_path = best_path
+                ).run()[0])
                 
             elif algo_name == "Genetik Algoritma":
-                best_path = genetic_algorithm(
+                from ..algorithms.GeneticAlgorithm import genetic_algorithm
+                final_path = cached(lambda demand: genetic_algorithm(
                     G_algo,
-                    self.source_id, 
-                    self.target_id,
-                    demand_mbps=0.1,
+                    S, 
+                    D,
+                    demand_mbps=demand,
                     w_delay=weights_dict['delay'],
                     w_rel=weights_dict['reliability'],
                     w_band=weights_dict['bandwidth']
-                )
-                final_path = best_path
+                ))
  
             elif algo_name == "Q-Learning Algoritma":
-                agent = QLearningAgent(self.source_id, self.target_id, G=G_algo)
-                agent.train() 
-                final_path = agent.get_best_path()
+                from ..algorithms.QLearning import QLearningAgent
+                def train(demand):
+                    agent = QLearningAgent(S, D, G=G_algo)
+                    agent.train() 
+                    return agent.get_best_path()
+                final_path = cached(train)
+
+            elif algo_name == "Dijkstra Algoritma":
+                # All-pairs table is built once per weights/demand; later clicks are a lookup.
+                # workers=1: forking a process pool from the GUI process is not safe with Qt
+                from ..algorithms.RoutingTable import RoutingTable
+                def lookup(demand):
+                    if self.routing_table is None or not self.routing_table.matches(weights_dict, demand):
+                        self.routing_table = RoutingTable.build(G_algo, weights_dict, demand=demand, workers=1)
+                    return self.routing_table.lookup(S, D)[0]
+                final_path = cached(lookup)
 
+            elif algo_name == "CH Algoritma":
+                # Contraction hierarchy is built once per weights/demand and kept on the topology
+                from ..algorithms.ContractionHierarchy import CHSolver
+                final_path = cached(lambda demand: CHSolver(G_algo, S, D, demand, weights_dict).run()[0])
+
+            elif algo_name in ("Pareto Algoritma", "NSGA-II Genetik Algoritma"):
+                # The front does not depend on the weights, so it is cached without them
+                # and weight changes only re-pick from it
+                if algo_name == "Pareto Algoritma":
+                    from ..algorithms.Pareto import ParetoLabelSetting
+                    front = cached(lambda demand: ParetoLabelSetting(G_algo, S, D, demand=demand).run(), weights=None)
+                else:
+                    # Approximate front in a single GA run
+                    from ..algorithms.GeneticAlgorithm import nsga2_genetic_algorithm
+                    front = cached(lambda demand: nsga2_genetic_algorithm(G_algo, S, D, demand_mbps=demand), weights=None)
+                self.pareto_front = (S, D, front)
+                self.controls.set_front_available(len(front) > 0)
+                final_path, cost, metrics = front.best(weights_dict)
 
             else:
                  QMessageBox.information(self, "Bilgi", f"{algo_name} henüz bağlanmadı.")
@@ -283,6 +479,7 @@ class MainWindow(QMainWindow):
 
             end_time = time.time()
             duration = end_time - start_time
+            self.controls.set_cache_stats(self.route_cache.stats())
             
             if final_path:
                 # Calculate metrics for display
@@ -290,14 +487,11 @@ class MainWindow(QMainWindow):
                 
                 # Re-calculate metrics using raw graph to match algorithm logic
                 from ..core import Metrics as mt
-                d = mt.Total_Delay(G_algo, final_path)
-                r = mt.Total_Reliability(G_algo, final_path)
-                b = mt.Total_Bandwidth(G_algo, final_path)
+                pm = mt.evaluate_path(G_algo, final_path, weights_dict)
+                d, r, b = pm.delay, pm.reliability, pm.bandwidth
                 
                 # Total cost based on weights
-                total_cost = (weights_dict['delay'] * d) + \
-                             (weights_dict['reliability'] * r) + \
-                             (weights_dict['bandwidth'] * b)
+                total_cost = pm.total
                              
                 result_obj = RoutingResult(
                     path_nodes=final_path,
@@ -321,6 +515,33 @@ class MainWindow(QMainWindow):
         finally:
             QApplication.restoreOverrideCursor()
 
+    def on_weights_changed(self):
+        """Re-pick the Pareto optimum for the new weights without re-running the solver."""
+        if self.controls.get_selected_algorithm() not in ("Pareto Algoritma", "NSGA-II Genetik Algoritma") or self.pareto_front is None:
+            return
+        source, target, front = self.pareto_front
+        if (source, target) != (self.source_id, self.target_id):
+            return
+        weights_tuple = self.controls.get_weights()
+        if abs(sum(weights_tuple) - 1.0) > 1e-5:
+            return
+
+        import time
+        start_time = time.time()
+        path, cost, metrics = front.best(weights_tuple)
+        if not path:
+            return
+        result_obj = RoutingResult(
+            path_nodes=[int(n) for n in path],
+            total_delay=metrics['delay'],
+            total_reliability=metrics['rel_cost'],
+            resource_cost=metrics['bw_cost'],
+            total_cost=cost,
+            execution_time=time.time() - start_time
+        )
+        self.graph_view.highlight_path(result_obj.path_nodes)
+        self.controls.show_results(result_obj)
+
     # --- Experiment Logic ---
 
     def generate_random_cases(self):
@@ -369,31 +590,74 @@ class MainWindow(QMainWindow):
         
         # Start Worker
         # Use CORRECT G
-        self.worker = ComparisonWorker(self.G, cases, algo_names, weights, reps)
+        self.worker = ComparisonWorker(self.G, cases, algo_names, weights, reps,
+                                       route_cache=self.comparison_cache, version=self.topology.version)
         self.worker.finished_signal.connect(self.on_experiment_finished)
+        self.worker.cancelled_signal.connect(self.on_experiment_cancelled)
+        self.worker.partial_signal.connect(self.on_experiment_partial)
+        self.worker.progress_signal.connect(self.on_experiment_progress)
         self.worker.error_signal.connect(self.on_experiment_error)
         
-        self.statusBar().showMessage("Karşılaştırma yapılıyor, lütfen bekleyin...")
-        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        self.controls.setEnabled(False) 
+        # Results are shown (non-modal) from the start and filled in as jobs finish
+        if self.results_dialog is not None:
+            self.results_dialog.close()
+        empty = {algo: {'costs': [], 'times': [], 'gaps': []} for algo in algo_names}
+        self.results_dialog = ResultsDialog(empty, self, running=True)
+        self.results_dialog.update_results(empty, "başlatılıyor...", running=True)
+        self.results_dialog.show()
+        
+        self.statusBar().showMessage("Karşılaştırma yapılıyor...")
+        self.controls.set_experiment_running(True)
         
         self.worker.start()
 
+    def stop_experiment(self):
+        if self.worker is not None and self.worker.isRunning():
+            self.statusBar().showMessage("Karşılaştırma durduruluyor...")
+            self.worker.cancel()
+
+    def on_experiment_progress(self, done, total, eta):
+        self.controls.set_experiment_progress(done, total)
+        self.statusBar().showMessage(f"Karşılaştırma yapılıyor: {done} / {total} iş, kalan süre ~{eta:.0f} sn")
+
+    def on_experiment_partial(self, results):
+        if self.results_dialog is not None:
+            self.results_dialog.update_results(results, "devam ediyor...", running=True)
+
+    def show_experiment_results(self, results, status=None):
+        if self.results_dialog is None:
+            self.results_dialog = ResultsDialog(results, self)
+        self.results_dialog.update_results(results, status)
+        self.results_dialog.show() # Reopened if it was closed during the run
+        self.results_dialog.raise_()
+
     def on_experiment_finished(self, results):
         self.statusBar().showMessage("Deney Tamamlandı")
-        QApplication.restoreOverrideCursor()
-        self.controls.setEnabled(True)
-        
-        # Show Results Dialog
-        dlg = ResultsDialog(results, self)
-        dlg.exec()
+        self.controls.set_experiment_running(False)
+        self.show_experiment_results(results)
 
-        # Show Results Dialog
-        dlg = ResultsDialog(results, self)
-        dlg.exec()
+    def on_experiment_cancelled(self, results):
+        self.statusBar().showMessage("Deney durduruldu")
+        self.controls.set_experiment_running(False)
+        self.show_experiment_results(results, "durduruldu, kısmi sonuçlar")
 
     def on_experiment_error(self, err):
         self.statusBar().showMessage("Hata")
-        QApplication.restoreOverrideCursor()
-        self.controls.setEnabled(True)
+        self.controls.set_experiment_running(False)
+        if self.results_dialog is not None:
+            self.results_dialog.close()
         QMessageBox.critical(self, "Deney Hatası", str(err))
+
+    def export_pareto_front(self):
+        """Save the last computed Pareto front (exact or NSGA-II) as CSV."""
+        if self.pareto_front is None:
+            return
+        source, target, front = self.pareto_front
+        path, _ = QFileDialog.getSaveFileName(self, "Pareto Cephesini Kaydet", f"pareto_{source}_{target}.csv", "CSV Files (*.csv)")
+        if not path:
+            return
+        try:
+            front.export_csv(path)
+            QMessageBox.information(self, "Başarılı", f"{len(front)} çözüm kaydedildi:\n{path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Kaydetme hatası: {str(e)}")
@@ -11,32 +11,40 @@ class ResultsDialog(QDialog):
     Displays the comparison results (dictionary format) in a table.
     expected results format:
     {
-       'AlgorithmName': {'costs': [c1, c2, ...], 'times': [t1, t2, ...]},
+       'AlgorithmName': {'costs': [c1, c2, ...], 'times': [t1, t2, ...], 'gaps': [g1, ...]},
        ...
     }
+    'gaps' (optional) holds the % cost gap to the exact Dijkstra optimum per run.
+
+    With running=True the dialog is shown while the experiment is still going and
+    update_results() refreshes it; algorithms without a result yet are not marked FAIL.
     """
-    def __init__(self, results_data, parent=None):
+    TITLE = "Algoritma Performans Karşılaştırması"
+
+    def __init__(self, results_data, parent=None, running=False):
         super().__init__(parent)
         self.setWindowTitle("Karşılaştırmalı Analiz Sonuçları")
         self.resize(1000, 500)
         self.results_data = results_data
+        self.running = running
         
         layout = QVBoxLayout(self)
         
         # Header
-        lbl_info = QLabel("Algoritma Performans Karşılaştırması")
+        lbl_info = QLabel(self.TITLE)
         font = lbl_info.font()
         font.setBold(True)
         font.setPointSize(12)
         lbl_info.setFont(font)
         lbl_info.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(lbl_info)
+        self.lbl_info = lbl_info
         
         # Table
         self.table = QTableWidget()
         columns = [
             "Algoritma", "Ort. Maliyet", "En İyi Maliyet", "En Kötü Maliyet", 
-            "Std. Sapma", "Ort. Süre (s)"
+            "Std. Sapma", "Ort. Süre (s)", "Opt. Farkı (%)"
         ]
         self.table.setColumnCount(len(columns))
         self.table.setHorizontalHeaderLabels(columns)
@@ -51,6 +59,7 @@ class ResultsDialog(QDialog):
         btn_layout = QHBoxLayout()
         self.btn_export = QPushButton("Sonuçları Kaydet (TXT)")
         self.btn_export.clicked.connect(self.export_results)
+        self.btn_export.setEnabled(not running)
         self.btn_close = QPushButton("Kapat")
         self.btn_close.clicked.connect(self.accept)
         
@@ -60,6 +69,14 @@ class ResultsDialog(QDialog):
         
         layout.addLayout(btn_layout)
 
+    def update_results(self, results_data, status=None, running=False):
+        """Shows new (partial or final) results; status is appended to the header."""
+        self.results_data = results_data
+        self.running = running
+        self.lbl_info.setText(f"{self.TITLE} ({status})" if status else self.TITLE)
+        self.btn_export.setEnabled(not running)
+        self.populate_table()
+
     def populate_table(self):
         self.table.setRowCount(0)
         
@@ -73,13 +90,19 @@ class ResultsDialog(QDialog):
             # Algorithm Name
             self.table.setItem(row, 0, QTableWidgetItem(algo_name))
             
+            if not costs and self.running:
+                # No finished run yet
+                for c in range(1, self.table.columnCount()):
+                    self.table.setItem(row, c, QTableWidgetItem("-"))
+                continue
+            
             if not costs:
                 # FAIL case
                 item_fail = QTableWidgetItem("FAIL")
                 item_fail.setForeground(Qt.GlobalColor.red)
                 self.table.setItem(row, 1, item_fail)
                 # Fill rest with dashes
-                for c in range(2, 6):
+                for c in range(2, self.table.columnCount()):
                     self.table.setItem(row, c, QTableWidgetItem("-"))
                 continue
             
@@ -96,6 +119,12 @@ class ResultsDialog(QDialog):
             self.table.setItem(row, 3, QTableWidgetItem(f"{max_cost:.4f}"))
             self.table.setItem(row, 4, QTableWidgetItem(f"{std_dev:.4f}"))
             self.table.setItem(row, 5, QTableWidgetItem(f"{avg_time:.4f}"))
+            self.table.setItem(row, 6, QTableWidgetItem(self.format_gap(metrics)))
+
+    @staticmethod
+    def format_gap(metrics):
+        gaps = metrics.get('gaps')
+        return f"{statistics.mean(gaps):.2f}" if gaps else "-"
 
 
     def export_results(self):
@@ -109,7 +138,7 @@ class ResultsDialog(QDialog):
                 f.write(f"Karşılaştırmalı Analiz Raporu - {datetime.datetime.now()}\n")
                 f.write("="*100 + "\n")
                 # Header
-                f.write(f"{'Algoritma':<25} | {'Ort. Maliyet':<15} | {'En İyi':<12} | {'En Kötü':<12} | {'Std. Sapma':<12} | {'Süre (s)':<10}\n")
+                f.write(f"{'Algoritma':<25} | {'Ort. Maliyet':<15} | {'En İyi':<12} | {'En Kötü':<12} | {'Std. Sapma':<12} | {'Süre (s)':<10} | {'Opt. Farkı (%)':<14}\n")
                 f.write("-" * 100 + "\n")
                 
                 for algo_name, metrics in self.results_data.items():
@@ -117,7 +146,7 @@ class ResultsDialog(QDialog):
                     times = metrics['times']
                     
                     if not costs:
-                        f.write(f"{algo_name:<25} | {'FAIL':<15} | {'-':<12} | {'-':<12} | {'-':<12} | {'-':<10}\n")
+                        f.write(f"{algo_name:<25} | {'FAIL':<15} | {'-':<12} | {'-':<12} | {'-':<12} | {'-':<10} | {'-':<14}\n")
                         continue
                         
                     avg_cost = statistics.mean(costs)
@@ -132,7 +161,8 @@ class ResultsDialog(QDialog):
                         f"{min_cost:<12.4f} | "
                         f"{max_cost:<12.4f} | "
                         f"{std_dev:<12.4f} | "
-                        f"{avg_time:<10.4f}"
+                        f"{avg_time:<10.4f} | "
+                        f"{self.format_gap(metrics):<14}"
                     )
                     f.write(line + "\n")
             
@@ -0,0 +1,87 @@
+import csv
+import json
+import subprocess
+import sys
+
+import pytest
+
+from src import cli
+from src.algorithms.Dijkstra import DijkstraSolver
+from src.core.compiled import CompiledTopology
+from src.experiment.demand_stream import RESULT_FIELDS
+from src.experiment.startup_benchmark import ROOT
+from src.generation.synthetic_graf import sentetik_tablolar
+
+WEIGHTS = (0.33, 0.33, 0.34)
+SYNTHETIC = ["--synthetic", "geometric", "150", "--seed", "3"]
+DEMANDS = [(0, 149, 0), (0, 75, 200), (10, 20, 150), (10, 20, 150), (33, 33, 0), (0, 999, 10), (5, 140, 900)]
+
+
+@pytest.fixture
+def demand_file(tmp_path):
+    path = tmp_path / "demands.csv"
+    with open(path, "w", newline="") as f:
+        out = csv.writer(f, delimiter=";")
+        out.writerow(["src", "dst", "demand_mbps"])
+        out.writerows(DEMANDS)
+    return str(path)
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        assert tuple(next(reader)) == RESULT_FIELDS
+        return [dict(zip(RESULT_FIELDS, row)) for row in reader]
+
+
+def test_cli_rows_match_dijkstra(demand_file, tmp_path):
+    out = str(tmp_path / "results.csv")
+    proc = subprocess.run([sys.executable, "-m", "src.cli", demand_file, "-o", out, "-j", "1"] + SYNTHETIC,
+                          cwd=ROOT, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+
+    topo = CompiledTopology.from_tables(sentetik_tablolar("geometric", 150, seed=3))
+    rows = read_rows(out)
+    assert [(int(r['src']), int(r['dst']), float(r['demand_mbps'])) for r in rows] == DEMANDS
+    for row, (S, D, demand) in zip(rows, DEMANDS):
+        if not (topo.has_node(S) and topo.has_node(D)):
+            assert row['status'] == "NO_PATH"
+            continue
+        path, cost, _ = DijkstraSolver(topo, S, D, demand, WEIGHTS).run()
+        if path is None:
+            assert row['status'] == "NO_PATH" and row['cost'] == ""
+        else:
+            assert row['status'] == "OK"
+            assert row['path'] == "-".join(map(str, path))
+            assert float(row['cost']) == pytest.approx(cost, rel=1e-9)
+
+
+def test_saved_topology_gives_the_same_results(demand_file, tmp_path):
+    topo_dir = str(tmp_path / "topo")
+    first, second = str(tmp_path / "a.jsonl"), str(tmp_path / "b.jsonl")
+
+    assert cli.main([demand_file, "-o", first, "-q", "-j", "1", "--save-topology", topo_dir] + SYNTHETIC) == 0
+    assert cli.main([demand_file, "-o", second, "-q", "-j", "1", "--topology", topo_dir]) == 0
+
+    with open(first) as a, open(second) as b:
+        assert [json.loads(line) for line in a] == [json.loads(line) for line in b]
+
+
+def test_seeded_stochastic_rows_do_not_depend_on_chunking(demand_file, tmp_path):
+    outputs = []
+    for chunk_size in ("1", "4"):
+        out = str(tmp_path / f"aco_{chunk_size}.csv")
+        assert cli.main([demand_file, "-o", out, "-q", "-j", "1", "-a", "aco", "-p", "num_ants=4",
+                         "-p", "max_iter=3", "--chunk-size", chunk_size] + SYNTHETIC) == 0
+        outputs.append(read_rows(out))
+    assert outputs[0] == outputs[1]
+
+
+def test_invalid_arguments(demand_file, tmp_path, capsys):
+    out = str(tmp_path / "results.csv")
+    assert cli.main([demand_file, "-o", out, "-w", "0.5", "0.5", "0.5"] + SYNTHETIC) == 2
+    assert cli.main([demand_file, "-o", str(tmp_path / "results.xml"), "-q", "-j", "1"] + SYNTHETIC) == 1
+    assert "error" in capsys.readouterr().err
+    assert cli.parse_param("max_delay=80") == ("max_delay", 80)
+    assert cli.parse_param("time_limit=0.5") == ("time_limit", 0.5)
+    assert cli.parse_param("bidirectional=False") == ("bidirectional", False)
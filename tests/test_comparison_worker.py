@@ -0,0 +1,81 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from src.generation.synthetic_graf import sentetik_graf_uret  # noqa: E402
+from src.ui.main_window import ComparisonWorker  # noqa: E402
+
+WEIGHTS = (0.33, 0.33, 0.34)
+CASES = [(0, 90, 0.0), (12, 70, 0.0)]
+ALGORITHMS = ["Dijkstra Algoritma", "ACO Algoritma"]
+
+
+def run_worker(worker, cancel_at):
+    """
+    Runs the worker in this thread (signals are then delivered directly) and cancels it once
+    cancel_at(worker, progress) returns True. Returns the partial results and the final signal.
+    """
+    log = {'partial': [], 'progress': []}
+    worker.PARTIAL_INTERVAL = 0  # A partial result after every recorded run
+
+    def on_progress(done, total, eta):
+        log['progress'].append(done)
+        if cancel_at(worker, log['progress']):
+            worker.cancel()
+
+    worker.progress_signal.connect(on_progress)
+    worker.partial_signal.connect(lambda results: log['partial'].append(results))
+    worker.finished_signal.connect(lambda results: log.setdefault('end', ('finished', results)))
+    worker.cancelled_signal.connect(lambda results: log.setdefault('end', ('cancelled', results)))
+    worker.error_signal.connect(lambda message: log.setdefault('end', ('error', message)))
+    worker.run()
+    return log
+
+
+def runs(results):
+    return sum(len(metrics['costs']) for metrics in results.values())
+
+
+def test_run_cut_short_by_cancel_is_not_recorded():
+    G = sentetik_graf_uret('geometric', 120, seed=15)
+    worker = ComparisonWorker(G, CASES, ALGORITHMS, WEIGHTS, repetitions=3, workers=1)
+    solve, calls = worker.solve, []
+
+    def cancelled_during_fourth_run(*job):
+        calls.append(job)
+        if len(calls) == 4:
+            worker.cancel()  # As if the user pressed cancel while this run was in progress
+        return solve(*job)
+
+    worker.solve = cancelled_during_fourth_run
+    log = run_worker(worker, lambda worker, progress: False)
+
+    kind, results = log['end']
+    assert kind == "cancelled"
+    assert log['progress'] == [1, 2, 3] and len(calls) == 4
+    assert results == log['partial'][-1] and runs(results) == 3
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cancel_keeps_only_runs_finished_before_it(workers):
+    G = sentetik_graf_uret('geometric', 120, seed=15)
+    worker = ComparisonWorker(G, CASES, ALGORITHMS, WEIGHTS, repetitions=4, workers=workers)
+
+    log = run_worker(worker, lambda worker, progress: len(progress) == 2)
+
+    kind, results = log['end']
+    assert kind == "cancelled"
+    assert log['progress'] == [1, 2]
+    assert results == log['partial'][-1] and runs(results) == 2
+
+
+def test_uncancelled_comparison_records_every_run():
+    G = sentetik_graf_uret('geometric', 120, seed=15)
+    worker = ComparisonWorker(G, CASES, ALGORITHMS, WEIGHTS, repetitions=2, workers=1)
+
+    log = run_worker(worker, lambda worker, progress: False)
+
+    kind, results = log['end']
+    assert kind == "finished"
+    assert log['progress'][-1] == 8 and runs(results) == 8
+    assert all(gap >= -1e-9 for metrics in results.values() for gap in metrics['gaps'])
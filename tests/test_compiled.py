@@ -0,0 +1,33 @@
+import math
+
+import networkx as nx
+
+from src.core.compiled import CompiledTopology
+
+WEIGHTS = (0.33, 0.33, 0.34)
+
+
+def directed_graph():
+    """0 <-> 1 both ways, 1 -> 2 and 2 -> 0 one way only."""
+    G = nx.DiGraph()
+    for n in range(3):
+        G.add_node(n, processing_delay_ms=1.0, node_reliability=0.99)
+    for u, v in [(0, 1), (1, 0), (1, 2), (2, 0)]:
+        G.add_edge(u, v, bandwidth_mbps=100.0, link_delay_ms=2.0, link_reliability=0.99)
+    return G
+
+
+def test_reverse_arc_on_directed_graph():
+    topo = CompiledTopology.of(directed_graph())
+
+    def arc(u, v):
+        return int(topo.arcs(topo.index_of(u), topo.index_of(v)))
+
+    assert topo.reverse_arc[arc(0, 1)] == arc(1, 0)
+    assert topo.reverse_arc[arc(1, 0)] == arc(0, 1)
+    assert topo.reverse_arc[arc(1, 2)] == -1
+    assert topo.reverse_arc[arc(2, 0)] == -1
+
+    reverse_cost = topo.edge_costs(WEIGHTS).reverse_step_cost_list
+    assert math.isinf(reverse_cost[arc(1, 2)])
+    assert reverse_cost[arc(0, 1)] == topo.edge_costs(WEIGHTS).step_cost[arc(1, 0)]
@@ -0,0 +1,117 @@
+import csv
+import json
+
+import pytest
+
+from src.algorithms.ContractionHierarchy import CHSolver
+from src.algorithms.Dijkstra import DijkstraSolver
+from src.core import Metrics as mt
+from src.core.compiled import CompiledTopology
+from src.experiment.demand_stream import (RESULT_FIELDS, Demand, iter_demand_chunks, iter_demands, route_chunk,
+                                          route_chunks, run_pipeline)
+from src.generation.synthetic_graf import sentetik_graf_uret
+
+WEIGHTS = (0.33, 0.33, 0.34)
+
+
+def write_lines(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_csv_demands_with_header_decimal_comma_and_bad_rows(tmp_path):
+    path = write_lines(tmp_path / "demands.csv", [
+        "demand_mbps;src;dst",
+        "12,5;0;9",
+        "abc;1;2",
+        "40;3",
+        "100;4;5",
+    ])
+    assert list(iter_demands(path)) == [Demand(1, 0, 9, 12.5), Demand(2, 4, 5, 100.0)]
+
+
+def test_headerless_csv_and_jsonl_demands(tmp_path):
+    csv_path = write_lines(tmp_path / "demands.csv", ["0,9,50", "1,2,60"])
+    jsonl_path = write_lines(tmp_path / "demands.jsonl", [
+        '{"src": 0, "dst": 9, "demand_mbps": 50}',
+        "",
+        "[1, 2, 60]",
+        '{"src": 3}',
+    ])
+    expected = [Demand(1, 0, 9, 50.0), Demand(2, 1, 2, 60.0)]
+
+    assert list(iter_demands(csv_path)) == expected
+    assert list(iter_demands(jsonl_path)) == expected
+    with pytest.raises(ValueError):
+        list(iter_demands(str(tmp_path / "demands.parquet")))
+
+
+def test_demand_chunks_keep_order_and_size(tmp_path):
+    path = write_lines(tmp_path / "demands.csv", [f"{i},{i + 1},10" for i in range(7)])
+    chunks = list(iter_demand_chunks(path, chunk_size=3))
+    assert [len(c) for c in chunks] == [3, 3, 1]
+    assert [d.index for c in chunks for d in c] == list(range(1, 8))
+
+
+def sample_demands(G):
+    """Repeated sources and demands (TreeCache path), unknown nodes and a source equal to the target."""
+    pairs = [(0, 50), (0, 80), (0, 50), (12, 99), (12, 3), (7, 7), (0, 5000), (5000, 3), (40, 160), (0, 99)]
+    demands = [0.0, 0.0, 400.0, 150.0, 150.0, 0.0, 0.0, 0.0, 900.0, 0.0]
+    return [Demand(i + 1, S, D, b) for i, ((S, D), b) in enumerate(zip(pairs, demands))]
+
+
+@pytest.mark.parametrize("solver", [DijkstraSolver, CHSolver])
+def test_route_chunk_rows_match_single_solver_runs(solver):
+    G = sentetik_graf_uret('geometric', 200, seed=13)
+    chunk = sample_demands(G)
+
+    rows = route_chunk(CompiledTopology.of(G), chunk, WEIGHTS, solver)
+
+    assert [row[0] for row in rows] == [d.index for d in chunk]
+    for d, row in zip(chunk, rows):
+        result = dict(zip(RESULT_FIELDS, row))
+        assert (result['src'], result['dst'], result['demand_mbps']) == (d.src, d.dst, d.demand_mbps)
+        if not (G.has_node(d.src) and G.has_node(d.dst)):
+            assert result['status'] == "NO_PATH" and result['path'] == ""
+            continue
+        path, cost, _ = DijkstraSolver(G, d.src, d.dst, d.demand_mbps, WEIGHTS).run()
+        if path is None:
+            assert result['status'] == "NO_PATH"
+            continue
+        routed = [int(n) for n in result['path'].split("-")]
+        assert result['status'] == "OK" and result['hops'] == len(routed) - 1
+        assert result['cost'] == pytest.approx(cost, rel=1e-9)
+        assert routed[0] == d.src and routed[-1] == d.dst
+        if len(routed) > 1:
+            assert mt.Min_Bandwidth(G, routed) >= d.demand_mbps
+
+
+def test_pooled_routing_matches_in_process_routing():
+    G = sentetik_graf_uret('geometric', 200, seed=13)
+    chunks = [sample_demands(G)[:5], sample_demands(G)[5:]]
+
+    serial = list(route_chunks(G, chunks, WEIGHTS, workers=1))
+    pooled = list(route_chunks(G, chunks, WEIGHTS, workers=2, max_in_flight=1))
+
+    assert pooled == serial
+
+
+@pytest.mark.parametrize("ext", ["csv", "jsonl"])
+def test_pipeline_writes_one_row_per_demand(tmp_path, ext):
+    G = sentetik_graf_uret('geometric', 200, seed=13)
+    demand_path = write_lines(tmp_path / "demands.csv", ["src,dst,demand_mbps"] + [
+        f"{d.src},{d.dst},{d.demand_mbps}" for d in sample_demands(G)])
+    out_path = str(tmp_path / f"results.{ext}")
+
+    stats = run_pipeline(demand_path, out_path, G, WEIGHTS, chunk_size=4, workers=0)
+
+    with open(out_path, encoding="utf-8") as f:
+        if ext == "csv":
+            reader = csv.reader(f)
+            assert tuple(next(reader)) == RESULT_FIELDS
+            rows = [dict(zip(RESULT_FIELDS, row)) for row in reader]
+        else:
+            rows = [json.loads(line) for line in f]
+    assert [int(row['index']) for row in rows] == list(range(1, 11))
+    assert stats.demands == 10 and stats.routed + stats.no_path == 10
+    assert sum(row['status'] == "NO_PATH" for row in rows) == stats.no_path >= 2
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from src.algorithms.Dijkstra import path_from_tree, shortest_path_tree, INF
+from src.algorithms.DynamicRouting import DynamicRoutingTable
+from src.core.compiled import CompiledTopology
+from src.core.model import NetworkTopology
+from src.generation.synthetic_graf import sentetik_graf_uret
+
+WEIGHTS = (0.33, 0.33, 0.34)
+DEMAND = 50.0
+
+
+def random_change(topology, table, rng):
+    """Removes or updates a link (often one a repaired tree uses) or updates a node."""
+    kind = rng.choice(["remove", "update", "update", "node"])
+    if kind == "node":
+        node = rng.choice(topology.get_nodes())
+        topology.update_node(node.id, processing_delay=node.processing_delay * rng.uniform(0.2, 3.0),
+                             reliability=min(1.0, node.reliability * rng.uniform(0.99, 1.01)))
+        return
+    path = table.path(rng.choice(table.sources), rng.choice(topology.get_nodes()).id)
+    if path and len(path) > 1 and rng.random() < 0.7:
+        k = rng.randrange(len(path) - 1)
+        u, v = path[k], path[k + 1]
+    else:
+        link = rng.choice(topology.get_links())
+        u, v = link.source, link.target
+    if kind == "remove":
+        topology.remove_link(u, v)
+    else:
+        link = topology.get_link(u, v)
+        topology.update_link(u, v, bandwidth=rng.choice([20.0, 60.0, 500.0]),
+                             delay=link.delay * rng.uniform(0.2, 3.0))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_repaired_trees_match_fresh_shortest_path_trees(seed):
+    rng = random.Random(seed)
+    topology = NetworkTopology.from_nx_graph(sentetik_graf_uret('geometric', 200, seed=seed))
+    sources = rng.sample([n.id for n in topology.get_nodes()], 5)
+    table = DynamicRoutingTable(topology, WEIGHTS, demand=DEMAND, sources=sources)
+    compiled = table.topo
+
+    for _ in range(40):
+        random_change(topology, table, rng)
+        assert table.topo is compiled  # Repaired in place, not rebuilt
+
+        fresh = CompiledTopology.from_topology(topology)
+        cost = fresh.edge_costs(WEIGHTS, DEMAND).step_cost
+        for S in sources:
+            dist, pred = shortest_path_tree(fresh, fresh.index_of(S), cost)
+            repaired_dist, _ = table.trees[table.sources.index(S)]
+            assert repaired_dist == pytest.approx(dist, rel=1e-9)
+            for D in rng.sample(fresh.nodes(), 10):
+                target = fresh.index_of(D)
+                path, _ = table.lookup(S, D)
+                if dist[target] == INF:
+                    assert path is None
+                else:
+                    assert path == fresh.to_ids(path_from_tree(fresh, pred, target))
@@ -0,0 +1,60 @@
+import math
+
+import networkx as nx
+import pytest
+
+from src.core import Metrics as mt
+from src.core.compiled import CompiledTopology
+from src.core.edge_costs import EdgeCostCache
+from src.generation.synthetic_graf import sentetik_graf_uret
+
+WEIGHTS = {'delay': 0.33, 'reliability': 0.33, 'bandwidth': 0.34}
+
+
+def test_tables_are_shared_across_weight_spellings():
+    topo = CompiledTopology.of(sentetik_graf_uret('geometric', 100, seed=1))
+    cache = topo.edge_cost_cache
+
+    table = topo.edge_costs(WEIGHTS, 10)
+    assert topo.edge_costs((0.33, 0.33, 0.34), 10.0) is table
+    assert topo.edge_costs(WEIGHTS, 20) is not table
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_table_is_evicted():
+    topo = CompiledTopology.of(sentetik_graf_uret('geometric', 50, seed=1))
+    cache = EdgeCostCache(topo, max_entries=2)
+
+    first = cache.get(WEIGHTS, 0)
+    cache.get(WEIGHTS, 1)
+    assert cache.get(WEIGHTS, 0) is first  # Now the most recently used
+    cache.get(WEIGHTS, 2)
+
+    assert len(cache) == 2
+    assert cache.get(WEIGHTS, 0) is first
+    assert cache.misses == 3
+    cache.get(WEIGHTS, 1)
+    assert cache.misses == 4  # Demand 1 was evicted and is rebuilt
+
+
+def test_path_cost_matches_evaluate_path_and_prunes_demand():
+    G = sentetik_graf_uret('geometric', 100, seed=1)
+    topo = CompiledTopology.of(G)
+    path = max(nx.single_source_shortest_path(G, 0).values(), key=len)
+    bottleneck = mt.Min_Bandwidth(G, path)
+
+    assert topo.edge_costs(WEIGHTS).path_cost(topo, path) == pytest.approx(
+        mt.evaluate_path(G, path, WEIGHTS).total, rel=1e-12)
+    assert topo.edge_costs(WEIGHTS, bottleneck).path_cost(topo, path) < math.inf
+    assert topo.edge_costs(WEIGHTS, bottleneck + 1).path_cost(topo, path) == math.inf
+
+
+def test_invalidate_drops_compiled_topology_and_its_tables():
+    G = sentetik_graf_uret('geometric', 50, seed=1)
+    topo = CompiledTopology.of(G)
+    table = topo.edge_costs(WEIGHTS)
+
+    CompiledTopology.invalidate(G)
+
+    assert CompiledTopology.of(G) is not topo
+    assert CompiledTopology.of(G).edge_costs(WEIGHTS) is not table
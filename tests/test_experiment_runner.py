@@ -0,0 +1,66 @@
+import os
+import threading
+
+import pytest
+
+from src.core.model import NetworkTopology
+from src.experiment import runner
+from src.experiment.runner import ExperimentPool, run_algorithm, run_custom_experiment
+from src.generation.synthetic_graf import sentetik_graf_uret
+
+WEIGHTS = (0.33, 0.33, 0.34)
+CASES = [(0, 90, 0.0), (12, 70, 300.0), (5, 5, 0.0), (33, 110, 800.0)]
+DETERMINISTIC_FIELDS = ("algorithm_name", "success_rate", "avg_cost", "avg_path_len", "status", "avg_gap")
+
+
+def stats_fields(results, algorithms):
+    return [(r.case, [tuple(getattr(stats, f) for f in DETERMINISTIC_FIELDS)
+                      for stats in r.results if stats.algorithm_name in algorithms]) for r in results]
+
+
+def test_pooled_experiment_matches_serial_run():
+    topology = NetworkTopology.from_nx_graph(sentetik_graf_uret('geometric', 120, seed=14))
+    exact = ["Dijkstra Algoritma", "CH Algoritma"]
+    algorithms = exact + ["Genetik Algoritma"]
+
+    serial = run_custom_experiment(topology, CASES, algorithms, WEIGHTS, repetitions=2, workers=1)
+    pooled = run_custom_experiment(topology, CASES, algorithms, WEIGHTS, repetitions=2, workers=2)
+
+    # Exact algorithms give identical statistics; GA only has to run every repetition in the pool
+    assert stats_fields(pooled, exact) == stats_fields(serial, exact)
+    assert [[r.success_rate for r in case.results] for case in pooled] == \
+           [[r.success_rate for r in case.results] for case in serial]
+
+
+def pool_results(G, started_in_thread):
+    """CH jobs through an ExperimentPool, started from the main thread (fork) or a worker thread (spawn)."""
+    out = {}
+
+    def run():
+        with ExperimentPool(G, workers=2) as pool:
+            out['directory'] = pool._directory.name if pool._directory is not None else None
+            futures = [pool.submit(runner._algorithm_job, s, d, b, "CH Algoritma", WEIGHTS, 2) for s, d, b in CASES]
+            out['runs'] = [f.result() for f in futures]
+
+    if started_in_thread:
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+    else:
+        run()
+    return out
+
+
+@pytest.mark.parametrize("started_in_thread", [False, True])
+def test_pool_jobs_match_in_process_runs(started_in_thread):
+    G = sentetik_graf_uret('geometric', 120, seed=14)
+    out = pool_results(G, started_in_thread)
+
+    expected = [run_algorithm(G, s, d, b, "CH Algoritma", WEIGHTS, 2) for s, d, b in CASES]
+    for runs, serial in zip(out['runs'], expected):
+        assert [(res and (res.path_nodes, res.total_cost), demand) for res, demand in runs] == \
+               [(res and (res.path_nodes, res.total_cost), demand) for res, demand in serial]
+    if started_in_thread:  # Topology shared through a memory-mapped directory, removed on close
+        assert out['directory'] is not None and not os.path.exists(out['directory'])
+    else:
+        assert out['directory'] is None
@@ -0,0 +1,54 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.compiled import CompiledTopology
+from src.generation.generate_graf import EDGE_COLUMNS, NODE_COLUMNS, _satir_satir_graf, tablolardan_graf
+from src.generation.synthetic_graf import sentetik_tablolar
+
+
+def tables_with_duplicates(seed=0):
+    """Synthetic tables with shuffled node ids and some edges repeated (both directions) with new values."""
+    t = sentetik_tablolar('geometric', 150, seed=seed)
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(t['node_id']))
+    for c in NODE_COLUMNS:
+        t[c] = t[c][order]
+
+    repeat = rng.choice(len(t['src']), size=40, replace=False)
+    flip = rng.random(40) < 0.5
+    extra = {
+        'src': np.where(flip, t['dst'][repeat], t['src'][repeat]),
+        'dst': np.where(flip, t['src'][repeat], t['dst'][repeat]),
+        'capacity_mbps': rng.uniform(100, 1000, 40),
+        'delay_ms': rng.uniform(3, 15, 40),
+        'r_link': rng.uniform(0.95, 0.999, 40),
+    }
+    for c in EDGE_COLUMNS:
+        t[c] = np.concatenate([t[c], extra[c]])
+    return t
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_bulk_graph_equals_row_by_row_graph(seed):
+    t = tables_with_duplicates(seed)
+    df_nodes = pd.DataFrame({c: t[c] for c in NODE_COLUMNS})
+    df_edges = pd.DataFrame({c: t[c] for c in EDGE_COLUMNS})
+
+    G = tablolardan_graf(t)
+
+    assert nx.utils.graphs_equal(G, _satir_satir_graf(df_nodes, df_edges))
+    assert list(G.nodes) == t['node_id'].tolist()
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_compiled_from_tables_equals_compiled_from_graph(seed):
+    t = tables_with_duplicates(seed)
+
+    direct = CompiledTopology.from_tables(t)
+    via_graph = CompiledTopology.from_nx_graph(tablolardan_graf(t))
+
+    assert direct.fingerprint == via_graph.fingerprint
+    assert np.array_equal(direct.bw_cost, via_graph.bw_cost)
+    assert np.array_equal(direct.reverse_arc, via_graph.reverse_arc)
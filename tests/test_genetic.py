@@ -0,0 +1,56 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.algorithms import GeneticAlgorithm as ga
+from src.algorithms.YenKSP import KShortestPaths
+from src.core import Metrics as mt
+from src.generation.synthetic_graf import sentetik_graf_uret
+
+WEIGHTS = (0.33, 0.33, 0.34)
+
+
+def test_non_dominated_sort_ranks_fronts():
+    objectives = np.array([[1, 5, 1], [2, 2, 2], [3, 3, 3], [5, 1, 1], [4, 4, 4]], dtype=float)
+    assert ga.non_dominated_sort(objectives).tolist() == [0, 0, 1, 0, 2]
+
+
+def test_feasible_paths_dominate_infeasible_ones():
+    objectives = np.array([[9, 9, 9], [1, 1, 1], [2, 2, 2]], dtype=float)
+    violation = np.array([0.0, 0.5, 0.1])
+    assert ga.non_dominated_sort(objectives, violation).tolist() == [0, 2, 1]
+
+
+def test_crowding_distance_keeps_front_ends():
+    objectives = np.array([[0, 4, 0], [1, 3, 0], [3, 1, 0], [4, 0, 0]], dtype=float)
+    distance = ga.crowding_distance(objectives, np.zeros(4, dtype=int))
+    assert np.isinf(distance[[0, 3]]).all()
+    assert distance[1] == pytest.approx(distance[2])
+
+
+@pytest.mark.parametrize("demand", [0.0, 300.0])
+def test_nsga2_returns_valid_mutually_non_dominated_paths(demand):
+    G = sentetik_graf_uret('grid', 36, seed=2)
+    random.seed(0)
+    front = ga.nsga2_genetic_algorithm(G, 0, 35, demand, pop_size=30, generations=20)
+
+    assert len(front) > 0
+    points = front.objectives
+    for point, path in zip(points, front.paths):
+        assert path[0] == 0 and path[-1] == 35 and len(set(path)) == len(path)
+        pm = mt.evaluate_path(G, path, WEIGHTS)
+        assert pm.min_bandwidth >= demand
+        assert tuple(point) == pytest.approx((pm.delay, pm.reliability, pm.bandwidth), abs=1e-4)
+        assert not ((points <= point).all(axis=1) & (points < point).any(axis=1)).any()
+
+
+def test_population_starts_with_seed_paths():
+    G = sentetik_graf_uret('grid', 36, seed=2)
+    seeds = KShortestPaths(G, 0, 35, 0.0, WEIGHTS, k=5).paths()
+    random.seed(0)
+
+    pop = ga.population(G, 0, 35, 20, seed_paths=seeds)
+
+    assert pop[:5] == seeds
+    assert len(pop) == 20 and len({tuple(p) for p in pop}) == 20
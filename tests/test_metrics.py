@@ -0,0 +1,110 @@
+import networkx as nx
+import pytest
+
+from src.core import Metrics as mt
+from src.core.compiled import CompiledTopology
+from src.core.costed_path import CostedPath
+from src.generation.synthetic_graf import sentetik_graf_uret
+
+WEIGHTS = (0.33, 0.33, 0.34)
+PATH_FUNCTIONS = [mt.Total_Delay, mt.Total_Reliability, mt.Total_Bandwidth, mt.Min_Bandwidth,
+                  lambda G, path: mt.evaluate_path(G, path, WEIGHTS)]
+
+
+def missing_edge_path(G):
+    """Three-node path whose second hop is not a link of G."""
+    u, v = next(iter(G.edges))
+    w = next(n for n in G.nodes if n not in (u, v) and not G.has_edge(v, n))
+    return [u, v, w]
+
+
+@pytest.mark.parametrize("metric", PATH_FUNCTIONS)
+def test_compiled_metrics_reject_missing_edge(metric):
+    G = sentetik_graf_uret('geometric', 100, seed=2)
+    path = missing_edge_path(G)
+
+    with pytest.raises(KeyError):
+        metric(G, path)
+    with pytest.raises(ValueError):
+        metric(CompiledTopology.of(G), path)
+
+
+def test_batch_and_costed_paths_reject_missing_edge():
+    G = sentetik_graf_uret('geometric', 100, seed=2)
+    path = missing_edge_path(G)
+    topo = CompiledTopology.of(G)
+
+    with pytest.raises(ValueError):
+        mt.Batch_Path_Costs(topo, *mt.Flatten_Paths([path]))
+    with pytest.raises(ValueError):
+        CostedPath(path, topo)
+
+
+def test_costed_path_total_matches_batch_total():
+    G = sentetik_graf_uret('geometric', 100, seed=2)
+    topo = CompiledTopology.of(G)
+    paths = [nx.shortest_path(G, 0, target) for target in (10, 40, 70)]
+
+    batch = mt.Batch_Path_Costs(topo, *mt.Flatten_Paths(paths), *WEIGHTS)
+    costed = [CostedPath(path, topo).cost(*WEIGHTS) for path in paths]
+    assert costed == pytest.approx(batch.total, rel=1e-12)
+
+
+def sample_paths(G, n=20):
+    nodes = sorted(G.nodes)
+    return [nx.shortest_path(G, nodes[0], target) for target in nodes[1:n + 1] if nx.has_path(G, nodes[0], target)]
+
+
+def test_batch_costs_match_path_metrics():
+    G = sentetik_graf_uret('geometric', 100, seed=2)
+    paths = sample_paths(G) + [[5]]  # Single-node path: zero cost
+    batch = mt.Batch_Path_Costs(G, *mt.Flatten_Paths(paths), *WEIGHTS)
+
+    for i, path in enumerate(paths):
+        assert batch.delay[i] == pytest.approx(mt.Total_Delay(G, path), abs=1e-9)
+        assert batch.reliability[i] == pytest.approx(mt.Total_Reliability(G, path), abs=1e-9)
+        assert batch.bandwidth[i] == pytest.approx(mt.Total_Bandwidth(G, path), abs=1e-9)
+        if len(path) > 1:
+            assert batch.min_bandwidth[i] == mt.Min_Bandwidth(G, path)
+
+
+def test_batch_total_equals_evaluate_path_total():
+    G = sentetik_graf_uret('geometric', 100, seed=2)
+    paths = sample_paths(G)
+    batch = mt.Batch_Path_Costs(G, *mt.Flatten_Paths(paths), *WEIGHTS)
+
+    for graph in (G, CompiledTopology.of(G)):
+        totals = [mt.evaluate_path(graph, path, WEIGHTS).total for path in paths]
+        assert totals == pytest.approx(batch.total, rel=1e-12)
+
+
+def test_spliced_path_costs_match_full_costing():
+    G = sentetik_graf_uret('geometric', 300, seed=2)
+    topo = CompiledTopology.of(G)
+    path = max(nx.single_source_shortest_path(G, 0).values(), key=len)
+    costed = CostedPath(path, topo)
+
+    for i in range(len(path) - 2):
+        for j in range(i + 1, len(path)):
+            middle = nx.shortest_path(G, path[i], path[j], weight='link_delay_ms')[1:-1]
+            spliced = costed.splice(i, j, middle)
+            fresh = CostedPath(list(spliced), topo)
+            assert spliced.cost(*WEIGHTS) == pytest.approx(fresh.cost(*WEIGHTS), rel=1e-12)
+            assert spliced.min_bandwidth == fresh.min_bandwidth
+            assert costed.rebase(list(spliced)).cost(*WEIGHTS) == pytest.approx(fresh.cost(*WEIGHTS), rel=1e-12)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_evaluate_path_matches_separate_metric_functions(compiled):
+    G = sentetik_graf_uret('geometric', 100, seed=2)
+    graph = CompiledTopology.of(G) if compiled else G
+
+    for path in sample_paths(G):
+        pm = mt.evaluate_path(graph, path, dict(zip(('delay', 'reliability', 'bandwidth'), WEIGHTS)))
+        assert pm.delay == pytest.approx(mt.Total_Delay(G, path), abs=1e-9)
+        assert pm.reliability == pytest.approx(mt.Total_Reliability(G, path), abs=1e-9)
+        assert pm.bandwidth == pytest.approx(mt.Total_Bandwidth(G, path), abs=1e-9)
+        assert pm.min_bandwidth == mt.Min_Bandwidth(G, path)
+        assert pm.hops == len(path) - 1
+        rounded_total = WEIGHTS[0] * pm.delay + WEIGHTS[1] * pm.reliability + WEIGHTS[2] * pm.bandwidth
+        assert pm.total == pytest.approx(rounded_total, abs=1e-4)
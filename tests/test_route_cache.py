@@ -0,0 +1,36 @@
+import pytest
+
+from src.core.route_cache import RouteCache
+
+WEIGHTS = (0.33, 0.33, 0.34)
+
+
+def recorded_demands(cache, algorithm, demand, seed=None, version=0):
+    seen = []
+    cache.get_or_compute(algorithm, 1, 2, demand, WEIGHTS, version,
+                         lambda dm: seen.append(dm) or [1, 2], seed)
+    return seen
+
+
+@pytest.mark.parametrize("algorithm, seed", [("Dijkstra Algoritma", None),
+                                             ("ACO Algoritma", 7),
+                                             ("ACO Algoritma", None)])
+def test_default_cache_computes_with_requested_demand(algorithm, seed):
+    assert recorded_demands(RouteCache(), algorithm, 0.1, seed) == [0.1]
+    assert recorded_demands(RouteCache(demand_step=0), algorithm, 0.1, seed) == [0.1]
+
+
+def test_demand_buckets_round_up_and_share_entries():
+    cache = RouteCache(demand_step=10.0)
+
+    assert recorded_demands(cache, "Dijkstra Algoritma", 12.0) == [20.0]
+    assert recorded_demands(cache, "Dijkstra Algoritma", 18.0) == []  # Same bucket: cache hit
+    assert recorded_demands(cache, "Dijkstra Algoritma", 21.0) == [30.0]
+
+
+def test_entries_do_not_match_a_new_topology_version():
+    cache = RouteCache()
+
+    assert recorded_demands(cache, "Dijkstra Algoritma", 5.0, version=0) == [5.0]
+    assert recorded_demands(cache, "Dijkstra Algoritma", 5.0, version=0) == []
+    assert recorded_demands(cache, "Dijkstra Algoritma", 5.0, version=1) == [5.0]
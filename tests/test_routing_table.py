@@ -0,0 +1,53 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.algorithms.Dijkstra import DijkstraSolver
+from src.algorithms.RoutingTable import RoutingTable
+from src.generation.synthetic_graf import sentetik_graf_uret
+
+WEIGHTS = (0.33, 0.33, 0.34)
+
+
+@pytest.mark.parametrize("demand", [0.0, 400.0])
+def test_lookup_matches_single_source_dijkstra(demand):
+    G = sentetik_graf_uret('geometric', 120, seed=8)
+    sources = [0, 17, 64]
+    table = RoutingTable.build(G, WEIGHTS, demand, sources=sources, workers=1)
+
+    for S in sources:
+        for D in G.nodes:
+            path, cost = table.lookup(S, D)
+            expected_path, expected_cost, _ = DijkstraSolver(G, S, D, demand, WEIGHTS).run()
+            if S == D:
+                assert (path, cost) == ([S], 0.0)
+            elif expected_path is None:
+                assert (path, cost) == (None, math.inf)
+            else:
+                assert path == expected_path
+                assert cost == pytest.approx(expected_cost, rel=1e-9)
+
+
+def test_pool_build_matches_serial_build():
+    G = sentetik_graf_uret('geometric', 80, seed=8)
+    serial = RoutingTable.build(G, WEIGHTS, 100.0, workers=1)
+    pooled = RoutingTable.build(G, WEIGHTS, 100.0, workers=2)
+
+    assert np.array_equal(serial.pred, pooled.pred)
+    assert np.array_equal(serial.cost, pooled.cost)
+
+
+def test_saved_table_loads_memory_mapped(tmp_path):
+    G = sentetik_graf_uret('geometric', 60, seed=8)
+    table = RoutingTable.build(G, WEIGHTS, 100.0, sources=[0, 5], workers=1)
+    table.save(tmp_path)
+
+    loaded = RoutingTable.load(tmp_path)
+
+    assert isinstance(loaded.cost, np.memmap)
+    assert loaded.matches({'delay': 0.33, 'reliability': 0.33, 'bandwidth': 0.34}, 100)
+    assert not loaded.matches(WEIGHTS, 0.0)
+    assert all(loaded.lookup(S, D) == table.lookup(S, D) for S in (0, 5) for D in G.nodes)
+    with pytest.raises(KeyError):
+        loaded.lookup(1, 5)  # Not a source row
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from src.core.compiled import CompiledTopology
+from src.generation.synthetic_graf import sentetik_tablolar
+from src.service import RouteClient, RouteService
+
+
+def multi_hop_pairs(client, nodes, n):
+    """(source, target) pairs whose optimal route has 4 to 8 nodes, found with Dijkstra queries."""
+    async def find():
+        pairs = []
+        for target in nodes[1:]:
+            result = await client.route(nodes[0], target)
+            if result['status'] == "OK" and 4 <= len(result['path']) <= 8:
+                pairs.append((nodes[0], target))
+                if len(pairs) == n:
+                    return pairs
+        raise AssertionError("not enough multi-hop routes in the test graph")
+    return find()
+
+
+# One-iteration runs without a budget: the worker imports the solver before the timed queries
+WARM_UP = {'aco': {'max_iter': 1}, 'ga': {'generations': 1}}
+
+
+@pytest.mark.parametrize("algorithm", ["aco", "ga"])
+@pytest.mark.parametrize("budget_ms", [100, 300])
+def test_budgeted_query_returns_best_path_so_far(algorithm, budget_ms):
+    topo = CompiledTopology.from_tables(sentetik_tablolar('geometric', 300, seed=5))
+
+    async def scenario():
+        service = RouteService(topo, workers=1, seed=1)
+        host, port = await service.start("127.0.0.1", 0)
+        client = RouteClient(host, port)
+        try:
+            pairs = await multi_hop_pairs(client, sorted(topo.nodes()), 3)
+            await client.route(*pairs[0], algorithm=algorithm, params=WARM_UP[algorithm])
+            return [await client.route(s, d, algorithm=algorithm, budget_ms=budget_ms) for s, d in pairs]
+        finally:
+            await client.close()
+            await service.close()
+
+    for result in asyncio.run(scenario()):
+        assert result['status'] == "OK", result
+        assert result['path'][0] == result['src'] and result['path'][-1] == result['dst']
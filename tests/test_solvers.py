@@ -0,0 +1,240 @@
+import math
+import random
+from itertools import islice
+
+import networkx as nx
+import pytest
+
+from src.algorithms.ALT import ALTSolver, LandmarkIndex
+from src.algorithms.ContractionHierarchy import CHSolver, ContractionHierarchy
+from src.algorithms.Dijkstra import DijkstraSolver, shortest_path_tree
+from src.algorithms.LARAC import LARACSolver
+from src.algorithms.Pareto import ParetoLabelSetting
+from src.algorithms.YenKSP import KShortestPaths
+from src.core import Metrics as mt
+from src.core.compiled import CompiledTopology
+from src.generation.synthetic_graf import sentetik_graf_uret
+
+WEIGHTS = (0.33, 0.33, 0.34)
+
+SOLVERS = {
+    "dijkstra": lambda G, S, D: DijkstraSolver(G, S, D, 0.0, WEIGHTS),
+    "alt": lambda G, S, D: ALTSolver(G, S, D, 0.0, WEIGHTS, num_landmarks=4),
+    "ch": lambda G, S, D: CHSolver(G, S, D, 0.0, WEIGHTS),
+    "larac": lambda G, S, D: LARACSolver(G, S, D, 0.0, WEIGHTS, max_delay=1e9),
+}
+
+
+def step_weight(G, demand):
+    """networkx weight function with the solvers' arc cost; links below the demand are hidden."""
+    w_delay, w_rel, w_band = WEIGHTS
+
+    def weight(u, v, edge):
+        if edge['bandwidth_mbps'] < demand:
+            return None
+        node = G.nodes[v]
+        return (w_delay * (edge['link_delay_ms'] + node['processing_delay_ms'])
+                + w_rel * (-math.log(edge['link_reliability']) - math.log(node['node_reliability']))
+                + w_band * 1000 / edge['bandwidth_mbps'])
+    return weight
+
+
+def nx_optimum(G, S, D, demand=0.0):
+    """Weighted total cost of the networkx shortest path, or inf when there is none."""
+    try:
+        path = nx.dijkstra_path(G, S, D, weight=step_weight(G, demand))
+    except nx.NetworkXNoPath:
+        return math.inf
+    return mt.evaluate_path(G, path, WEIGHTS).total
+
+
+def query_pairs(G, n=15, seed=0):
+    nodes = sorted(G.nodes)
+    rng = random.Random(seed)
+    return [tuple(rng.sample(nodes, 2)) for _ in range(n)]
+
+
+def simple_routes(G, S, D):
+    """PathMetrics of every simple S-D path (brute force; small graphs only)."""
+    return [(path, mt.evaluate_path(G, path, WEIGHTS)) for path in nx.all_simple_paths(G, S, D)]
+
+
+def grid_pairs(seed):
+    """A 4 x 5 grid and a few source/target pairs at least three hops apart."""
+    G = sentetik_graf_uret('grid', 20, seed=seed)
+    pairs = [(S, D) for S, D in dict.fromkeys(query_pairs(G, n=10, seed=seed))
+             if nx.shortest_path_length(G, S, D) >= 3]
+    return G, pairs[:4]
+
+
+def graph_with_gap():
+    """Small graph whose node ids have a hole (a removed node) below the largest id."""
+    G = sentetik_graf_uret('geometric', 60, seed=4)
+    G.remove_node(30)
+    return G
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+@pytest.mark.parametrize("unknown", [30, 1000])
+def test_unknown_source_or_target_raises(solver, unknown):
+    topo = CompiledTopology.of(graph_with_gap())
+    known = topo.nodes()[0]
+
+    with pytest.raises(KeyError):
+        SOLVERS[solver](topo, unknown, known).run()
+    with pytest.raises(KeyError):
+        SOLVERS[solver](topo, known, unknown).run()
+
+
+@pytest.mark.parametrize("demand", [0.0, 400.0])
+def test_dijkstra_matches_networkx(demand):
+    G = sentetik_graf_uret('geometric', 150, seed=6)
+    for S, D in query_pairs(G):
+        path, cost, metrics = DijkstraSolver(G, S, D, demand, WEIGHTS).run()
+        expected = nx_optimum(G, S, D, demand)
+        if expected == math.inf:
+            assert path is None and cost == math.inf
+            continue
+        assert cost == pytest.approx(expected, rel=1e-9)
+        assert path[0] == S and path[-1] == D
+        assert mt.Min_Bandwidth(G, path) >= demand
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_larac_respects_delay_bound_and_brackets_optimum(seed):
+    G, pairs = grid_pairs(seed)
+    for S, D in pairs:
+        routes = simple_routes(G, S, D)
+        fastest = min(pm.delay for _, pm in routes)
+        cheapest = min(routes, key=lambda r: r[1].total)[1]
+
+        bounds = [fastest - 1.0, cheapest.delay + 1.0]
+        if cheapest.delay - fastest > 1e-3:  # Cheapest route too slow: the bound binds
+            bounds.insert(1, (fastest + cheapest.delay) / 2)
+        for bound in bounds:
+            solver = LARACSolver(G, S, D, 0.0, WEIGHTS, max_delay=bound)
+            path, cost, _ = solver.run()
+            feasible = [pm.total for _, pm in routes if pm.delay <= bound]
+            if not feasible:
+                assert path is None and solver.status == "INFEASIBLE"
+                continue
+            best = min(feasible)
+            assert mt.Total_Delay(G, path) <= bound + 1e-9
+            assert solver.lower_bound <= best + 1e-9 <= cost + 2e-9
+            if solver.status == "OPTIMAL":
+                assert cost == pytest.approx(best, rel=1e-9)
+        assert solver.status == "OPTIMAL" and cost == pytest.approx(cheapest.total, rel=1e-9)
+
+
+def dominates(a, b, tol=2e-4):
+    """a dominates b; tol absorbs the 4-decimal rounding of PathMetrics."""
+    return all(x <= y + tol for x, y in zip(a, b)) and any(x < y - tol for x, y in zip(a, b))
+
+
+@pytest.mark.parametrize("demand", [0.0, 300.0])
+def test_pareto_front_equals_brute_force_front(demand):
+    G, pairs = grid_pairs(3)
+    for S, D in pairs:
+        points = [(pm.delay, pm.reliability, pm.bandwidth) for _, pm in simple_routes(G, S, D)
+                  if pm.min_bandwidth >= demand]
+        expected = [p for p in points if not any(dominates(q, p) for q in points)]
+
+        front = ParetoLabelSetting(G, S, D, demand).run()
+        assert len(front) == len(expected)
+        for objectives, path in zip(front.objectives, front.paths):
+            pm = mt.evaluate_path(G, path, WEIGHTS)
+            assert tuple(objectives) == pytest.approx((pm.delay, pm.reliability, pm.bandwidth), abs=1e-4)
+            assert any(tuple(objectives) == pytest.approx(p, abs=1e-4) for p in expected)
+
+
+def test_pareto_best_matches_dijkstra_for_any_weights():
+    G = sentetik_graf_uret('geometric', 80, seed=5)
+    for S, D in query_pairs(G, n=5):
+        front = ParetoLabelSetting(G, S, D).run()
+        for weights in [(0.33, 0.33, 0.34), (0.8, 0.1, 0.1), (0.1, 0.1, 0.8), (0.1, 0.8, 0.1)]:
+            _, cost, _ = front.best(weights)
+            assert cost == pytest.approx(DijkstraSolver(G, S, D, 0.0, weights).run()[1], rel=1e-9)
+
+
+@pytest.mark.parametrize("demand", [0.0, 300.0])
+def test_yen_costs_match_networkx_simple_paths(demand):
+    G = sentetik_graf_uret('geometric', 80, seed=7)
+    for S, D in query_pairs(G, n=5, seed=1):
+        routes = KShortestPaths(G, S, D, demand, WEIGHTS, k=6).run()
+        try:
+            expected = [mt.evaluate_path(G, path, WEIGHTS).total for path in
+                        islice(nx.shortest_simple_paths(G, S, D, weight=step_weight(G, demand)), 6)]
+        except nx.NetworkXNoPath:
+            expected = []
+
+        assert [cost for _, cost, _ in routes] == pytest.approx(expected, rel=1e-9)
+        assert len({tuple(path) for path, _, _ in routes}) == len(routes)
+        for path, _, _ in routes:
+            assert path[0] == S and path[-1] == D and len(set(path)) == len(path)
+            assert mt.Min_Bandwidth(G, path) >= demand
+
+
+def assert_same_optimum(G, solver, demand):
+    for S, D in query_pairs(G, n=25, seed=2):
+        path, cost, _ = solver(G, S, D).run()
+        expected_path, expected_cost, _ = DijkstraSolver(G, S, D, demand, WEIGHTS).run()
+        if expected_path is None:
+            assert path is None and cost == math.inf
+        else:
+            assert cost == pytest.approx(expected_cost, rel=1e-9)
+            assert path[0] == S and path[-1] == D and mt.Min_Bandwidth(G, path) >= demand
+
+
+@pytest.mark.parametrize("bidirectional", [False, True])
+@pytest.mark.parametrize("demand", [0.0, 400.0])
+def test_alt_matches_dijkstra(bidirectional, demand):
+    G = sentetik_graf_uret('geometric', 200, seed=9)
+    assert_same_optimum(G, lambda G, S, D: ALTSolver(G, S, D, demand, WEIGHTS, num_landmarks=4,
+                                                     bidirectional=bidirectional), demand)
+
+
+def test_landmark_bounds_are_admissible():
+    topo = CompiledTopology.of(sentetik_graf_uret('geometric', 150, seed=9))
+    index = LandmarkIndex.of(topo, WEIGHTS, 0.0, k=4)
+    cost = topo.edge_costs(WEIGHTS).step_cost_list
+    for target in (3, 70, 140):
+        bounds = index.lower_bounds_to(target)
+        for v in (0, 50, 100):
+            assert bounds[v] <= shortest_path_tree(topo, v, cost)[0][target] + 1e-9
+
+
+def test_saved_landmarks_are_rejected_for_another_topology(tmp_path):
+    path = str(tmp_path / "landmarks.npz")
+    G = sentetik_graf_uret('geometric', 100, seed=9)
+    ALTSolver(G, 0, 50, 0.0, WEIGHTS, num_landmarks=4, landmark_path=path).run()
+
+    assert LandmarkIndex.load(path, G).matches(WEIGHTS, CompiledTopology.of(G).demand_class(0.0))
+    assert LandmarkIndex.load(path, sentetik_graf_uret('geometric', 100, seed=10)) is None
+
+
+@pytest.mark.parametrize("model, n", [('geometric', 200), ('grid', 225), ('ba', 150)])
+@pytest.mark.parametrize("demand", [0.0, 400.0])
+def test_ch_matches_dijkstra(model, n, demand):
+    G = sentetik_graf_uret(model, n, seed=11)
+    assert_same_optimum(G, lambda G, S, D: CHSolver(G, S, D, demand, WEIGHTS), demand)
+
+
+def test_ch_index_is_shared_within_a_demand_class():
+    topo = CompiledTopology.of(sentetik_graf_uret('grid', 100, seed=11))
+    levels = sorted(set(topo.bandwidth.tolist()))
+    low, high = levels[10], levels[11]
+
+    ch = ContractionHierarchy.of(topo, WEIGHTS, low - 0.5 * (low - levels[9]))
+    assert ContractionHierarchy.of(topo, WEIGHTS, low) is ch
+    assert ContractionHierarchy.of(topo, WEIGHTS, (low + high) / 2) is not ch
+    assert ch.num_shortcuts > 0
+
+
+def test_ch_demand_step_keeps_routes_feasible():
+    G = sentetik_graf_uret('geometric', 200, seed=11)
+    for S, D in query_pairs(G, n=10, seed=3):
+        path, cost, _ = CHSolver(G, S, D, 333.0, WEIGHTS, demand_step=100).run()
+        exact = DijkstraSolver(G, S, D, 333.0, WEIGHTS).run()[1]
+        if path is not None:
+            assert mt.Min_Bandwidth(G, path) >= 333.0
+            assert cost >= exact - 1e-9
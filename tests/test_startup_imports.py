@@ -0,0 +1,37 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from src.experiment.startup_benchmark import ROOT, WINDOW_IMPORTS
+
+HEAVY = {"numpy", "networkx", "pandas", "PyQt6"}
+
+
+def loaded_modules(code):
+    """Top-level modules present in sys.modules after running code in a fresh interpreter."""
+    script = code + "\nimport json, sys\nprint(json.dumps(sorted({m.split('.')[0] for m in sys.modules})))"
+    proc = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+
+@pytest.mark.parametrize("module", WINDOW_IMPORTS)
+def test_window_imports_load_no_heavy_module(module):
+    assert not HEAVY & loaded_modules(f"import {module}")
+
+
+def test_headless_route_from_cached_tables_skips_networkx_and_pandas(tmp_path):
+    cache = str(tmp_path / "graf_tablolari.npz")
+    setup = f"from src.generation import generate_graf\ngenerate_graf.graf_tablolari({cache!r})"
+    subprocess.run([sys.executable, "-c", setup], cwd=ROOT, check=True)  # Builds the cache (reads Excel)
+
+    loaded = loaded_modules(
+        "from src.generation import generate_graf\n"
+        "from src.algorithms.Dijkstra import DijkstraSolver\n"
+        f"topo = generate_graf.derlenmis_graf_uret({cache!r})\n"
+        "nodes = topo.nodes()\n"
+        "assert DijkstraSolver(topo, nodes[0], nodes[-1], 0.0, (0.33, 0.33, 0.34)).run()[0]\n")
+
+    assert "numpy" in loaded
+    assert not {"networkx", "pandas", "PyQt6"} & loaded
@@ -0,0 +1,57 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.generation.synthetic_graf import (MODELLER, QoSDagilimi, geometrik_kenarlar, sentetik_graf_uret,
+                                           sentetik_tablolar)
+
+NODE_ATTRIBUTES = {'processing_delay_ms', 'node_reliability'}
+EDGE_ATTRIBUTES = {'bandwidth_mbps', 'link_delay_ms', 'link_reliability'}
+
+
+@pytest.mark.parametrize("model", MODELLER)
+def test_same_seed_gives_same_topology(model):
+    a = sentetik_tablolar(model, 400, seed=3)
+    b = sentetik_tablolar(model, 400, seed=3)
+    c = sentetik_tablolar(model, 400, seed=4)
+
+    assert all(np.array_equal(a[k], b[k]) for k in a)
+    assert not all(np.array_equal(a[k], c[k]) for k in a if len(a[k]) == len(c[k]))
+
+
+@pytest.mark.parametrize("model", MODELLER)
+def test_graph_has_generate_graf_attributes_in_excel_ranges(model):
+    G = sentetik_graf_uret(model, 400, seed=3)
+    qos = QoSDagilimi()
+
+    assert 0 < G.number_of_nodes() <= 400
+    assert G.number_of_edges() > G.number_of_nodes() / 2
+    assert not any(u == v for u, v in G.edges)
+    for _, data in G.nodes(data=True):
+        assert set(data) == NODE_ATTRIBUTES
+        assert qos.s_ms[0] <= data['processing_delay_ms'] <= qos.s_ms[1]
+    for _, _, data in G.edges(data=True):
+        assert set(data) == EDGE_ATTRIBUTES
+        assert qos.capacity_mbps[0] <= data['bandwidth_mbps'] <= qos.capacity_mbps[1]
+
+
+def test_geometric_edges_match_brute_force_distances():
+    n, degree = 500, 8.0
+    _, src, dst = geometrik_kenarlar(n, np.random.default_rng(5), ortalama_derece=degree)
+    pos = np.random.default_rng(5).random((n, 2))  # The generator draws the positions first
+    r = math.sqrt(degree / (math.pi * n))
+
+    close = ((pos[:, None, :] - pos[None, :, :]) ** 2).sum(axis=2) <= r * r
+    expected = {(i, j) for i, j in zip(*np.nonzero(np.triu(close, k=1)))}
+    assert {(min(u, v), max(u, v)) for u, v in zip(src.tolist(), dst.tolist())} == expected
+    assert len(expected) == len(src)
+
+
+def test_custom_distribution_and_unknown_model():
+    qos = QoSDagilimi(capacity_mbps=lambda rng, size: np.full(size, 42.0))
+    G = sentetik_graf_uret('grid', 16, seed=1, qos=qos)
+    assert {d['bandwidth_mbps'] for _, _, d in G.edges(data=True)} == {42.0}
+
+    with pytest.raises(ValueError):
+        sentetik_tablolar('hypercube', 16)
@@ -0,0 +1,59 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from src.generation import generate_graf as gg
+
+
+@pytest.fixture
+def data_copy(tmp_path, monkeypatch):
+    """Excel files copied to a temporary directory; counts how often they are parsed."""
+    for name in ("NodeData.xlsx", "EdgeData.xlsx"):
+        shutil.copy(os.path.join(gg.DATA_DIR, name), tmp_path / name)
+    monkeypatch.setattr(gg, "NODE_DATA_PATH", str(tmp_path / "NodeData.xlsx"))
+    monkeypatch.setattr(gg, "EDGE_DATA_PATH", str(tmp_path / "EdgeData.xlsx"))
+
+    reads = []
+    excel_tablolari = gg.excel_tablolari
+    monkeypatch.setattr(gg, "excel_tablolari", lambda: reads.append(1) or excel_tablolari())
+    return tmp_path, reads
+
+
+def same_tables(a, b):
+    return a.keys() == b.keys() and all(np.array_equal(a[k], b[k]) for k in a)
+
+
+def test_cache_is_reused_until_excel_changes(data_copy):
+    tmp_path, reads = data_copy
+    cache = str(tmp_path / "cache" / "tables.npz")
+
+    first = gg.graf_tablolari(cache)
+    assert same_tables(gg.graf_tablolari(cache), first)
+    assert len(reads) == 1
+
+    st = os.stat(gg.EDGE_DATA_PATH)
+    os.utime(gg.EDGE_DATA_PATH, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert same_tables(gg.graf_tablolari(cache), first)
+    assert len(reads) == 2
+    gg.graf_tablolari(cache)
+    assert len(reads) == 2
+
+
+def test_corrupt_cache_falls_back_to_excel(data_copy):
+    tmp_path, reads = data_copy
+    cache = tmp_path / "tables.npz"
+    cache.write_bytes(b"not an npz file")
+
+    tables = gg.graf_tablolari(str(cache))
+
+    assert len(reads) == 1
+    assert same_tables(gg.graf_tablolari(str(cache)), tables) and len(reads) == 1
+
+
+def test_disabled_cache_always_reads_excel(data_copy):
+    _, reads = data_copy
+    gg.graf_tablolari(None)
+    gg.graf_tablolari(None)
+    assert len(reads) == 2
@@ -0,0 +1,74 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from src.algorithms.Dijkstra import DijkstraSolver
+from src.core.compiled import ARRAY_ATTRIBUTES, CompiledTopology
+from src.core.model import NetworkTopology
+from src.core.topology_store import FORMAT, FORMAT_VERSION, MappedTopology, save_topology
+from src.generation.synthetic_graf import sentetik_graf_uret
+
+WEIGHTS = (0.33, 0.33, 0.34)
+
+
+@pytest.fixture
+def saved(tmp_path):
+    G = sentetik_graf_uret('geometric', 200, seed=12)
+    G.remove_node(7)  # Ids with a hole, so _lookup is not the identity
+    save_topology(G, tmp_path)
+    return G, MappedTopology(tmp_path)
+
+
+def test_compiled_arrays_round_trip_as_memmaps(saved):
+    G, mapped = saved
+    original = CompiledTopology.of(G)
+    topo = mapped.compiled()
+
+    assert (mapped.meta['format'], mapped.meta['version']) == (FORMAT, FORMAT_VERSION)
+    assert topo.fingerprint == original.fingerprint
+    for name in ARRAY_ATTRIBUTES:
+        assert isinstance(getattr(topo, name), np.memmap), name
+        assert np.array_equal(getattr(topo, name), getattr(original, name)), name
+    assert CompiledTopology.of(mapped) is topo
+
+
+def test_node_and_link_views_match_the_graph(saved):
+    G, mapped = saved
+    assert (mapped.number_of_nodes(), mapped.number_of_edges()) == (G.number_of_nodes(), G.number_of_edges())
+    assert mapped.get_node(7) is None and mapped.get_link(0, 7) is None
+
+    for u, v, data in list(G.edges(data=True))[:50]:
+        link = mapped.get_link(v, u)
+        assert (link.source, link.target) == (v, u)
+        assert link.bandwidth == data['bandwidth_mbps'] and link.delay == data['link_delay_ms']
+        assert link.reliability == pytest.approx(data['link_reliability'], rel=1e-12)
+    node = mapped.get_node(5)
+    assert node.processing_delay == G.nodes[5]['processing_delay_ms']
+    assert {(l.source, l.target) for l in mapped.get_links()} == {tuple(sorted(e)) for e in G.edges}
+
+
+def test_solvers_give_the_same_routes_on_the_opened_topology(tmp_path):
+    G = sentetik_graf_uret('geometric', 200, seed=12)
+    NetworkTopology.from_nx_graph(G).save(tmp_path)
+    mapped = NetworkTopology.open(tmp_path)
+
+    for S, D in [(0, 150), (3, 199), (42, 117)]:
+        for demand in (0.0, 400.0):
+            path, cost, _ = DijkstraSolver(mapped, S, D, demand, WEIGHTS).run()
+            expected_path, expected_cost, _ = DijkstraSolver(G, S, D, demand, WEIGHTS).run()
+            assert path == expected_path
+            assert cost == pytest.approx(expected_cost, rel=1e-12)
+
+
+def test_unknown_format_version_is_rejected(saved, tmp_path):
+    meta_path = os.path.join(tmp_path, "meta.json")
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    meta['version'] = FORMAT_VERSION + 1
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+    with pytest.raises(ValueError):
+        MappedTopology(tmp_path)
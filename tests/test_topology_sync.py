@@ -0,0 +1,60 @@
+from src.algorithms.Dijkstra import DijkstraSolver
+from src.core.compiled import CompiledTopology
+from src.core.model import NetworkTopology
+from src.core.route_cache import RouteCache
+from src.generation.synthetic_graf import sentetik_graf_uret
+
+WEIGHTS = (0.33, 0.33, 0.34)
+
+
+def uses_link(path, u, v):
+    return any({a, b} == {u, v} for a, b in zip(path, path[1:]))
+
+
+def setup_window_state():
+    """The MainWindow wiring: raw graph G, its NetworkTopology mirror and a route cache."""
+    G = sentetik_graf_uret('geometric', 300, seed=3)
+    topology = NetworkTopology.from_nx_graph(G)
+    topology.mirror_to(G)
+    cache = RouteCache()
+    topology.add_listener(cache.on_topology_change)
+    return G, topology, cache
+
+
+def cached_route(G, topology, cache, S, D):
+    return cache.get_or_compute("Dijkstra Algoritma", S, D, 0.0, WEIGHTS, topology.version,
+                                lambda dm: DijkstraSolver(G, S, D, dm, WEIGHTS).run()[0])
+
+
+def long_route(G, topology, cache):
+    nodes = sorted(G.nodes)
+    for D in reversed(nodes):
+        path = cached_route(G, topology, cache, nodes[0], D)
+        if path and len(path) >= 4:
+            return path
+    raise AssertionError("no multi-hop route in the test graph")
+
+
+def test_removed_link_is_avoided_after_recompute():
+    G, topology, cache = setup_window_state()
+    CompiledTopology.of(G)  # Compiled copy exists before the change, as in the window
+    path = long_route(G, topology, cache)
+    u, v = path[1], path[2]
+
+    topology.remove_link(u, v)
+
+    assert not G.has_edge(u, v)
+    new_path = cached_route(G, topology, cache, path[0], path[-1])
+    assert new_path and not uses_link(new_path, u, v)
+
+
+def test_link_update_reaches_algorithm_graph():
+    G, topology, cache = setup_window_state()
+    path = long_route(G, topology, cache)
+    u, v = path[1], path[2]
+
+    topology.update_link(u, v, delay=1e6)
+
+    assert G.edges[u, v]['link_delay_ms'] == 1e6
+    new_path = cached_route(G, topology, cache, path[0], path[-1])
+    assert new_path and not uses_link(new_path, u, v)